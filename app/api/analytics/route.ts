@@ -1,39 +1,61 @@
 import { NextRequest, NextResponse } from 'next/server'
+import { appendEvents, queryRollups } from '@/lib/analytics-store'
+import { StorageError } from '@/lib/data-dir'
+import { PayloadTooLargeError, payloadTooLarge, rateLimit, readJsonBody } from '@/lib/rate-limit'
+
+// A full client batch is 20 events of well under 1 KB each
+const MAX_BODY_BYTES = 64 * 1024
+// Clients flush at most every few seconds, plus a beacon on page hide
+const RATE_LIMIT = { route: 'analytics', capacity: 30, refillPerSecond: 0.5 }
 
 export async function POST(request: NextRequest) {
+  const limited = rateLimit(request, RATE_LIMIT)
+  if (limited) return limited
+
   try {
-    const body = await request.json()
-    const { name, value, id, delta, rating } = body
-
-    // Log analytics data
-    console.log('Analytics Event:', {
-      name, // Metric name (CLS, FID, FCP, LCP, TTFB)
-      value, // Metric value
-      id, // Unique identifier
-      delta, // Delta from previous value
-      rating, // Rating (good, needs-improvement, poor)
-      timestamp: new Date().toISOString(),
-      userAgent: request.headers.get('user-agent'),
-      referer: request.headers.get('referer'),
-      url: request.headers.get('x-url') || 'unknown'
-    })
+    const body = await readJsonBody(request, MAX_BODY_BYTES)
+    // Clients batch events into an array; single objects (e.g. a web-vitals
+    // beacon) are still accepted
+    const batch: unknown[] = Array.isArray(body) ? body : [body]
+    const receivedAt = new Date().toISOString()
+    const userAgent = request.headers.get('user-agent')
+    const referer = request.headers.get('referer')
 
-    // Here you would typically send this data to your analytics service
-    // For example: Google Analytics, Vercel Analytics, or a custom solution
-    
-    // For now, we'll just log it and return success
-    // In production, you might want to:
-    // 1. Send to Google Analytics 4
-    // 2. Store in a database
-    // 3. Send to a monitoring service like Sentry
-    // 4. Use Vercel Analytics
+    const events = batch
+      .filter((event): event is Record<string, any> => !!event && typeof event === 'object')
+      .map(event => ({
+        // pageview/event payloads from useAnalytics, or web-vitals metrics
+        // ({ name, value, id, delta, rating })
+        ...event,
+        timestamp: event.timestamp || receivedAt,
+        userAgent,
+        referer,
+        url: event.url || request.headers.get('x-url') || referer || 'unknown'
+      }))
+
+    // Append to the local event store; rollups are built by compaction
+    await appendEvents(events)
 
     return NextResponse.json(
-      { message: 'Analytics data received' },
+      { message: 'Analytics data received', count: events.length },
       { status: 200 }
     )
   } catch (error) {
+    if (error instanceof PayloadTooLargeError) return payloadTooLarge(error)
+    if (error instanceof SyntaxError) {
+      return NextResponse.json(
+        { error: 'Invalid JSON body' },
+        { status: 400 }
+      )
+    }
     console.error('Analytics API error:', error)
+    // The event store directory is unusable until the deployment is reconfigured
+    if (error instanceof StorageError) {
+      return NextResponse.json(
+        { error: 'Analytics storage unavailable' },
+        { status: 503 }
+      )
+    }
     return NextResponse.json(
       { error: 'Internal server error' },
       { status: 500 }
@@ -41,10 +63,37 @@ export async function POST(request: NextRequest) {
   }
 }
 
-// Handle GET requests for analytics health check
-export async function GET() {
-  return NextResponse.json(
-    { status: 'Analytics API is running' },
-    { status: 200 }
-  )
+// Hourly p50/p75/p95 per metric and path, e.g.
+// GET /api/analytics?metric=LCP&path=/work&from=2025-01-01T00:00:00Z
+export async function GET(request: NextRequest) {
+  try {
+    const params = request.nextUrl.searchParams
+    const from = params.get('from') ? new Date(params.get('from')!) : undefined
+    const to = params.get('to') ? new Date(params.get('to')!) : undefined
+
+    if ((from && Number.isNaN(from.getTime())) || (to && Number.isNaN(to.getTime()))) {
+      return NextResponse.json(
+        { error: 'Invalid from/to date' },
+        { status: 400 }
+      )
+    }
+
+    const rollups = await queryRollups({
+      metric: params.get('metric') || undefined,
+      path: params.get('path') || undefined,
+      from,
+      to,
+    })
+
+    return NextResponse.json(
+      { status: 'Analytics API is running', rollups },
+      { status: 200 }
+    )
+  } catch (error) {
+    console.error('Analytics API error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
 }
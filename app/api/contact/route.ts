@@ -1,50 +1,59 @@
 import { NextRequest, NextResponse } from 'next/server'
+import { contactFormSchema } from '@/lib/contact-schema'
+import { StorageError } from '@/lib/data-dir'
+import { enqueueContact, kickContactWorker } from '@/lib/contact-queue'
+import { PayloadTooLargeError, payloadTooLarge, rateLimit, readJsonBody } from '@/lib/rate-limit'
+
+// The schema caps the message at 1000 characters; leave room for the rest
+// and for multi-byte text
+const MAX_BODY_BYTES = 8 * 1024
+// A burst of 5, then one message a minute
+const RATE_LIMIT = { route: 'contact', capacity: 5, refillPerSecond: 1 / 60 }
 
 export async function POST(request: NextRequest) {
-  try {
-    const body = await request.json()
-    const { name, email, subject, message } = body
+  const limited = rateLimit(request, RATE_LIMIT)
+  if (limited) return limited
 
-    // Basic validation
-    if (!name || !email || !subject || !message) {
-      return NextResponse.json(
-        { error: 'Missing required fields' },
-        { status: 400 }
-      )
-    }
+  let body: unknown
+  try {
+    body = await readJsonBody(request, MAX_BODY_BYTES)
+  } catch (error) {
+    if (error instanceof PayloadTooLargeError) return payloadTooLarge(error)
+    return NextResponse.json(
+      { error: 'Invalid JSON body' },
+      { status: 400 }
+    )
+  }
 
-    // Email validation
-    const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/
-    if (!emailRegex.test(email)) {
-      return NextResponse.json(
-        { error: 'Invalid email format' },
-        { status: 400 }
-      )
-    }
+  // Same schema as ContactModal, including the honeypot field
+  const parsed = contactFormSchema.safeParse(body)
+  if (!parsed.success) {
+    return NextResponse.json(
+      { error: 'Invalid contact form submission', fields: parsed.error.flatten().fieldErrors },
+      { status: 400 }
+    )
+  }
 
-    // Here you would typically:
-    // 1. Send email using a service like SendGrid, Resend, or Nodemailer
-    // 2. Store in database if needed
-    // 3. Log the contact request
-    
-    // For now, we'll simulate a successful submission
-    console.log('Contact form submission:', {
-      name,
-      email,
-      subject,
-      message,
-      timestamp: new Date().toISOString()
-    })
+  try {
+    const { website, ...message } = parsed.data
+    const { id, duplicate } = await enqueueContact(message)
 
-    // Simulate processing time
-    await new Promise(resolve => setTimeout(resolve, 1000))
+    // Delivery happens in the background; the message is already on disk
+    if (!duplicate) kickContactWorker()
 
     return NextResponse.json(
-      { message: 'Message sent successfully' },
-      { status: 200 }
+      { message: 'Message queued for delivery', id },
+      { status: 202 }
     )
   } catch (error) {
     console.error('Contact form error:', error)
+    // The queue directory is unusable until the deployment is reconfigured
+    if (error instanceof StorageError) {
+      return NextResponse.json(
+        { error: 'Message storage unavailable' },
+        { status: 503 }
+      )
+    }
     return NextResponse.json(
       { error: 'Internal server error' },
       { status: 500 }
@@ -0,0 +1,25 @@
+import path from 'path'
+import { NextRequest, NextResponse } from 'next/server'
+import { documentByFileName } from '@/lib/documents'
+import { fileResponse } from '@/lib/file-response'
+
+// PDFs under content-hashed names from scripts/pdf-assets.mjs. Served here
+// rather than from public/ for the strong ETag and immutable caching; the
+// originals stay available at their old paths.
+export async function GET(request: NextRequest, { params }: { params: Promise<{ file: string }> }) {
+  const { file } = await params
+  const doc = documentByFileName(file)
+  if (!doc) {
+    return NextResponse.json(
+      { error: 'Not found' },
+      { status: 404 }
+    )
+  }
+
+  return fileResponse(request, {
+    path: path.join(process.cwd(), 'public', doc.file),
+    etag: `"${doc.sha256}"`,
+    contentType: 'application/pdf',
+    fileName: path.basename(doc.file),
+  })
+}
@@ -3,7 +3,11 @@ import type { Metadata } from "next"
 import { cn } from "@/lib/utils"
 import { Inter } from "next/font/google"
 import { ThemeProvider } from "@/components/theme-provider"
-import { TimeWeatherDisplay } from "@/components/TimeWeatherDisplay"
+import { Starfield } from "@/components/Starfield"
+import { MotionProvider } from "@/components/MotionProvider"
+import { RumReporter } from "@/components/RumReporter"
+import { ThirdPartyScripts } from "@/components/ThirdPartyScripts"
+import { PageViewTracker } from "@/components/PageViewTracker"
 import "./globals.css"
 import Image from "next/image"
 
@@ -137,46 +141,6 @@ export default function RootLayout({
             __html: JSON.stringify(personStructuredData),
           }}
         />
-        
-        {/* Analytics Script */}
-        <script
-          dangerouslySetInnerHTML={{
-            __html: `
-              // Google Analytics 4
-              window.dataLayer = window.dataLayer || [];
-              function gtag(){dataLayer.push(arguments);}
-              gtag('js', new Date());
-              gtag('config', 'G-XXXXXXXXXX'); // Replace with your GA4 ID
-              
-              // Web Vitals
-              function sendToAnalytics(metric) {
-                const body = JSON.stringify(metric);
-                const url = '/api/analytics';
-                
-                if (navigator.sendBeacon) {
-                  navigator.sendBeacon(url, body);
-                } else {
-                  fetch(url, { body, method: 'POST', keepalive: true });
-                }
-              }
-              
-              // Report Web Vitals
-              import('web-vitals').then(({ getCLS, getFID, getFCP, getLCP, getTTFB }) => {
-                getCLS(sendToAnalytics);
-                getFID(sendToAnalytics);
-                getFCP(sendToAnalytics);
-                getLCP(sendToAnalytics);
-                getTTFB(sendToAnalytics);
-              });
-            `,
-          }}
-        />
-        
-        {/* Google Analytics Script */}
-        <script
-          async
-          src="https://www.googletagmanager.com/gtag/js?id=G-XXXXXXXXXX"
-        />
       </head>
       <body
         className={cn(
@@ -186,17 +150,12 @@ export default function RootLayout({
       >
         <div className="fixed inset-0 -z-20 bg-background transition-colors duration-500" />
         <div className="space-bg" />
-        {[...Array(50)].map((_, i) => (
-          <div
-            key={i}
-            className="star"
-            style={{
-              left: `${Math.random() * 100}%`,
-              top: `${Math.random() * 100}%`,
-              animationDelay: `${Math.random() * 3}s`,
-            }}
-          />
-        ))}
+        <Starfield />
+        {/* Web Vitals from real visitors (lib/rum.ts) */}
+        <RumReporter />
+        {/* Google Analytics, loaded once the page is idle */}
+        <ThirdPartyScripts />
+        <PageViewTracker />
         <div
           className="rocket"
           style={{
@@ -221,7 +180,9 @@ export default function RootLayout({
           }}
         />
         <ThemeProvider attribute="data-theme" defaultTheme="system" enableSystem disableTransitionOnChange>
-          {children}
+          <MotionProvider>
+            {children}
+          </MotionProvider>
         </ThemeProvider>
       </body>
     </html>
@@ -1,42 +1,31 @@
-"use client"
-
-import { useState, useEffect, useCallback } from "react"
-import { useAnalytics } from "@/hooks/useAnalytics"
-import { motion, AnimatePresence, useScroll, useTransform } from "framer-motion"
 import { Button } from "@/components/ui/button"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
 import { Badge } from "@/components/ui/badge"
-import { ThemeToggle } from "@/components/theme-toggle"
 
 import { GlassNav } from "@/components/GlassNav"
-import { ContactModal } from "@/components/ContactModal"
+import { ContactLauncher } from "@/components/ContactLauncher"
+import { PageClientEffects } from "@/components/PageClientEffects"
 import { ProjectCard } from "@/components/ProjectCard"
-import { TimeWeatherDisplay } from "@/components/TimeWeatherDisplay"
-import Image from "next/image"
+import { ScrollTiltHeading } from "@/components/ScrollTiltHeading"
+import { projectSummaries } from "@/lib/projects"
+import { documentHref, getDocument } from "@/lib/documents"
+import { MotionDiv, MotionFooter, MotionH3, MotionLi, MotionP, MotionSection } from "@/components/motion"
+import { OptimizedImage, Picture } from "@/components/OptimizedImage"
 import Link from "next/link"
 import { 
-  ArrowDown,
   Book,
-  Briefcase,
   Code2,
   Cloud,
   Database,
-  Download,
   ExternalLink,
-  FileCode,
   FolderOpen,
   Github,
-  Laptop,
   Linkedin,
   Mail,
   MapPin,
-  Server,
   User,
   Wrench
 } from "lucide-react"
-import { useTheme } from "next-themes"
-import { useRef } from "react"
-import { Fragment } from "react"
 import React from 'react';
 import { SiPython, SiJavascript, SiReact, SiNodedotjs, SiAngular, SiMongodb, SiPostgresql, SiMysql, SiTensorflow, SiKeras, SiNumpy, SiPandas, SiScikitlearn, SiAmazon, SiDocker, SiGithub, SiGit, SiKubernetes } from 'react-icons/si';
 
@@ -57,16 +46,6 @@ interface Certification {
   pdfUrl?: string
 }
 
-interface Project {
-  title: string
-  description: string
-  technologies: string[]
-  link?: string
-  githubUrl?: string
-  image?: string
-  highlights?: string[]
-}
-
 interface SkillsType {
   languages: string[]
   webFrameworks: string[]
@@ -76,67 +55,6 @@ interface SkillsType {
   tools: string[]
 }
 
-// UFO landing animation duration (ms)
-const UFO_ANIMATION_DURATION = 2200;
-
-// Helper: random float in range
-function randomFloat(min: number, max: number) {
-  return Math.random() * (max - min) + min;
-}
-
-// Rocket/UFO collision state
-type CrashState = 'none' | 'crashed';
-
-function RocketBackground({ crashState }: { crashState: CrashState }) {
-  // Only one rocket, wandering in the center area
-  // We'll use a fixed position for collision logic
-  const rocketLeft = '48%';
-  const rocketTop = '38%';
-  return (
-    <div className="pointer-events-none fixed inset-0 z-0">
-      <motion.span
-        initial={{ y: 0, x: 0, opacity: 0.8 }}
-        animate={crashState === 'crashed'
-          ? { scale: [1, 1.2, 0], rotate: [0, 30, -30, 0], opacity: [0.8, 1, 0] }
-          : {
-              y: [0, -10, 10, 0],
-              x: [0, 10, -10, 0],
-              opacity: [0.8, 1, 0.8, 0.8],
-            }
-        }
-        transition={{ duration: UFO_ANIMATION_DURATION / 1000, times: [0, 0.6, 0.8, 1], ease: "easeInOut" }}
-        style={{
-          position: 'absolute',
-          left: rocketLeft,
-          top: rocketTop,
-          fontSize: 48,
-          zIndex: 0,
-          filter: 'drop-shadow(0 0 12px #fff6) drop-shadow(0 0 24px #aaf)',
-        }}
-      >
-        🚀
-      </motion.span>
-      {crashState === 'crashed' && (
-        <motion.span
-          initial={{ scale: 0, opacity: 0 }}
-          animate={{ scale: [0, 1.5, 1], opacity: [0, 1, 0] }}
-          transition={{ duration: 0.7, times: [0, 0.5, 1] }}
-          style={{
-            position: 'absolute',
-            left: rocketLeft,
-            top: rocketTop,
-            fontSize: 56,
-            zIndex: 1,
-            pointerEvents: 'none',
-          }}
-        >
-          💥
-        </motion.span>
-      )}
-    </div>
-  )
-}
-
 const roles = [
   "Full Stack Software Engineer",
   "AI/ML Engineer",
@@ -205,27 +123,11 @@ const skillIcons: Record<string, React.ReactNode> = {
 };
 
 function HeroSection() {
-  const { theme } = useTheme()
-  const [mounted, setMounted] = useState(false)
-  const { scrollYProgress } = useScroll();
-  const rotateX = useTransform(scrollYProgress, [0, 1], [0, 45]);
-  const duration = useTransform(scrollYProgress, [0, 1], [0.3, 1.2]);
-
-  const downloadResume = () => {
-    window.open('/Laxmideepak_Nelapatla_Resume_SDE-2025.pdf', '_blank')
-  }
-
-  useEffect(() => {
-    setMounted(true)
-  }, [])
-
-  if (!mounted) return null
-
   return (
     <section id="hero" className="scroll-mt-20 min-h-[60vh] flex flex-col md:flex-row justify-center items-center text-center md:text-left relative space-y-6 mb-16">
       <div className="flex-1 flex flex-col justify-center items-center md:items-start space-y-4">
         <div className="text-primary/80 mb-2 font-mono text-sm md:text-base">INITIALIZING NEURAL LINK...</div>
-        <motion.h1 style={{ rotateX, transition: `transform ${duration} cubic-bezier(0.95,0.05,0.795,0.035)`, transformStyle: "preserve-3d" }} className="text-3xl sm:text-4xl md:text-6xl font-bold bg-clip-text text-transparent bg-gradient-to-r from-primary via-accent to-primary glow mb-2">Laxmideepak Nelapatla</motion.h1>
+        <ScrollTiltHeading as="h1" className="text-3xl sm:text-4xl md:text-6xl font-bold bg-clip-text text-transparent bg-gradient-to-r from-primary via-accent to-primary glow mb-2">Laxmideepak Nelapatla</ScrollTiltHeading>
         <p className="text-sm sm:text-lg text-muted-foreground max-w-2xl mx-auto mb-4 backdrop-blur-sm bg-background/30 p-3 sm:p-4 rounded-lg border border-primary/20">Full-stack engineer specializing in building scalable, cloud-native applications with Python, TypeScript, React, and AWS. Experienced in architecting high-performance systems, optimizing latency across distributed applications, and automating deployments through modern CI/CD pipelines. Adept at translating complex requirements into clean, production-ready solutions with a focus on reliability, maintainability, and performance at scale.</p>
         <AnimatedRoles />
       </div>
@@ -233,11 +135,12 @@ function HeroSection() {
       {/* Profile Image Only - Mobile Optimized */}
       <div className="flex-1 flex justify-center items-center mt-6 md:mt-0">
         <div className="rounded-2xl overflow-hidden shadow-lg border-4 border-primary/30 w-64 h-64 sm:w-80 sm:h-80 md:w-80 md:h-80">
-          <Image
+          <OptimizedImage
             src="/profile.jpg"
             alt="Profile"
             width={320}
             height={320}
+            sizes="(min-width: 640px) 320px, 256px"
             className="object-cover w-full h-full"
             priority
           />
@@ -248,27 +151,6 @@ function HeroSection() {
 }
 
 export default function Home() {
-  const { theme } = useTheme()
-  const [mounted, setMounted] = useState(false)
-  const [activeSection, setActiveSection] = useState<string>('experience')
-  const [animKey, setAnimKey] = useState<number | null>(null)
-  const [isContactModalOpen, setIsContactModalOpen] = useState(false)
-  const { scrollYProgress } = useScroll();
-  const rotateX = useTransform(scrollYProgress, [0, 1], [0, 45]);
-  const duration = useTransform(scrollYProgress, [0, 1], [0.3, 1.2]);
-  const { trackInteraction } = useAnalytics()
-
-  const downloadResume = () => {
-    trackInteraction('engagement', 'download', 'resume', 1)
-    window.open('/Laxmideepak_Nelapatla_Resume_SDE-2025.pdf', '_blank')
-  }
-
-  useEffect(() => {
-    setMounted(true)
-  }, [])
-
-  if (!mounted) return null
-
   const skills: SkillsType = {
     languages: ["Python", "Java", "TypeScript", "SQL", "JavaScript", "HTML5", "CSS3", "PL/pgSQL"],
     webFrameworks: ["React.js", "Node.js", "Angular", "Spring Boot", "GraphQL", "Express.js", "Next.js"],
@@ -349,116 +231,6 @@ export default function Home() {
     }
   ]
 
-  const projects: Project[] = [
-    {
-      title: "Dental Clinic Website",
-      description: "A modern dental clinic website built with React, TypeScript, and Express.js. Features end-to-end appointment booking system, responsive design, and comprehensive dental services information.",
-      technologies: ["React", "TypeScript", "Express.js", "Node.js", "Responsive Design", "Booking System", "Full-Stack"],
-      link: "https://dental-clone.vercel.app/",
-      githubUrl: "https://github.com/laxmideepak/dental-clinic-website",
-      highlights: [
-        "Built modern dental clinic website with React and TypeScript",
-        "Implemented end-to-end appointment booking system with full-stack functionality",
-        "Integrated Express.js backend for dynamic content and booking management",
-        "Deployed on Vercel with modern web development best practices"
-      ]
-    },
-    {
-      title: "VisionCare Site - Eye Care Practice Management",
-      description: "Complete VisionCareSite with mobile-responsive design and full-stack backend for eye care practice management. Comprehensive solution for optometry practices.",
-      technologies: ["TypeScript", "Full-Stack", "Mobile-Responsive", "Practice Management"],
-      link: "https://store2-mauve.vercel.app/",
-      githubUrl: "https://github.com/laxmideepak/VisionCareSite",
-      highlights: [
-        "Developed complete eye care practice management system",
-        "Implemented mobile-responsive design for accessibility",
-        "Built full-stack backend for comprehensive practice management",
-        "Designed for optometry practice workflow optimization"
-      ]
-    },
-    {
-      title: "AI-Powered Land Use Value Predictor",
-      description: "AI-powered model to classify satellite land use and simulate potential land value using deep learning. Advanced machine learning for real estate and urban planning applications.",
-      technologies: ["Python", "Deep Learning", "Satellite Imagery", "Land Classification", "Value Prediction"],
-      githubUrl: "https://github.com/laxmideepak/AI-Powered-Land-Use-Value-Predictor",
-      highlights: [
-        "Developed AI model for satellite land use classification",
-        "Implemented deep learning algorithms for land value prediction",
-        "Applied machine learning to real estate and urban planning",
-        "Built comprehensive solution for land use analysis"
-      ]
-    },
-    {
-      title: "Conference Management System",
-      description: "Designed a full-stack conference platform handling more than two hundred attendees across three concurrent tracks, reducing manual scheduling effort by seventy-five percent through real-time slot conflict resolution.",
-      technologies: ["React", "PHP", "MySQL/PostgreSQL", "Docker", "AWS ECS", "GitHub Actions"],
-      githubUrl: "https://github.com/laxmideepak/Conference-Management-System",
-      highlights: [
-        "Designed a full-stack conference platform handling more than two hundred attendees across three concurrent tracks",
-        "Reduced manual scheduling effort by seventy-five percent through real-time slot conflict resolution",
-        "Containerized and deployed on AWS ECS with GitHub Actions CI/CD, sustaining 99.9 percent uptime",
-        "Kept 95th-percentile page load below 150 milliseconds during peak registration"
-      ]
-    },
-    {
-      title: "RAG-Powered Customer Support Agent with Analytics Dashboard",
-      description: "Built a FastAPI + LangChain chatbot with vector search and React analytics dashboard, reducing L1 tickets by 40–60% and deployed on AWS with CI/CD automation.",
-      technologies: ["FastAPI", "LangChain", "React", "Vector Search", "AWS", "CI/CD"],
-      highlights: [
-        "Built a FastAPI + LangChain chatbot with vector search capabilities",
-        "Developed React analytics dashboard for customer support insights",
-        "Reduced L1 tickets by 40–60% through intelligent automation",
-        "Deployed on AWS with CI/CD automation for seamless updates"
-      ]
-    },
-    {
-      title: "Toy Search Engine | Information Retrieval System",
-      description: "Engineered a TF-IDF based search engine processing 30+ documents with cosine similarity ranking, achieving precise document retrieval through mathematical scoring algorithms and vector space modeling.",
-      technologies: ["Python", "NLTK", "TF-IDF", "Cosine Similarity", "Regex", "NLP"],
-
-      highlights: [
-        "TF-IDF based search engine with cosine similarity ranking",
-        "NLP preprocessing: tokenization, stemming, stopword removal (NLTK)",
-        "Regex-based text parsing, multi-encoding support",
-        "Query processing with normalized TF-IDF weighting",
-        "Mathematical retrieval: logarithmic weighting, cosine similarity"
-      ]
-    },
-    {
-      title: "CNN Image Classification | Deep Learning Project",
-      description: "Architected and deployed Convolutional Neural Network using TensorFlow/Keras achieving 95%+ accuracy on multi-class image classification, implementing multiple conv layers, pooling, dropout, and dense layers for robust feature extraction.",
-      technologies: ["TensorFlow", "Keras", "CNN", "Python", "Image Augmentation", "Deep Learning", "Adam Optimizer"],
-
-      highlights: [
-        "CNN with TensorFlow/Keras, 95%+ accuracy on multi-class images",
-        "Multiple conv, pooling, dropout, and dense layers",
-        "Image augmentation: rotation, zoom, flip, normalization",
-        "Advanced optimization: Adam, learning rate scheduling, early stopping",
-        "End-to-end ML workflow with training metrics and visualizations"
-      ]
-    },
-    {
-      title: "NBA Player Classification | Sports Analytics & Machine Learning",
-      description: "Engineered multi-class classification system using statistical player data to categorize NBA players into traditional and modern position archetypes with 88%+ accuracy using ensemble methods.",
-      technologies: ["Python", "Pandas", "Numpy", "Scikit-learn", "XGBoost", "SVM", "Random Forest", "PCA", "K-means", "GMM", "Sports Analytics", "Data Visualization"],
-
-      highlights: [
-        "Multi-class classification of NBA players (88%+ accuracy)",
-        "Feature engineering: 20+ stats, PCA, correlation analysis",
-        "Clustering: K-means, GMM for player archetypes",
-        "Model comparison: Random Forest, SVM, XGBoost",
-        "Interactive visualizations of player/team insights"
-      ]
-    }
-  ]
-
-  // Helper for nav click
-  const handleNavClick = (sectionId: string) => {
-    setActiveSection(sectionId)
-    setAnimKey(Date.now())
-    setTimeout(() => setAnimKey(null), 700)
-  }
-
   // Navigation links for GlassNav - Updated to include Education
   const navLinks = [
     { label: "Work", href: "/work", icon: <FolderOpen className="h-5 w-5" /> },
@@ -469,13 +241,15 @@ export default function Home() {
 
   return (
     <div className="min-h-screen bg-gradient-to-br from-background via-background to-muted/20">
+      <PageClientEffects />
+
       {/* Glass Navigation - Updated with prominent border and improved button visibility - Deploy: 2025-01-06 */}
       <GlassNav links={navLinks} />
       
       {/* Main Container */}
       <div id="main-content" className="max-w-4xl w-full mx-auto px-4 sm:px-6 lg:px-8 pb-32 pt-24">
         {/* Social Links Sidebar - Hidden on mobile */}
-        <motion.div
+        <MotionDiv
           className="fixed left-8 bottom-0 flex flex-col items-center gap-6 z-40 hidden md:flex"
           initial={{ opacity: 0, x: -20 }}
           animate={{ opacity: 1, x: 0 }}
@@ -493,31 +267,31 @@ export default function Home() {
             </a>
           </div>
           <div className="h-24 w-[1px] bg-border" />
-        </motion.div>
+        </MotionDiv>
 
         {/* Hero Section - Mobile Optimized */}
         <HeroSection />
 
         {/* Rest of the sections remain the same */}
         {/* Experience Section */}
-        <motion.section
+        <MotionSection
           id="experience"
-          className={`scroll-mt-24 space-y-6 sm:space-y-8 py-12 sm:py-16 rounded-2xl transition-all duration-500 ${activeSection === 'experience' ? 'ring-4 ring-primary/60 active-glow' : ''}`}
+          className={`scroll-mt-24 space-y-6 sm:space-y-8 py-12 sm:py-16 rounded-2xl transition-all duration-500 section-glow`}
           initial={{ opacity: 0, y: 20 }}
           whileInView={{ opacity: 1, y: 0 }}
           viewport={{ once: true }}
           transition={{ duration: 0.5 }}
         >
           <div className="text-center space-y-3 sm:space-y-4">
-            <motion.h2 style={{ rotateX, transition: `transform ${duration} cubic-bezier(0.95,0.05,0.795,0.035)`, transformStyle: "preserve-3d" }} className="text-2xl sm:text-3xl md:text-4xl font-bold flex items-center justify-center gap-2 sm:gap-3">
+            <ScrollTiltHeading className="text-2xl sm:text-3xl md:text-4xl font-bold flex items-center justify-center gap-2 sm:gap-3">
               <Code2 className="h-6 w-6 sm:h-8 sm:w-8 text-primary" />
               Experience
-            </motion.h2>
+            </ScrollTiltHeading>
             <p className="text-muted-foreground max-w-2xl mx-auto text-sm sm:text-base">My journey through the tech cosmos</p>
           </div>
           <div className="space-y-6">
             {experiences.map((exp, index) => (
-              <motion.div
+              <MotionDiv
                 key={exp.title || index}
                 initial={{ opacity: 0, y: 20 }}
                 whileInView={{ opacity: 1, y: 0 }}
@@ -537,31 +311,32 @@ export default function Home() {
                   <CardContent>
                     <ul className="list-disc list-inside text-foreground/90 text-sm space-y-2">
                       {exp.achievements.map((achievement, i) => (
-                        <motion.li
+                        <li
                           key={i}
-                          className="group-hover:text-foreground transition-colors duration-300 group-hover:pl-2 transition-all duration-300"
-                          whileHover={{ x: 5 }}
+                          className="group-hover:text-foreground transition-colors duration-300 group-hover:pl-2 transition-all duration-300 hover:translate-x-1"
                         >
                           {achievement}
-                        </motion.li>
+                        </li>
                       ))}
                     </ul>
                   </CardContent>
                 </Card>
-              </motion.div>
+              </MotionDiv>
             ))}
           </div>
-        </motion.section>
+        </MotionSection>
 
         {/* Certifications Section */}
-        <section id="certifications" className="py-20">
+        <MotionSection id="certifications" className="py-20">
           <div className="container mx-auto px-4">
             <div className="flex items-center gap-4 mb-8">
               <Book className="h-8 w-8 text-primary" />
               <h2 className="text-3xl font-bold">Certifications</h2>
             </div>
             <div className="space-y-6">
-              {certifications.map((cert, index) => (
+              {certifications.map((cert, index) => {
+                const preview = cert.pdfUrl ? getDocument(cert.pdfUrl)?.preview : null
+                return (
                 <Card
                   key={cert.title || index}
                   className={`group hover:border-primary transition-all duration-300 ring-4 ring-primary/60 glow`}
@@ -578,7 +353,7 @@ export default function Home() {
                       </div>
                       {cert.pdfUrl && (
                         <a
-                          href={cert.pdfUrl}
+                          href={documentHref(cert.pdfUrl)}
                           target="_blank"
                           rel="noopener noreferrer"
                           className="ml-4 px-3 py-1 rounded bg-primary text-background text-sm font-medium hover:bg-primary/80 transition-colors"
@@ -588,7 +363,25 @@ export default function Home() {
                       )}
                     </div>
                   </CardHeader>
-                  <CardContent>
+                  <CardContent className="flex flex-col sm:flex-row gap-6">
+                    {/* First page rendered at build time; the PDF itself is only fetched when opened */}
+                    {cert.pdfUrl && preview && (
+                      <a
+                        href={documentHref(cert.pdfUrl)}
+                        target="_blank"
+                        rel="noopener noreferrer"
+                        className="block w-40 flex-shrink-0 overflow-hidden rounded border border-border"
+                      >
+                        <Picture
+                          image={preview}
+                          alt={`${cert.title} certificate`}
+                          width={160}
+                          height={Math.round((160 * preview.height) / preview.width)}
+                          sizes="160px"
+                          className="w-full h-auto"
+                        />
+                      </a>
+                    )}
                     <ul className="list-disc list-inside space-y-2 text-muted-foreground">
                       {cert.description.map((desc, i) => (
                         <li key={i}>{desc}</li>
@@ -596,29 +389,30 @@ export default function Home() {
                     </ul>
                   </CardContent>
                 </Card>
-              ))}
+                )
+              })}
             </div>
           </div>
-        </section>
+        </MotionSection>
 
         {/* Projects Section */}
-        <motion.section
+        <MotionSection
           id="projects"
-          className={`scroll-mt-24 space-y-8 py-16 rounded-2xl transition-all duration-500 ${activeSection === 'projects' ? 'ring-4 ring-primary/60 active-glow' : ''}`}
+          className={`scroll-mt-24 space-y-8 py-16 rounded-2xl transition-all duration-500 section-glow`}
           initial={{ opacity: 0, y: 20 }}
           whileInView={{ opacity: 1, y: 0 }}
           viewport={{ once: true }}
           transition={{ duration: 0.5 }}
         >
           <div className="text-center space-y-4">
-            <motion.h2 style={{ rotateX, transition: `transform ${duration} cubic-bezier(0.95,0.05,0.795,0.035)`, transformStyle: "preserve-3d" }} className="text-3xl md:text-4xl font-bold flex items-center justify-center gap-3">
+            <ScrollTiltHeading className="text-3xl md:text-4xl font-bold flex items-center justify-center gap-3">
               <FolderOpen className="h-8 w-8 text-primary" />
               Projects
-            </motion.h2>
+            </ScrollTiltHeading>
             <p className="text-muted-foreground max-w-2xl mx-auto">Innovative solutions demonstrating full-stack development and system design expertise</p>
           </div>
           <div className="grid grid-cols-1 md:grid-cols-2 gap-8">
-            {projects.map((project, index) => {
+            {projectSummaries.map((project, index) => {
               const showImage = project.image && (
                 project.title.includes("Toy Search Engine") || 
                 project.title.includes("CNN Image Classification") || 
@@ -635,26 +429,26 @@ export default function Home() {
               );
             })}
           </div>
-        </motion.section>
+        </MotionSection>
 
         {/* Skills Section */}
-        <motion.section
+        <MotionSection
           id="skills"
-          className={`scroll-mt-24 space-y-8 py-16 rounded-2xl transition-all duration-500 ${activeSection === 'skills' ? 'ring-4 ring-primary/60 active-glow' : ''}`}
+          className={`scroll-mt-24 space-y-8 py-16 rounded-2xl transition-all duration-500 section-glow`}
           initial={{ opacity: 0, y: 20 }}
           whileInView={{ opacity: 1, y: 0 }}
           viewport={{ once: true }}
           transition={{ duration: 0.5 }}
         >
           <div className="text-center space-y-4">
-            <motion.h2 style={{ rotateX, transition: `transform ${duration} cubic-bezier(0.95,0.05,0.795,0.035)`, transformStyle: "preserve-3d" }} className="text-3xl md:text-4xl font-bold flex items-center justify-center gap-3">
+            <ScrollTiltHeading className="text-3xl md:text-4xl font-bold flex items-center justify-center gap-3">
               <Wrench className="h-8 w-8 text-primary" />
               Skills
-            </motion.h2>
+            </ScrollTiltHeading>
           </div>
           <div className="grid md:grid-cols-2 lg:grid-cols-3 gap-8">
             {(Object.keys(skills) as Array<keyof typeof skills>).map((skill) => (
-              <motion.div
+              <MotionDiv
                 key={skill}
                 initial={{ opacity: 0, y: 20 }}
                 whileInView={{ opacity: 1, y: 0 }}
@@ -676,7 +470,7 @@ export default function Home() {
                   <CardContent>
                     <div className="flex flex-wrap gap-4 mt-auto">
                       {skills[skill].map((s, index) => (
-                        <motion.div
+                        <MotionDiv
                           key={s}
                           initial={{ opacity: 0, scale: 0.8 }}
                           whileInView={{ opacity: 1, scale: 1 }}
@@ -688,37 +482,37 @@ export default function Home() {
                         >
                           <span className="text-3xl md:text-4xl">{skillIcons[s] || s[0]}</span>
                           <span className="text-xs text-muted-foreground mt-1">{s}</span>
-                        </motion.div>
+                        </MotionDiv>
                       ))}
                     </div>
                   </CardContent>
                 </Card>
-              </motion.div>
+              </MotionDiv>
             ))}
           </div>
-        </motion.section>
+        </MotionSection>
 
         {/* Education Section - Modern Redesign */}
-        <motion.section
+        <MotionSection
           id="education"
-          className={`scroll-mt-24 space-y-8 py-16 rounded-2xl transition-all duration-500 ${activeSection === 'education' ? 'ring-4 ring-primary/60 active-glow' : ''}`}
+          className={`scroll-mt-24 space-y-8 py-16 rounded-2xl transition-all duration-500 section-glow`}
           initial={{ opacity: 0, y: 20 }}
           whileInView={{ opacity: 1, y: 0 }}
           viewport={{ once: true }}
           transition={{ duration: 0.5 }}
         >
           <div className="text-center space-y-4">
-            <motion.h2 style={{ rotateX, transition: `transform ${duration} cubic-bezier(0.95,0.05,0.795,0.035)`, transformStyle: "preserve-3d" }} className="text-3xl md:text-4xl font-bold flex items-center justify-center gap-3">
+            <ScrollTiltHeading className="text-3xl md:text-4xl font-bold flex items-center justify-center gap-3">
               <Book className="h-8 w-8 text-primary" />
               Education
-            </motion.h2>
+            </ScrollTiltHeading>
             <p className="text-muted-foreground max-w-2xl mx-auto">My academic journey through the digital realm</p>
           </div>
 
           {/* Education Timeline */}
           <div className="relative max-w-4xl mx-auto">
             {/* Timeline line */}
-            <motion.div
+            <MotionDiv
               className="absolute left-1/2 transform -translate-x-1/2 w-0.5 bg-gradient-to-b from-primary/50 via-accent/50 to-primary/50 h-full hidden md:block"
               initial={{ height: 0 }}
               whileInView={{ height: "100%" }}
@@ -727,7 +521,7 @@ export default function Home() {
             />
             
             {/* UTA Education */}
-            <motion.div
+            <MotionDiv
               className="relative mb-8 md:mb-12"
               initial={{ opacity: 0, x: -50 }}
               whileInView={{ opacity: 1, x: 0 }}
@@ -738,14 +532,14 @@ export default function Home() {
               <div className="hidden md:block absolute left-1/2 transform -translate-x-1/2 -translate-y-1/2 w-4 h-4 bg-primary rounded-full border-4 border-background shadow-lg z-10" />
               
               <div className="md:ml-8 md:mr-8">
-                <motion.div
+                <MotionDiv
                   className="group cursor-pointer"
                   whileHover={{ scale: 1.02 }}
                   whileTap={{ scale: 0.98 }}
                 >
                   <div className="bg-gradient-to-r from-background/80 to-background/60 backdrop-blur-md border border-border/50 rounded-2xl p-4 shadow-lg hover:shadow-xl transition-all duration-500 hover:border-primary/30 relative overflow-hidden">
                     {/* Animated background */}
-                    <motion.div
+                    <MotionDiv
                       className="absolute inset-0 bg-gradient-to-r from-primary/5 to-accent/5 opacity-0 group-hover:opacity-100 transition-opacity duration-500"
                       initial={{ x: "-100%" }}
                       whileHover={{ x: "0%" }}
@@ -754,7 +548,7 @@ export default function Home() {
                     
                     {/* Content */}
                     <div className="relative z-10">
-                      <motion.div
+                      <MotionDiv
                         className="flex items-center gap-3 mb-4"
                         initial={{ opacity: 0, y: 20 }}
                         whileInView={{ opacity: 1, y: 0 }}
@@ -765,7 +559,7 @@ export default function Home() {
                           <Book className="h-6 w-6 text-primary" />
                         </div>
                         <div>
-                          <motion.div
+                          <MotionDiv
                             className="inline-block px-4 py-2 bg-primary/10 text-primary text-sm font-semibold rounded-full border border-primary/20"
                             initial={{ scale: 0.8, opacity: 0 }}
                             whileInView={{ scale: 1, opacity: 1 }}
@@ -773,11 +567,11 @@ export default function Home() {
                             transition={{ duration: 0.5, delay: 1 }}
                           >
                             2023 - 2025
-                          </motion.div>
+                          </MotionDiv>
                         </div>
-                      </motion.div>
+                      </MotionDiv>
                       
-                                              <motion.h3
+                                              <MotionH3
                           className="text-lg md:text-xl font-bold text-foreground mb-2"
                           initial={{ opacity: 0, y: 20 }}
                           whileInView={{ opacity: 1, y: 0 }}
@@ -785,9 +579,9 @@ export default function Home() {
                           transition={{ duration: 0.6, delay: 1.1 }}
                         >
                           Masters in Computer and Information Sciences
-                        </motion.h3>
+                        </MotionH3>
                         
-                        <motion.p
+                        <MotionP
                           className="text-sm md:text-base text-muted-foreground mb-3"
                           initial={{ opacity: 0, y: 20 }}
                           whileInView={{ opacity: 1, y: 0 }}
@@ -795,9 +589,9 @@ export default function Home() {
                           transition={{ duration: 0.6, delay: 1.2 }}
                         >
                           Computer Science
-                        </motion.p>
+                        </MotionP>
                       
-                      <motion.div
+                      <MotionDiv
                         className="flex items-center gap-3"
                         initial={{ opacity: 0, y: 20 }}
                         whileInView={{ opacity: 1, y: 0 }}
@@ -813,15 +607,15 @@ export default function Home() {
                         >
                           The University of Texas at Arlington
                         </Link>
-                      </motion.div>
+                      </MotionDiv>
                     </div>
                   </div>
-                </motion.div>
+                </MotionDiv>
               </div>
-            </motion.div>
+            </MotionDiv>
 
             {/* JNTUH Education */}
-            <motion.div
+            <MotionDiv
               className="relative mb-8 md:mb-12"
               initial={{ opacity: 0, x: 50 }}
               whileInView={{ opacity: 1, x: 0 }}
@@ -832,14 +626,14 @@ export default function Home() {
               <div className="hidden md:block absolute left-1/2 transform -translate-x-1/2 -translate-y-1/2 w-4 h-4 bg-accent rounded-full border-4 border-background shadow-lg z-10" />
               
               <div className="md:mr-8 md:ml-8">
-                <motion.div
+                <MotionDiv
                   className="group cursor-pointer"
                   whileHover={{ scale: 1.02 }}
                   whileTap={{ scale: 0.98 }}
                 >
                   <div className="bg-gradient-to-r from-background/60 to-background/80 backdrop-blur-md border border-border/50 rounded-2xl p-4 shadow-lg hover:shadow-xl transition-all duration-500 hover:border-accent/30 relative overflow-hidden">
                     {/* Animated background */}
-                    <motion.div
+                    <MotionDiv
                       className="absolute inset-0 bg-gradient-to-r from-accent/5 to-primary/5 opacity-0 group-hover:opacity-100 transition-opacity duration-500"
                       initial={{ x: "100%" }}
                       whileHover={{ x: "0%" }}
@@ -848,7 +642,7 @@ export default function Home() {
                     
                     {/* Content */}
                     <div className="relative z-10">
-                      <motion.div
+                      <MotionDiv
                         className="flex items-center gap-3 mb-4"
                         initial={{ opacity: 0, y: 20 }}
                         whileInView={{ opacity: 1, y: 0 }}
@@ -859,7 +653,7 @@ export default function Home() {
                           <Book className="h-6 w-6 text-accent" />
                         </div>
                         <div>
-                          <motion.div
+                          <MotionDiv
                             className="inline-block px-4 py-2 bg-accent/10 text-accent text-sm font-semibold rounded-full border border-accent/20"
                             initial={{ scale: 0.8, opacity: 0 }}
                             whileInView={{ scale: 1, opacity: 1 }}
@@ -867,11 +661,11 @@ export default function Home() {
                             transition={{ duration: 0.5, delay: 1.5 }}
                           >
                             2019 - 2023
-                          </motion.div>
+                          </MotionDiv>
                         </div>
-                      </motion.div>
+                      </MotionDiv>
                       
-                                              <motion.h3
+                                              <MotionH3
                           className="text-lg md:text-xl font-bold text-foreground mb-2"
                           initial={{ opacity: 0, y: 20 }}
                           whileInView={{ opacity: 1, y: 0 }}
@@ -879,9 +673,9 @@ export default function Home() {
                           transition={{ duration: 0.6, delay: 1.6 }}
                         >
                           BTech in Electronics and Communication Engineering
-                        </motion.h3>
+                        </MotionH3>
                         
-                        <motion.p
+                        <MotionP
                           className="text-sm md:text-base text-muted-foreground mb-3"
                           initial={{ opacity: 0, y: 20 }}
                           whileInView={{ opacity: 1, y: 0 }}
@@ -889,9 +683,9 @@ export default function Home() {
                           transition={{ duration: 0.6, delay: 1.7 }}
                         >
                           Electronics & Communication
-                        </motion.p>
+                        </MotionP>
                       
-                      <motion.div
+                      <MotionDiv
                         className="flex items-center gap-3"
                         initial={{ opacity: 0, y: 20 }}
                         whileInView={{ opacity: 1, y: 0 }}
@@ -907,15 +701,15 @@ export default function Home() {
                         >
                           Jawaharlal Nehru Technological University Hyderabad
                         </Link>
-                      </motion.div>
+                      </MotionDiv>
                     </div>
                   </div>
-                </motion.div>
+                </MotionDiv>
               </div>
-            </motion.div>
+            </MotionDiv>
 
             {/* Bottom floating element */}
-            <motion.div
+            <MotionDiv
               className="text-center"
               initial={{ opacity: 0, y: 30 }}
               whileInView={{ opacity: 1, y: 0 }}
@@ -929,34 +723,25 @@ export default function Home() {
                 </span>
                 <div className="w-2 h-2 bg-accent rounded-full animate-bounce" style={{ animationDelay: '0.2s' }} />
               </div>
-            </motion.div>
+            </MotionDiv>
           </div>
-        </motion.section>
+        </MotionSection>
 
         {/* Contact Section */}
-        <motion.section
+        <MotionSection
           id="contact"
-          className={`scroll-mt-24 space-y-8 relative py-16 rounded-2xl ${activeSection === 'contact' ? 'ring-4 ring-primary/60' : ''}`}
+          className={`scroll-mt-24 space-y-8 relative py-16 rounded-2xl data-[active=true]:ring-4 data-[active=true]:ring-primary/60`}
           initial={{ opacity: 0, y: 20 }}
           whileInView={{ opacity: 1, y: 0 }}
           viewport={{ once: true }}
           transition={{ duration: 0.5 }}
         >
-          {/* Contact Trigger */}
-          <div className="text-center">
-            <Button 
-              onClick={() => setIsContactModalOpen(true)}
-              className="bg-primary hover:bg-primary/90 text-primary-foreground px-8 py-3 text-lg"
-            >
-              <Mail className="h-5 w-5 mr-2" />
-              Get In Touch
-            </Button>
-          </div>
+          <ContactLauncher />
           
           {/* Alternative Contact Methods - Mobile Optimized */}
           <div className="text-center space-y-6 mt-12">
             <p className="text-muted-foreground text-sm sm:text-base">Prefer to connect directly? Here are my other channels:</p>
-            <div className="flex items-center justify-center gap-4 sm:gap-8 flex-wrap">
+            <div className="flex items-center justify-center gap-4 sm:gap-8 flex-wrap" data-testid="contact-channels">
               <Button asChild variant="ghost" size="icon" className="hover:bg-primary/20 group relative hover:scale-110 transition-transform">
                 <Link href="mailto:nelapatla.laxmideepak@gmail.com" target="_blank">
                   <Code2 className="h-4 w-4" />
@@ -981,10 +766,10 @@ export default function Home() {
               <span>Base Station: Dallas, Texas 🌎</span>
             </div>
           </div>
-        </motion.section>
+        </MotionSection>
 
         {/* Footer */}
-        <motion.footer
+        <MotionFooter
           className="fixed bottom-0 left-0 right-0 text-center text-sm text-muted-foreground py-4 bg-background/80 backdrop-blur-sm z-50"
           initial={{ opacity: 0 }}
           animate={{ opacity: 1 }}
@@ -993,14 +778,9 @@ export default function Home() {
           <span className="font-mono">[SYSTEM]</span> Powered by Next.js • Tailwind CSS • Framer Motion • Quantum Core v2.0
           <div className="absolute -left-8 bottom-0 text-2xl float">🌠</div>
           <div className="absolute -right-8 bottom-0 text-2xl float">✨</div>
-        </motion.footer>
+        </MotionFooter>
       </div>
 
-      {/* Contact Modal - Outside main container for proper z-index */}
-      <ContactModal 
-        isOpen={isContactModalOpen}
-        onClose={() => setIsContactModalOpen(false)}
-      />
     </div>
   )
 }
@@ -1,4 +1,5 @@
 import { MetadataRoute } from 'next'
+import { projectSlugs } from '@/lib/projects'
 
 export default function sitemap(): MetadataRoute.Sitemap {
   const baseUrl = 'https://laxmideepak-portfolio.vercel.app'
@@ -27,14 +28,7 @@ export default function sitemap(): MetadataRoute.Sitemap {
   ]
 
   // Dynamic project pages
-  const projectPages = [
-    'ai-powered-chatbot',
-    'e-commerce-platform',
-    'data-visualization-dashboard',
-    'machine-learning-model',
-    'real-time-chat-application',
-    'portfolio-website'
-  ].map(slug => ({
+  const projectPages = projectSlugs.map(slug => ({
     url: `${baseUrl}/work/${slug}`,
     lastModified: new Date(),
     changeFrequency: 'monthly' as const,
@@ -0,0 +1,57 @@
+"use client"
+
+import { useEffect, useState } from "react"
+import { createPortal } from "react-dom"
+import dynamic from "next/dynamic"
+import { Button } from "@/components/ui/button"
+import { Mail } from "lucide-react"
+
+// The modal and its form stack are a separate chunk. Hovering or focusing
+// the button starts the download so it is usually ready by the click.
+const loadContactModal = () => import("@/components/ContactModal").then(mod => mod.ContactModal)
+const ContactModal = dynamic(loadContactModal, { ssr: false })
+
+// "Get In Touch" button and the contact modal it opens. The modal is portaled
+// to <body> so the animated section around the button cannot clip or
+// reposition it.
+export function ContactLauncher() {
+  const [isContactModalOpen, setIsContactModalOpen] = useState(false)
+  // The modal is only mounted after the first open, then kept for its exit
+  // animation
+  const [hasOpened, setHasOpened] = useState(false)
+  const [portalTarget, setPortalTarget] = useState<HTMLElement | null>(null)
+
+  useEffect(() => {
+    setPortalTarget(document.body)
+  }, [])
+
+  const open = () => {
+    setHasOpened(true)
+    setIsContactModalOpen(true)
+  }
+
+  return (
+    <>
+      {/* Contact Trigger */}
+      <div className="text-center">
+        <Button
+          onClick={open}
+          onPointerEnter={loadContactModal}
+          onFocus={loadContactModal}
+          className="bg-primary hover:bg-primary/90 text-primary-foreground px-8 py-3 text-lg"
+        >
+          <Mail className="h-5 w-5 mr-2" />
+          Get In Touch
+        </Button>
+      </div>
+
+      {portalTarget && hasOpened && createPortal(
+        <ContactModal
+          isOpen={isContactModalOpen}
+          onClose={() => setIsContactModalOpen(false)}
+        />,
+        portalTarget
+      )}
+    </>
+  )
+}
@@ -1,12 +1,15 @@
 "use client"
 
 import { useState, useEffect } from "react"
-import { motion, AnimatePresence } from "framer-motion"
+import { m, AnimatePresence } from "framer-motion"
 import { Button } from "@/components/ui/button"
 import { Input } from "@/components/ui/input"
 import { Textarea } from "@/components/ui/textarea"
 import { Label } from "@/components/ui/label"
 import { X, Send, Mail } from "lucide-react"
+import { contactFormSchema } from "@/lib/contact-schema"
+
+type FieldErrors = Partial<Record<'name' | 'email' | 'subject' | 'message', string[]>>
 
 interface ContactModalProps {
   isOpen: boolean
@@ -18,34 +21,52 @@ export function ContactModal({ isOpen, onClose }: ContactModalProps) {
     name: '',
     email: '',
     project: '',
-    message: ''
+    message: '',
+    website: ''
   })
   const [isSubmitting, setIsSubmitting] = useState(false)
   const [submitStatus, setSubmitStatus] = useState<'idle' | 'success' | 'error'>('idle')
+  const [fieldErrors, setFieldErrors] = useState<FieldErrors>({})
+  const [errorMessage, setErrorMessage] = useState('')
 
   const handleSubmit = async (e: React.FormEvent) => {
     e.preventDefault()
-    setIsSubmitting(true)
     setSubmitStatus('idle')
-    
+    setErrorMessage('')
+
+    // Same schema /api/contact checks; "project" is the message subject and
+    // `website` the honeypot field, left empty by people
+    const parsed = contactFormSchema.safeParse({
+      name: formData.name.trim(),
+      email: formData.email.trim(),
+      subject: formData.project.trim(),
+      message: formData.message.trim(),
+      website: formData.website,
+    })
+    if (!parsed.success) {
+      setFieldErrors(parsed.error.flatten().fieldErrors)
+      return
+    }
+    setFieldErrors({})
+    setIsSubmitting(true)
+
     try {
-      // Basic validation
-      if (!formData.name.trim() || !formData.email.trim() || !formData.message.trim()) {
-        throw new Error('Please fill in all required fields')
-      }
-      
-      // Email validation
-      const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/
-      if (!emailRegex.test(formData.email)) {
-        throw new Error('Please enter a valid email address')
+      const response = await fetch('/api/contact', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(parsed.data),
+      })
+      if (!response.ok) {
+        const body = await response.json().catch(() => null)
+        if (body?.fields) setFieldErrors(body.fields)
+        throw new Error(response.status === 429
+          ? 'Too many messages, please try again in a minute.'
+          : 'Your message could not be sent, please try again.')
       }
-      
-      // Simulate API call (replace with actual API endpoint)
-      await new Promise(resolve => setTimeout(resolve, 1000))
-      
-      // Success
+
+      // Queued for delivery (202)
       setSubmitStatus('success')
-      setFormData({ name: '', email: '', project: '', message: '' })
+      setFormData({ name: '', email: '', project: '', message: '', website: '' })
       
       // Close modal after 2 seconds
       setTimeout(() => {
@@ -55,7 +76,7 @@ export function ContactModal({ isOpen, onClose }: ContactModalProps) {
       
     } catch (error) {
       setSubmitStatus('error')
-      console.error('Form submission error:', error)
+      setErrorMessage(error instanceof Error ? error.message : 'Your message could not be sent, please try again.')
     } finally {
       setIsSubmitting(false)
     }
@@ -92,7 +113,7 @@ export function ContactModal({ isOpen, onClose }: ContactModalProps) {
       {isOpen && (
         <>
           {/* Backdrop */}
-          <motion.div
+          <m.div
             initial={{ opacity: 0 }}
             animate={{ opacity: 1 }}
             exit={{ opacity: 0 }}
@@ -101,12 +122,16 @@ export function ContactModal({ isOpen, onClose }: ContactModalProps) {
           />
           
           {/* Modal */}
-          <motion.div
+          <m.div
             initial={{ opacity: 0, scale: 0.95, y: 20 }}
             animate={{ opacity: 1, scale: 1, y: 0 }}
             exit={{ opacity: 0, scale: 0.95, y: 20 }}
             transition={{ type: "spring", damping: 25, stiffness: 300 }}
             className="fixed inset-0 z-50 flex items-center justify-center p-2 sm:p-4"
+            role="dialog"
+            aria-modal="true"
+            aria-labelledby="contact-modal-title"
+            data-testid="contact-modal"
           >
             <div className="bg-card border border-border rounded-2xl shadow-2xl w-full max-w-md max-h-[95vh] sm:max-h-[90vh] overflow-y-auto mx-2">
               {/* Header */}
@@ -115,13 +140,14 @@ export function ContactModal({ isOpen, onClose }: ContactModalProps) {
                   <div className="p-2 bg-primary/10 rounded-lg">
                     <Mail className="h-4 w-4 sm:h-5 sm:w-5 text-primary" />
                   </div>
-                  <h2 className="text-lg sm:text-xl font-semibold text-foreground">Get In Touch</h2>
+                  <h2 id="contact-modal-title" className="text-lg sm:text-xl font-semibold text-foreground">Get In Touch</h2>
                 </div>
                 <Button
                   variant="ghost"
                   size="icon"
                   onClick={onClose}
                   className="h-7 w-7 sm:h-8 sm:w-8 hover:bg-muted"
+                  aria-label="Close"
                 >
                   <X className="h-3 w-3 sm:h-4 sm:w-4" />
                 </Button>
@@ -146,6 +172,9 @@ export function ContactModal({ isOpen, onClose }: ContactModalProps) {
                       required
                       className="h-9 sm:h-10"
                     />
+                    {fieldErrors.name?.[0] && (
+                      <span className="text-xs text-red-600">{fieldErrors.name[0]}</span>
+                    )}
                   </div>
 
                   <div className="space-y-1.5 sm:space-y-2">
@@ -160,6 +189,9 @@ export function ContactModal({ isOpen, onClose }: ContactModalProps) {
                       required
                       className="h-9 sm:h-10"
                     />
+                    {fieldErrors.email?.[0] && (
+                      <span className="text-xs text-red-600">{fieldErrors.email[0]}</span>
+                    )}
                   </div>
 
                   <div className="space-y-1.5 sm:space-y-2">
@@ -174,6 +206,9 @@ export function ContactModal({ isOpen, onClose }: ContactModalProps) {
                       required
                       className="h-9 sm:h-10"
                     />
+                    {fieldErrors.subject?.[0] && (
+                      <span className="text-xs text-red-600">{fieldErrors.subject[0]}</span>
+                    )}
                   </div>
 
                   <div className="space-y-1.5 sm:space-y-2">
@@ -188,27 +223,42 @@ export function ContactModal({ isOpen, onClose }: ContactModalProps) {
                       required
                       className="min-h-[80px] sm:min-h-[100px]"
                     />
+                    {fieldErrors.message?.[0] && (
+                      <span className="text-xs text-red-600">{fieldErrors.message[0]}</span>
+                    )}
                   </div>
 
+                  {/* Honeypot: hidden from people, filled in by bots */}
+                  <input
+                    type="text"
+                    name="website"
+                    value={formData.website}
+                    onChange={handleChange}
+                    tabIndex={-1}
+                    autoComplete="off"
+                    aria-hidden="true"
+                    className="hidden"
+                  />
+
                   {/* Status Messages */}
                   {submitStatus === 'success' && (
-                    <motion.div
+                    <m.div
                       initial={{ opacity: 0, y: 10 }}
                       animate={{ opacity: 1, y: 0 }}
                       className="p-3 bg-green-500/10 border border-green-500/20 rounded-lg text-green-600 text-sm text-center"
                     >
                       ✅ Message sent successfully! I'll get back to you soon.
-                    </motion.div>
+                    </m.div>
                   )}
                   
                   {submitStatus === 'error' && (
-                    <motion.div
+                    <m.div
                       initial={{ opacity: 0, y: 10 }}
                       animate={{ opacity: 1, y: 0 }}
                       className="p-3 bg-red-500/10 border border-red-500/20 rounded-lg text-red-600 text-sm text-center"
                     >
-                      ❌ Please fill in all required fields correctly.
-                    </motion.div>
+                      ❌ {errorMessage}
+                    </m.div>
                   )}
                   
                   <Button 
@@ -235,7 +285,7 @@ export function ContactModal({ isOpen, onClose }: ContactModalProps) {
                 </p>
               </div>
             </div>
-          </motion.div>
+          </m.div>
         </>
       )}
     </AnimatePresence>
@@ -1,12 +1,14 @@
 "use client"
 
-import { useState, useEffect, useRef } from "react"
-import { motion, AnimatePresence } from "framer-motion"
+import { useState, useEffect, useRef, useCallback } from "react"
+import { m, AnimatePresence } from "framer-motion"
 import { Button } from "@/components/ui/button"
 import { ThemeToggle } from "@/components/theme-toggle"
 import { TimeWeatherDisplay } from "@/components/TimeWeatherDisplay"
 import { Download, Menu, X, Mail, ChevronDown, Briefcase, Book, FolderOpen, Wrench, User } from "lucide-react"
 import Link from "next/link"
+import { useScrolledPast } from "@/lib/scroll-engine"
+import { documentHref } from "@/lib/document-href"
 
 interface NavLink {
   label: string
@@ -22,21 +24,17 @@ interface GlassNavProps {
 export function GlassNav({ links, logo }: GlassNavProps) {
   const [isOpen, setIsOpen] = useState(false)
   const [isDropdownOpen, setIsDropdownOpen] = useState(false)
-  const [isScrolled, setIsScrolled] = useState(false)
   const mobileMenuRef = useRef<HTMLDivElement>(null)
   const dropdownRef = useRef<HTMLDivElement>(null)
   const firstFocusableRef = useRef<HTMLAnchorElement>(null)
+  const barRef = useRef<HTMLDivElement>(null)
 
-  // Handle scroll for navbar styling
-  useEffect(() => {
-    const handleScroll = () => {
-      const scrollY = window.scrollY
-      setIsScrolled(scrollY > 20)
-    }
-
-    window.addEventListener('scroll', handleScroll, { passive: true })
-    return () => window.removeEventListener('scroll', handleScroll)
+  // Navbar styling on scroll. The flag is written to a data attribute that the
+  // classes below key off, so scrolling never re-renders the nav.
+  const setScrolled = useCallback((scrolled: boolean) => {
+    if (barRef.current) barRef.current.dataset.scrolled = String(scrolled)
   }, [])
+  useScrolledPast(20, setScrolled)
 
   // Focus trap for mobile menu
   useEffect(() => {
@@ -113,7 +111,7 @@ export function GlassNav({ links, logo }: GlassNavProps) {
 
   const downloadResume = () => {
     const link = document.createElement('a')
-    link.href = '/Laxmideepak_Nelapatla_Resume_SDE-2025.pdf'
+    link.href = documentHref('/Laxmideepak_Nelapatla_Resume_SDE-2025.pdf')
     link.download = 'Laxmideepak_Nelapatla_Resume_SDE-2025.pdf'
     document.body.appendChild(link)
     link.click()
@@ -151,7 +149,7 @@ export function GlassNav({ links, logo }: GlassNavProps) {
         Skip to content
       </a>
 
-      <motion.header
+      <m.header
         className="fixed top-0 left-0 right-0 z-40"
         initial={{ y: -100 }}
         animate={{ y: 0 }}
@@ -164,11 +162,9 @@ export function GlassNav({ links, logo }: GlassNavProps) {
         </div>
         
         <div 
-          className={`w-full transition-all duration-300 ${
-            isScrolled 
-              ? 'bg-background/95 backdrop-blur-md border border-blue-500/20 rounded-xl mx-2 my-1 shadow-lg' 
-              : 'bg-background/90 backdrop-blur-sm border border-blue-400/15 rounded-xl mx-2 my-1 shadow-md'
-          }`}
+          ref={barRef}
+          data-scrolled="false"
+          className="w-full transition-all duration-300 border rounded-xl mx-2 my-1 bg-background/90 backdrop-blur-sm border-blue-400/15 shadow-md data-[scrolled=true]:bg-background/95 data-[scrolled=true]:backdrop-blur-md data-[scrolled=true]:border-blue-500/20 data-[scrolled=true]:shadow-lg"
         >
           <div className="max-w-6xl mx-auto px-4 sm:px-6 lg:px-8">
             <div className="flex items-center justify-between h-16">
@@ -204,7 +200,7 @@ export function GlassNav({ links, logo }: GlassNavProps) {
                   {/* Dropdown Menu */}
                   <AnimatePresence>
                     {isDropdownOpen && (
-                      <motion.div
+                      <m.div
                         className="absolute top-full left-0 mt-2 w-48 bg-background/95 backdrop-blur-md border border-border/50 rounded-lg shadow-lg z-50"
                         initial={{ opacity: 0, y: -10, scale: 0.95 }}
                         animate={{ opacity: 1, y: 0, scale: 1 }}
@@ -224,7 +220,7 @@ export function GlassNav({ links, logo }: GlassNavProps) {
                             </Link>
                           ))}
                         </div>
-                      </motion.div>
+                      </m.div>
                     )}
                   </AnimatePresence>
                 </div>
@@ -287,7 +283,7 @@ export function GlassNav({ links, logo }: GlassNavProps) {
             {/* Mobile Menu */}
             <AnimatePresence>
               {isOpen && (
-                <motion.div
+                <m.div
                   id="mobile-menu"
                   ref={mobileMenuRef}
                   className="lg:hidden border-t border-border/50 bg-background/95 backdrop-blur-md"
@@ -337,12 +333,12 @@ export function GlassNav({ links, logo }: GlassNavProps) {
                       </Button>
                     </div>
                   </div>
-                </motion.div>
+                </m.div>
               )}
             </AnimatePresence>
           </div>
         </div>
-      </motion.header>
+      </m.header>
     </>
   )
 } 
\ No newline at end of file
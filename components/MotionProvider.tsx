@@ -0,0 +1,16 @@
+"use client"
+
+import { LazyMotion } from "framer-motion"
+
+const loadFeatures = () => import("@/lib/motion-features").then(mod => mod.default)
+
+// Components render with `m.*` and pick up animation features once this chunk
+// has loaded. `strict` makes a stray `motion.*` import fail loudly, since it
+// would pull the full feature set back into the main bundle.
+export function MotionProvider({ children }: { children: React.ReactNode }) {
+  return (
+    <LazyMotion features={loadFeatures} strict>
+      {children}
+    </LazyMotion>
+  )
+}
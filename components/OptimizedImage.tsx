@@ -0,0 +1,94 @@
+import type { CSSProperties } from "react"
+import { preload } from "react-dom"
+import Image from "next/image"
+import { fallbackVariants, getImage, pickVariant, srcSet, type ManifestImage } from "@/lib/images"
+
+interface OptimizedImageProps {
+  src: string
+  alt: string
+  width?: number
+  height?: number
+  fill?: boolean
+  sizes?: string
+  priority?: boolean
+  className?: string
+}
+
+// Drop-in for next/image with the same props for local images. Renders a
+// <picture> with the prebuilt AVIF and WebP srcsets from the image manifest,
+// a JPEG/PNG fallback and the blurred placeholder as a background until the
+// image paints. Needs no client JS. Images missing from the manifest fall
+// back to next/image.
+export function OptimizedImage({ src, alt, width, height, fill, sizes, priority, className }: OptimizedImageProps) {
+  const image = getImage(src)
+  if (!image) {
+    return (
+      <Image
+        src={src}
+        alt={alt}
+        {...(fill ? { fill: true } : { width, height })}
+        sizes={sizes}
+        priority={priority}
+        className={className}
+      />
+    )
+  }
+
+  return (
+    <Picture
+      image={image}
+      alt={alt}
+      width={width}
+      height={height}
+      fill={fill}
+      sizes={sizes}
+      priority={priority}
+      className={className}
+    />
+  )
+}
+
+// Renders a manifest entry directly, e.g. a PDF preview from lib/documents.ts
+export function Picture({ image, alt, width, height, fill, sizes, priority, className }: Omit<OptimizedImageProps, "src"> & { image: ManifestImage }) {
+  const imageSizes = sizes ?? (width ? `${width}px` : "100vw")
+  const fallback = fallbackVariants(image)
+
+  if (priority) {
+    // Browsers without AVIF support skip this preload and use the <source> below
+    preload(pickVariant(image.variants.avif, width ?? image.width).src, {
+      as: "image",
+      type: "image/avif",
+      imageSrcSet: srcSet(image.variants.avif),
+      imageSizes,
+      fetchPriority: "high",
+    })
+  }
+
+  const style: CSSProperties = {
+    backgroundImage: `url("${image.blurDataURL}")`,
+    backgroundSize: "cover",
+    backgroundPosition: "center",
+    ...(fill && { position: "absolute", inset: 0, width: "100%", height: "100%" }),
+  }
+
+  return (
+    <picture>
+      <source type="image/avif" srcSet={srcSet(image.variants.avif)} sizes={imageSizes} />
+      <source type="image/webp" srcSet={srcSet(image.variants.webp)} sizes={imageSizes} />
+      {/* eslint-disable-next-line @next/next/no-img-element */}
+      <img
+        src={pickVariant(fallback, width ?? image.width).src}
+        srcSet={srcSet(fallback)}
+        sizes={imageSizes}
+        alt={alt}
+        width={fill ? undefined : width ?? image.width}
+        height={fill ? undefined : height ?? image.height}
+        loading={priority ? "eager" : "lazy"}
+        fetchPriority={priority ? "high" : undefined}
+        decoding="async"
+        className={className}
+        style={style}
+      />
+    </picture>
+  )
+}
@@ -0,0 +1,13 @@
+"use client"
+
+import { useEffect } from "react"
+
+// Client-only side effects for server-rendered pages: the hydration marker
+// the browser tests wait on (testsprite_tests/waits.py)
+export function PageClientEffects() {
+  useEffect(() => {
+    document.documentElement.dataset.hydrated = 'true'
+  }, [])
+
+  return null
+}
@@ -0,0 +1,11 @@
+"use client"
+
+import { useAnalytics } from "@/hooks/useAnalytics"
+
+// Reports a page view for every route and client-side navigation. Lives in
+// the root layout because gtag's own page views are off (lib/third-party.ts).
+export function PageViewTracker() {
+  useAnalytics()
+
+  return null
+}
@@ -1,26 +1,16 @@
 "use client"
 
-import { motion } from "framer-motion"
+import { m } from "framer-motion"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
 import { Badge } from "@/components/ui/badge"
 import { Button } from "@/components/ui/button"
 import { ExternalLink, Github, FolderOpen } from "lucide-react"
 import Image from "next/image"
 import Link from "next/link"
-
-interface Project {
-  title: string
-  description: string
-  technologies: string[]
-  link?: string
-  githubUrl?: string
-  image?: string
-  highlights?: string[]
-  slug?: string
-}
+import type { ProjectSummary } from "@/lib/projects"
 
 interface ProjectCardProps {
-  project: Project
+  project: ProjectSummary
   index: number
   showImage?: boolean
   viewMode?: "grid" | "list"
@@ -56,10 +46,11 @@ export function ProjectCard({ project, index, showImage = false, viewMode = "gri
   }
 
   return (
-    <motion.div
+    <m.div
       initial={{ opacity: 0, y: 20 }}
       whileInView={{ opacity: 1, y: 0 }}
       viewport={{ once: true }}
+      exit={{ opacity: 0, scale: 0.95, transition: { duration: 0.2 } }}
       transition={{ duration: 0.5, delay: index * 0.1 }}
       whileHover={{ y: -5 }}
       className="group"
@@ -195,6 +186,6 @@ export function ProjectCard({ project, index, showImage = false, viewMode = "gri
           </CardContent>
         </div>
       </Card>
-    </motion.div>
+    </m.div>
   )
 }
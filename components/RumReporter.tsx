@@ -0,0 +1,13 @@
+"use client"
+
+import { useEffect } from "react"
+import { startRum } from "@/lib/rum"
+
+// Starts real-user Web Vitals collection once per page load (lib/rum.ts)
+export function RumReporter() {
+  useEffect(() => {
+    startRum()
+  }, [])
+
+  return null
+}
@@ -0,0 +1,25 @@
+"use client"
+
+import { m } from "framer-motion"
+import { deriveFromProgress, useScrollEngine } from "@/lib/scroll-engine"
+
+interface ScrollTiltHeadingProps {
+  as?: "h1" | "h2"
+  className?: string
+  children: React.ReactNode
+}
+
+// Shared by every heading on the page
+const rotateX = deriveFromProgress(progress => progress * 45)
+
+// Heading that tilts back in 3D as the page scrolls
+export function ScrollTiltHeading({ as = "h2", className, children }: ScrollTiltHeadingProps) {
+  useScrollEngine()
+  const Heading = as === "h1" ? m.h1 : m.h2
+
+  return (
+    <Heading style={{ rotateX, transformStyle: "preserve-3d" }} className={className}>
+      {children}
+    </Heading>
+  )
+}
@@ -0,0 +1,170 @@
+"use client"
+
+import { useEffect, useRef } from "react"
+
+// Twinkling background stars drawn on one <canvas> instead of one DOM node
+// (and one CSS animation) per star.
+//
+// Positions come from a seeded PRNG, so every visit and every resize shows
+// the same sky. Drawing stops while the tab is hidden, and a single static
+// frame is drawn when the user prefers reduced motion.
+//
+// The glow is a canvas shadow, which is costly to draw, so each star size is
+// rendered once with its glow into a small sprite and frames only blit those.
+
+const SEED = 0x5eed
+// Same density as the old 50-node field on a 1080p screen
+const STARS_PER_MEGAPIXEL = 24
+const MIN_STARS = 20
+const MAX_STARS = 120
+const TWINKLE_PERIOD_MS = 3000
+// Twinkling is slow; 30fps is indistinguishable from 60 and halves the work
+const FRAME_INTERVAL_MS = 1000 / 30
+const GLOW_BLUR = 4
+// Stars grow by up to 20% at full brightness; sprites are drawn at that size
+const MAX_SCALE = 1.2
+
+interface Star {
+  x: number
+  y: number
+  radius: number
+  phase: number
+}
+
+// mulberry32
+function seededRandom(seed: number) {
+  let state = seed >>> 0
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0
+    let t = state
+    t = Math.imul(t ^ (t >>> 15), t | 1)
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61)
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296
+  }
+}
+
+function starCount(width: number, height: number) {
+  let count = (width * height) / 1_000_000 * STARS_PER_MEGAPIXEL
+  // Fewer stars on low-end devices
+  const cores = navigator.hardwareConcurrency || 4
+  const memory = (navigator as Navigator & { deviceMemory?: number }).deviceMemory || 4
+  if (cores <= 4 || memory <= 2) count /= 2
+  return Math.round(Math.min(MAX_STARS, Math.max(MIN_STARS, count)))
+}
+
+// Stars are generated from the same sequence every time, so growing the
+// window only adds stars and never moves the existing ones
+function createStars(count: number): Star[] {
+  const random = seededRandom(SEED)
+  return Array.from({ length: count }, (_, i) => ({
+    x: random(),
+    y: random(),
+    // Matches the old .star sizes: every 3rd is bigger, every 5th biggest
+    radius: i % 5 === 4 ? 2 : i % 3 === 2 ? 1.5 : 1,
+    phase: random() * TWINKLE_PERIOD_MS,
+  }))
+}
+
+// One glowing star of `radius` (CSS px) at full size, rendered at `dpr`
+function createSprite(radius: number, dpr: number) {
+  const half = radius * MAX_SCALE + GLOW_BLUR * 2
+  const sprite = document.createElement("canvas")
+  sprite.width = sprite.height = Math.ceil(half * 2 * dpr)
+  const ctx = sprite.getContext("2d")!
+  ctx.scale(dpr, dpr)
+  ctx.fillStyle = "white"
+  ctx.shadowColor = "white"
+  ctx.shadowBlur = GLOW_BLUR * dpr
+  ctx.beginPath()
+  ctx.arc(half, half, radius * MAX_SCALE, 0, Math.PI * 2)
+  ctx.fill()
+  return { canvas: sprite, half }
+}
+
+export function Starfield() {
+  const canvasRef = useRef<HTMLCanvasElement>(null)
+
+  useEffect(() => {
+    const canvas = canvasRef.current
+    const ctx = canvas?.getContext("2d")
+    if (!canvas || !ctx) return
+
+    const reducedMotion = window.matchMedia("(prefers-reduced-motion: reduce)")
+    let stars: Star[] = []
+    let width = 0
+    let height = 0
+    let frame: number | null = null
+    let lastDraw = -Infinity
+    let sprites = new Map<number, ReturnType<typeof createSprite>>()
+
+    const draw = (time: number) => {
+      ctx.clearRect(0, 0, width, height)
+      for (const star of stars) {
+        // 0 → 1 → 0 over one period, like the old twinkle keyframes
+        const t = reducedMotion.matches ? 0.5 : ((time + star.phase) % TWINKLE_PERIOD_MS) / TWINKLE_PERIOD_MS
+        const opacity = Math.sin(Math.PI * t)
+        if (opacity < 0.02) continue
+        ctx.globalAlpha = opacity
+        const sprite = sprites.get(star.radius)!
+        const half = sprite.half * (1 + 0.2 * opacity) / MAX_SCALE
+        ctx.drawImage(sprite.canvas, star.x * width - half, star.y * height - half, half * 2, half * 2)
+      }
+      ctx.globalAlpha = 1
+    }
+
+    const tick = (time: number) => {
+      frame = requestAnimationFrame(tick)
+      if (time - lastDraw < FRAME_INTERVAL_MS) return
+      lastDraw = time
+      draw(time)
+    }
+
+    const stop = () => {
+      if (frame !== null) cancelAnimationFrame(frame)
+      frame = null
+    }
+
+    const start = () => {
+      stop()
+      if (reducedMotion.matches) {
+        draw(0)
+      } else if (document.visibilityState === "visible") {
+        frame = requestAnimationFrame(tick)
+      }
+    }
+
+    const resize = () => {
+      width = window.innerWidth
+      height = window.innerHeight
+      const dpr = Math.min(window.devicePixelRatio || 1, 2)
+      canvas.width = Math.round(width * dpr)
+      canvas.height = Math.round(height * dpr)
+      ctx.setTransform(dpr, 0, 0, dpr, 0, 0)
+      stars = createStars(starCount(width, height))
+      sprites = new Map(Array.from(new Set(stars.map(star => star.radius)), radius => [radius, createSprite(radius, dpr)]))
+      // Resizing clears the canvas; repaint right away rather than on the
+      // next tick
+      draw(reducedMotion.matches ? 0 : performance.now())
+    }
+
+    const onVisibilityChange = () => {
+      if (document.visibilityState === "hidden") stop()
+      else start()
+    }
+
+    resize()
+    start()
+    window.addEventListener("resize", resize)
+    document.addEventListener("visibilitychange", onVisibilityChange)
+    reducedMotion.addEventListener("change", start)
+
+    return () => {
+      stop()
+      window.removeEventListener("resize", resize)
+      document.removeEventListener("visibilitychange", onVisibilityChange)
+      reducedMotion.removeEventListener("change", start)
+    }
+  }, [])
+
+  return <canvas ref={canvasRef} className="starfield" aria-hidden="true" />
+}
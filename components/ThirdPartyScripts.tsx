@@ -0,0 +1,16 @@
+import Script from "next/script"
+import { GA_ID } from "@/lib/third-party"
+
+// gtag.js after the load event, in idle time (lib/third-party.ts). Nothing is
+// loaded unless NEXT_PUBLIC_GA_ID is set.
+export function ThirdPartyScripts() {
+  if (!GA_ID) return null
+
+  return (
+    <Script
+      id="gtag"
+      src={`https://www.googletagmanager.com/gtag/js?id=${GA_ID}`}
+      strategy="lazyOnload"
+    />
+  )
+}
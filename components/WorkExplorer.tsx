@@ -0,0 +1,208 @@
+"use client"
+
+import { useState, useMemo } from "react"
+import { m, AnimatePresence } from "framer-motion"
+import { Button } from "@/components/ui/button"
+import { Input } from "@/components/ui/input"
+import { Card, CardContent, CardDescription, CardTitle } from "@/components/ui/card"
+import { ProjectCard } from "@/components/ProjectCard"
+import { 
+  Search,
+  Filter,
+  Grid3X3,
+  List,
+  FolderOpen
+} from "lucide-react"
+import { useDebouncedValue } from "@/hooks/useDebouncedValue"
+import type { CategoryCount, ProjectFilterIndex, ProjectSummary, TechnologyCount } from "@/lib/projects"
+import { searchProjects, type SearchIndex } from "@/lib/project-search"
+
+interface WorkExplorerProps {
+  projects: readonly ProjectSummary[]
+  categories: readonly CategoryCount[]
+  technologies: readonly TechnologyCount[]
+  filterIndex: ProjectFilterIndex
+  searchIndex: SearchIndex
+}
+
+// Wait for a pause in typing before re-running the search
+const SEARCH_DEBOUNCE_MS = 150
+
+// Search, category filter and grid/list toggle for /work. The page renders
+// on the server and hands over only the card fields of each project.
+export function WorkExplorer({ projects, categories, technologies, filterIndex, searchIndex }: WorkExplorerProps) {
+  const [searchQuery, setSearchQuery] = useState("")
+  const [selectedCategory, setSelectedCategory] = useState<string>("all")
+  const [selectedTechnology, setSelectedTechnology] = useState<string>("all")
+  const [viewMode, setViewMode] = useState<"grid" | "list">("grid")
+
+  const debouncedQuery = useDebouncedValue(searchQuery, SEARCH_DEBOUNCE_MS)
+
+  // Ranked prefix matches from the prebuilt index; null means no query
+  const matches = useMemo(
+    () => searchProjects(searchIndex, debouncedQuery),
+    [searchIndex, debouncedQuery]
+  )
+
+  // Filters are looked up in the prebuilt index, then intersected with the
+  // ranked search results
+  const filteredProjects = useMemo(() => {
+    const filters = [
+      selectedCategory === "all" ? null : filterIndex.categories[selectedCategory],
+      selectedTechnology === "all" ? null : filterIndex.technologies[selectedTechnology],
+    ].filter((positions): positions is number[] => positions != null).map(positions => new Set(positions))
+    const ranked = matches ?? projects.map((_, i) => i)
+    return ranked.filter(i => filters.every(allowed => allowed.has(i))).map(i => projects[i])
+  }, [projects, filterIndex, matches, selectedCategory, selectedTechnology])
+
+  const technologyName = technologies.find(({ key }) => key === selectedTechnology)?.technology
+
+  return (
+    <>
+      {/* Filters and Search */}
+      <m.div
+        initial={{ opacity: 0, y: 20 }}
+        animate={{ opacity: 1, y: 0 }}
+        transition={{ duration: 0.5, delay: 0.1 }}
+        className="mb-8 space-y-4"
+      >
+        {/* Search Bar */}
+        <div className="relative max-w-md mx-auto">
+          <Search className="absolute left-3 top-1/2 transform -translate-y-1/2 text-muted-foreground h-4 w-4" />
+          <Input
+            type="text"
+            placeholder="Search projects..."
+            value={searchQuery}
+            onChange={(e) => setSearchQuery(e.target.value)}
+            className="pl-10"
+          />
+        </div>
+
+        {/* Category Filters */}
+        <div className="flex flex-wrap justify-center gap-2">
+          <Button
+            variant={selectedCategory === "all" ? "default" : "outline"}
+            size="sm"
+            onClick={() => setSelectedCategory("all")}
+            className="flex items-center gap-2"
+          >
+            <Filter className="h-4 w-4" />
+            All ({projects.length})
+          </Button>
+          {categories.map(({ category, count }) => (
+            <Button
+              key={category}
+              variant={selectedCategory === category ? "default" : "outline"}
+              size="sm"
+              onClick={() => setSelectedCategory(category)}
+            >
+              {category} ({count})
+            </Button>
+          ))}
+        </div>
+
+        {/* Technology Filter and View Mode Toggle */}
+        <div className="flex flex-wrap justify-center gap-2">
+          <select
+            aria-label="Filter by technology"
+            value={selectedTechnology}
+            onChange={(e) => setSelectedTechnology(e.target.value)}
+            className="h-10 rounded-md border border-input bg-background px-3 text-sm focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring"
+          >
+            <option value="all">All technologies</option>
+            {technologies.map(({ key, technology, count }) => (
+              <option key={key} value={key}>
+                {technology} ({count})
+              </option>
+            ))}
+          </select>
+          <div className="flex border rounded-lg p-1 bg-muted">
+            <Button
+              variant={viewMode === "grid" ? "default" : "ghost"}
+              size="sm"
+              onClick={() => setViewMode("grid")}
+              className="flex items-center gap-2"
+            >
+              <Grid3X3 className="h-4 w-4" />
+              Grid
+            </Button>
+            <Button
+              variant={viewMode === "list" ? "default" : "ghost"}
+              size="sm"
+              onClick={() => setViewMode("list")}
+              className="flex items-center gap-2"
+            >
+              <List className="h-4 w-4" />
+              List
+            </Button>
+          </div>
+        </div>
+      </m.div>
+
+      {/* Results Count */}
+      <m.div
+        initial={{ opacity: 0 }}
+        animate={{ opacity: 1 }}
+        transition={{ duration: 0.5, delay: 0.2 }}
+        className="text-center mb-8"
+      >
+        <p className="text-muted-foreground">
+          Showing {filteredProjects.length} of {projects.length} projects
+          {debouncedQuery && ` for "${debouncedQuery}"`}
+          {selectedCategory !== "all" && ` in ${selectedCategory}`}
+          {technologyName && ` using ${technologyName}`}
+        </p>
+      </m.div>
+
+      {/* Projects Grid/List */}
+      <AnimatePresence mode="wait">
+        {filteredProjects.length > 0 ? (
+          <m.div
+            key={`results-${viewMode}`}
+            initial={{ opacity: 0 }}
+            animate={{ opacity: 1 }}
+            exit={{ opacity: 0 }}
+            transition={{ duration: 0.3 }}
+            className={
+              viewMode === "grid" 
+                ? "grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8"
+                : "space-y-6"
+            }
+          >
+            {/* Cards are keyed by slug so only those entering or leaving the
+                results animate; the rest stay mounted as the query changes */}
+            <AnimatePresence>
+              {filteredProjects.map((project, index) => (
+                <ProjectCard
+                  key={project.slug}
+                  project={project}
+                  index={index}
+                  showImage={!!project.image}
+                  viewMode={viewMode}
+                />
+              ))}
+            </AnimatePresence>
+          </m.div>
+        ) : (
+          <m.div
+            key="empty"
+            initial={{ opacity: 0 }}
+            animate={{ opacity: 1 }}
+            exit={{ opacity: 0 }}
+            className="text-center py-12"
+          >
+            <Card className="max-w-md mx-auto">
+              <CardContent className="pt-6">
+                <FolderOpen className="h-12 w-12 text-muted-foreground mx-auto mb-4" />
+                <CardTitle className="text-lg mb-2">No projects found</CardTitle>
+                <CardDescription>
+                  Try adjusting your search terms or filters
+                </CardDescription>
+              </CardContent>
+            </Card>
+          </m.div>
+        )}
+      </AnimatePresence>
+    </>
+  )
+}
@@ -0,0 +1,93 @@
+"use client"
+
+// Framer Motion elements for Server Components. Only serializable props
+// (initial, animate, whileInView, whileHover, transition, viewport) can be
+// passed from the server; anything driven by hooks needs its own client
+// component.
+//
+// MotionSection only sets up animations while the section is near the
+// viewport. Before that, and again once it has scrolled away, the section and
+// every Motion* element inside it sit in their final state with no in-view
+// observers or running animations, so off-screen sections cost no animation
+// work. The element type never changes between phases, so React keeps the
+// subtree (and the state of client islands inside it) mounted. Elements with
+// hover or tap gestures stay animated throughout.
+import { createContext, createElement, useContext, useEffect, useState } from "react"
+import { m, type HTMLMotionProps, type TargetAndTransition } from "framer-motion"
+import { isOnScreen, observeSection } from "@/lib/section-observer"
+
+// idle: not reached yet, active: near the viewport, done: animated and gone
+type SectionPhase = "idle" | "active" | "done"
+
+const SectionPhaseContext = createContext<SectionPhase | null>(null)
+
+const GESTURE_PROPS = ["whileHover", "whileTap", "whileFocus"] as const
+
+const INSTANT = { duration: 0 }
+
+type MotionTag = "div" | "section" | "li" | "h3" | "p" | "footer"
+
+function isTarget(value: unknown): value is TargetAndTransition {
+  return typeof value === "object" && value !== null && !Array.isArray(value)
+}
+
+// Props for one phase. Idle and done render the final state (where
+// whileInView or animate ends up) without animating; active snaps to the
+// initial state while still off screen so whileInView can play from there.
+function phaseProps<Tag extends MotionTag>(props: HTMLMotionProps<Tag>, phase: SectionPhase): HTMLMotionProps<Tag> {
+  const { initial, animate, whileInView, viewport, ...rest } = props
+  const target = whileInView ?? animate
+  if (phase === "active") {
+    if (!whileInView || !isTarget(initial)) return props
+    return { ...rest, initial, viewport, whileInView, animate: { ...initial, transition: INSTANT } } as HTMLMotionProps<Tag>
+  }
+  return {
+    ...rest,
+    initial: false,
+    animate: isTarget(target) ? { ...target, transition: INSTANT } : target,
+  } as HTMLMotionProps<Tag>
+}
+
+function gated<Tag extends MotionTag>(tag: Tag) {
+  function Gated(props: HTMLMotionProps<Tag>) {
+    const phase = useContext(SectionPhaseContext)
+    // Outside a MotionSection everything animates as usual
+    const interactive = GESTURE_PROPS.some(key => props[key] !== undefined)
+    const motionProps = interactive || phase === null ? props : phaseProps(props, phase)
+    return createElement(m[tag] as React.ComponentType<HTMLMotionProps<Tag>>, motionProps)
+  }
+  Gated.displayName = `Motion.${tag}`
+  return Gated
+}
+
+export function MotionSection(props: HTMLMotionProps<"section">) {
+  const [element, setElement] = useState<HTMLElement | null>(null)
+  const [phase, setPhase] = useState<SectionPhase>("idle")
+
+  useEffect(() => {
+    if (!element) return
+    return observeSection(element, (near, entry) => {
+      setPhase(current => {
+        if (current === "done") return current
+        if (near) {
+          // Already on screen when first seen: show it as is rather than
+          // hiding it again just to fade it in
+          return current === "idle" && isOnScreen(entry) ? "done" : "active"
+        }
+        return current === "active" ? "done" : current
+      })
+    })
+  }, [element])
+
+  return (
+    <SectionPhaseContext.Provider value={phase}>
+      <m.section {...phaseProps(props, phase)} ref={setElement} />
+    </SectionPhaseContext.Provider>
+  )
+}
+
+export const MotionDiv = gated("div")
+export const MotionLi = gated("li")
+export const MotionH3 = gated("h3")
+export const MotionP = gated("p")
+export const MotionFooter = gated("footer")
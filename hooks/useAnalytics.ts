@@ -1,5 +1,7 @@
 import { useEffect, useCallback } from 'react'
 import { usePathname } from 'next/navigation'
+import { enqueue } from '@/lib/analytics'
+import { forwardToThirdParty } from '@/lib/third-party'
 
 interface AnalyticsEvent {
   event: string
@@ -27,35 +29,25 @@ export function useAnalytics() {
       page_referrer: document.referrer || undefined,
     }
 
-    // Send to custom analytics API
-    fetch('/api/analytics', {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        'x-url': pageView.page_location,
-      },
-      body: JSON.stringify({
-        type: 'pageview',
-        ...pageView,
-      }),
-    }).catch(console.error)
+    const payload = {
+      type: 'pageview',
+      url: pageView.page_location,
+      ...pageView,
+    }
+    // Queue for the next batched send to the custom analytics API
+    enqueue(payload)
+    forwardToThirdParty(payload)
   }, [pathname])
 
   // Track custom events
   const trackEvent = useCallback((event: AnalyticsEvent) => {
-    // Send to custom analytics API
-    fetch('/api/analytics', {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        'x-url': window.location.href,
-      },
-      body: JSON.stringify({
-        type: 'event',
-        ...event,
-        timestamp: new Date().toISOString(),
-      }),
-    }).catch(console.error)
+    const payload = {
+      type: 'event',
+      ...event,
+    }
+    // Queue for the next batched send to the custom analytics API
+    enqueue(payload)
+    forwardToThirdParty(payload)
   }, [])
 
   // Track user interactions
@@ -0,0 +1,13 @@
+import { useEffect, useState } from 'react'
+
+// Returns `value` once it has stopped changing for `delay` ms
+export function useDebouncedValue<T>(value: T, delay: number): T {
+  const [debounced, setDebounced] = useState(value)
+
+  useEffect(() => {
+    const timer = setTimeout(() => setDebounced(value), delay)
+    return () => clearTimeout(timer)
+  }, [value, delay])
+
+  return debounced
+}
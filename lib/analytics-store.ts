@@ -0,0 +1,349 @@
+// Append-only storage for /api/analytics events with hourly rollups.
+//
+// Raw events are appended as NDJSON to small segment files. Once a segment is
+// sealed (by size or age) compaction folds its web-vitals samples into
+// per-(hour, path, metric) sketches in rollups.json and moves its lines into a
+// per-day archive file. Queries read the rollups plus the few segments not
+// compacted yet, so they never scan the raw history.
+//
+// Percentiles come from a DDSketch-style log histogram: buckets can be merged
+// across segments and every quantile is within ±2% of the exact value.
+
+import { promises as fs } from 'fs'
+import path from 'path'
+import { dataDir, withStorage } from '@/lib/data-dir'
+
+export const ROLLUP_METRICS = ['CLS', 'LCP', 'INP', 'TTFB', 'FCP', 'FID'] as const
+export type RollupMetric = (typeof ROLLUP_METRICS)[number]
+
+export interface Rollup {
+  hour: string
+  path: string
+  metric: RollupMetric
+  count: number
+  p50: number
+  p75: number
+  p95: number
+}
+
+export interface RollupQuery {
+  metric?: string
+  path?: string
+  from?: Date
+  to?: Date
+}
+
+interface Sketch {
+  count: number
+  zeros: number
+  bins: Record<string, number>
+}
+
+interface RollupFile {
+  version: 1
+  // Segments already folded in but possibly not archived yet
+  folded?: string[]
+  // Older files: every segment name up to this one was folded in
+  compactedThrough?: string
+  buckets: Record<string, Sketch>
+}
+
+const DATA_DIR = dataDir('analytics', process.env.ANALYTICS_DATA_DIR)
+const SEGMENTS_DIR = path.join(DATA_DIR, 'segments')
+const ARCHIVE_DIR = path.join(DATA_DIR, 'archive')
+const ROLLUP_PATH = path.join(DATA_DIR, 'rollups.json')
+
+const MAX_SEGMENT_BYTES = 1024 * 1024
+const MAX_SEGMENT_AGE_MS = 60 * 60 * 1000
+const COMPACT_INTERVAL_MS = 60 * 1000
+
+const RELATIVE_ACCURACY = 0.02
+const GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+const LOG_GAMMA = Math.log(GAMMA)
+// CLS can legitimately be 0; anything this small is counted as zero
+const MIN_VALUE = 1e-6
+
+// --- Sketch -----------------------------------------------------------------
+
+function emptySketch(): Sketch {
+  return { count: 0, zeros: 0, bins: {} }
+}
+
+function addToSketch(sketch: Sketch, value: number) {
+  sketch.count += 1
+  if (value <= MIN_VALUE) {
+    sketch.zeros += 1
+    return
+  }
+  const key = Math.ceil(Math.log(value) / LOG_GAMMA)
+  sketch.bins[key] = (sketch.bins[key] || 0) + 1
+}
+
+function quantile(sketch: Sketch, q: number): number {
+  if (sketch.count === 0) return 0
+  const rank = q * (sketch.count - 1)
+  let seen = sketch.zeros
+  if (rank < seen) return 0
+
+  const keys = Object.keys(sketch.bins).map(Number).sort((a, b) => a - b)
+  for (const key of keys) {
+    seen += sketch.bins[key]
+    if (seen > rank) return (2 * Math.pow(GAMMA, key)) / (GAMMA + 1)
+  }
+  return (2 * Math.pow(GAMMA, keys[keys.length - 1])) / (GAMMA + 1)
+}
+
+function cloneSketch(sketch: Sketch): Sketch {
+  return { count: sketch.count, zeros: sketch.zeros, bins: { ...sketch.bins } }
+}
+
+// Returns an adder that copies a sketch the first time it is touched, so the
+// cached rollups are never mutated in place
+function copyOnWrite(buckets: Record<string, Sketch>) {
+  const owned = new Set<string>()
+  return (key: string, value: number) => {
+    if (!owned.has(key)) {
+      buckets[key] = buckets[key] ? cloneSketch(buckets[key]) : emptySketch()
+      owned.add(key)
+    }
+    addToSketch(buckets[key], value)
+  }
+}
+
+// --- Event → bucket ---------------------------------------------------------
+
+function bucketKey(event: Record<string, any>): string | null {
+  if (!ROLLUP_METRICS.includes(event.name) || typeof event.value !== 'number') return null
+
+  const time = new Date(event.timestamp || event.receivedAt)
+  if (Number.isNaN(time.getTime())) return null
+  time.setUTCMinutes(0, 0, 0)
+
+  let pathname = 'unknown'
+  try {
+    pathname = new URL(event.url).pathname
+  } catch {
+    // Keep 'unknown' for relative or missing URLs
+  }
+  return `${time.toISOString()}|${pathname}|${event.name}`
+}
+
+function parseLines(text: string): Record<string, any>[] {
+  const events: Record<string, any>[] = []
+  for (const line of text.split('\n')) {
+    if (!line) continue
+    try {
+      events.push(JSON.parse(line))
+    } catch {
+      // A torn write from a crash only loses that one line
+    }
+  }
+  return events
+}
+
+// --- Storage ----------------------------------------------------------------
+
+// Serializes appends, rotation and compaction within this process
+let lock: Promise<unknown> = Promise.resolve()
+function withLock<T>(fn: () => Promise<T>): Promise<T> {
+  const run = lock.then(fn, fn)
+  lock = run.catch(() => undefined)
+  return run
+}
+
+let activeSegment: { file: string; createdAt: number; bytes: number } | null = null
+// Segments this process created; other processes' segments are only sealed
+// once they are too old to be appended to
+const ownSegments = new Set<string>()
+let lastCompaction = 0
+let rollupCache: { mtimeMs: number; data: RollupFile } | null = null
+
+async function ensureDirs() {
+  await fs.mkdir(SEGMENTS_DIR, { recursive: true })
+  await fs.mkdir(ARCHIVE_DIR, { recursive: true })
+}
+
+function segmentName(createdAt: number) {
+  // Zero-padded so lexical order is creation order; the pid and a random
+  // suffix keep processes that rotate in the same millisecond apart
+  const id = `${process.pid}-${Math.random().toString(36).slice(2, 8)}`
+  return `segment-${String(createdAt).padStart(15, '0')}-${id}.ndjson`
+}
+
+function segmentCreatedAt(name: string) {
+  return Number(name.slice('segment-'.length).split(/[-.]/)[0])
+}
+
+// Each process writes its own segments. Another process's segment may still
+// be its active one until it is older than the rotation age (plus one
+// compaction interval of slack for an append already in flight)
+function isSealed(name: string, active: string | null, now: number) {
+  if (name === active) return false
+  if (ownSegments.has(name)) return true
+  return now - segmentCreatedAt(name) >= MAX_SEGMENT_AGE_MS + COMPACT_INTERVAL_MS
+}
+function currentSegment(now: number) {
+  if (
+    !activeSegment ||
+    activeSegment.bytes >= MAX_SEGMENT_BYTES ||
+    now - activeSegment.createdAt >= MAX_SEGMENT_AGE_MS
+  ) {
+    const name = segmentName(now)
+    activeSegment = { file: path.join(SEGMENTS_DIR, name), createdAt: now, bytes: 0 }
+    ownSegments.add(name)
+  }
+  return activeSegment
+}
+
+export async function appendEvents(events: Record<string, any>[]) {
+  if (events.length === 0) return
+  const receivedAt = new Date().toISOString()
+  const lines = events.map(event => JSON.stringify({ receivedAt, ...event }) + '\n').join('')
+
+  await withLock(() => withStorage('Analytics', DATA_DIR, 'ANALYTICS_DATA_DIR', async () => {
+    await ensureDirs()
+    const segment = currentSegment(Date.now())
+    await fs.appendFile(segment.file, lines)
+    segment.bytes += Buffer.byteLength(lines)
+  }))
+
+  if (Date.now() - lastCompaction >= COMPACT_INTERVAL_MS) {
+    lastCompaction = Date.now()
+    compact().catch(error => console.error('Analytics compaction failed:', error))
+  }
+}
+
+async function readRollups(): Promise<RollupFile> {
+  try {
+    const { mtimeMs } = await fs.stat(ROLLUP_PATH)
+    if (rollupCache && rollupCache.mtimeMs === mtimeMs) return rollupCache.data
+    const data = JSON.parse(await fs.readFile(ROLLUP_PATH, 'utf8')) as RollupFile
+    rollupCache = { mtimeMs, data }
+    return data
+  } catch (error: any) {
+    if (error.code === 'ENOENT') return { version: 1, buckets: {} }
+    throw error
+  }
+}
+
+async function writeRollups(data: RollupFile) {
+  // Write-then-rename so readers never see a half-written file
+  const tmp = `${ROLLUP_PATH}.${process.pid}.tmp`
+  await fs.writeFile(tmp, JSON.stringify(data))
+  await fs.rename(tmp, ROLLUP_PATH)
+  rollupCache = null
+}
+
+function isFolded(name: string, rollups: RollupFile) {
+  if (rollups.folded?.includes(name)) return true
+  return rollups.compactedThrough !== undefined && name <= rollups.compactedThrough
+}
+
+// Fold every sealed segment into the rollups and move its lines to the
+// per-day archive. Active segments, this process's or another's, are left
+// alone.
+export function compact() {
+  return withLock(async () => {
+    await ensureDirs()
+    const active = activeSegment ? path.basename(activeSegment.file) : null
+    const now = Date.now()
+    const present = (await fs.readdir(SEGMENTS_DIR)).filter(n => n.endsWith('.ndjson'))
+    const sealed = present.filter(n => isSealed(n, active, now)).sort()
+    if (sealed.length === 0) return 0
+
+    const rollups = await readRollups()
+    const buckets = { ...rollups.buckets }
+    const add = copyOnWrite(buckets)
+    const unfolded = sealed.filter(name => !isFolded(name, rollups))
+
+    for (const name of unfolded) {
+      const text = await fs.readFile(path.join(SEGMENTS_DIR, name), 'utf8')
+      for (const event of parseLines(text)) {
+        const key = bucketKey(event)
+        if (key) add(key, event.value)
+      }
+    }
+
+    // Rollups are committed first and list what they folded, so a crash
+    // before the segments are archived never folds a segment twice. Names
+    // already archived are dropped from the list.
+    if (unfolded.length > 0) {
+      const folded = [...(rollups.folded ?? []).filter(name => present.includes(name)), ...unfolded]
+      await writeRollups({ version: 1, folded, compactedThrough: rollups.compactedThrough, buckets })
+    }
+
+    for (const name of sealed) {
+      const file = path.join(SEGMENTS_DIR, name)
+      const day = new Date(segmentCreatedAt(name)).toISOString().slice(0, 10)
+      await fs.appendFile(path.join(ARCHIVE_DIR, `${day}.ndjson`), await fs.readFile(file))
+      await fs.unlink(file)
+      ownSegments.delete(name)
+    }
+    return sealed.length
+  })
+}
+
+function matches(key: string, query: RollupQuery) {
+  const [hour, pathname, metric] = key.split('|')
+  if (query.metric && metric !== query.metric) return false
+  if (query.path && pathname !== query.path) return false
+  const time = Date.parse(hour)
+  if (query.from && time < query.from.getTime()) return false
+  if (query.to && time > query.to.getTime()) return false
+  return true
+}
+
+export function queryRollups(query: RollupQuery = {}): Promise<Rollup[]> {
+  // Under the lock so a concurrent compaction cannot count a segment twice
+  return withLock(() => collectRollups(query))
+}
+
+async function collectRollups(query: RollupQuery): Promise<Rollup[]> {
+  const rollups = await readRollups()
+  const buckets: Record<string, Sketch> = {}
+  for (const [key, sketch] of Object.entries(rollups.buckets)) {
+    if (matches(key, query)) buckets[key] = sketch
+  }
+
+  // Samples not compacted yet: the active segment and any sealed ones
+  // waiting for the next compaction
+  const add = copyOnWrite(buckets)
+  let names: string[] = []
+  try {
+    names = (await fs.readdir(SEGMENTS_DIR)).filter(n => n.endsWith('.ndjson') && !isFolded(n, rollups))
+  } catch (error: any) {
+    if (error.code !== 'ENOENT') throw error
+  }
+  for (const name of names) {
+    let text = ''
+    try {
+      text = await fs.readFile(path.join(SEGMENTS_DIR, name), 'utf8')
+    } catch (error: any) {
+      // Compaction may have removed it since readdir
+      if (error.code !== 'ENOENT') throw error
+    }
+    for (const event of parseLines(text)) {
+      const key = bucketKey(event)
+      if (key && matches(key, query)) add(key, event.value)
+    }
+  }
+
+  return Object.entries(buckets)
+    .map(([key, sketch]) => {
+      const [hour, pathname, metric] = key.split('|')
+      return {
+        hour,
+        path: pathname,
+        metric: metric as RollupMetric,
+        count: sketch.count,
+        p50: round(quantile(sketch, 0.5)),
+        p75: round(quantile(sketch, 0.75)),
+        p95: round(quantile(sketch, 0.95)),
+      }
+    })
+    .sort((a, b) => a.hour.localeCompare(b.hour) || a.path.localeCompare(b.path) || a.metric.localeCompare(b.metric))
+}
+
+function round(value: number) {
+  return Math.round(value * 10000) / 10000
+}
@@ -0,0 +1,92 @@
+// Batched client for /api/analytics.
+//
+// Events are buffered in memory and sent as one JSON array when the buffer
+// fills up, after a short delay, or when the page is hidden. The page-hide
+// flush goes through navigator.sendBeacon so it survives the tab closing.
+
+export interface AnalyticsPayload {
+  type: string
+  [key: string]: unknown
+}
+
+const ENDPOINT = '/api/analytics'
+const MAX_BATCH_SIZE = 20
+const FLUSH_DELAY_MS = 5000
+// Events kept for retry if the network is down; older ones are dropped first
+const MAX_QUEUE_SIZE = 200
+
+let queue: AnalyticsPayload[] = []
+let flushTimer: ReturnType<typeof setTimeout> | null = null
+let listening = false
+
+function listen() {
+  if (listening) return
+  listening = true
+
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') flush({ beacon: true })
+  })
+  // Safari does not always fire visibilitychange when the tab is closed
+  window.addEventListener('pagehide', () => flush({ beacon: true }))
+}
+
+function scheduleFlush(delay = FLUSH_DELAY_MS) {
+  if (flushTimer) return
+  flushTimer = setTimeout(() => flush(), delay)
+}
+
+// Put a batch back for a later flush instead of losing it
+function requeue(batch: AnalyticsPayload[], delay?: number) {
+  queue = [...batch, ...queue].slice(-MAX_QUEUE_SIZE)
+  scheduleFlush(delay)
+}
+
+export function enqueue(payload: AnalyticsPayload) {
+  if (typeof window === 'undefined') return
+  listen()
+
+  queue.push({
+    url: window.location.href,
+    timestamp: new Date().toISOString(),
+    ...payload,
+  })
+
+  if (queue.length >= MAX_BATCH_SIZE) {
+    flush()
+  } else {
+    scheduleFlush()
+  }
+}
+
+export function flush({ beacon = false }: { beacon?: boolean } = {}) {
+  if (flushTimer) {
+    clearTimeout(flushTimer)
+    flushTimer = null
+  }
+  while (queue.length > 0) {
+    const batch = queue.splice(0, MAX_BATCH_SIZE)
+    send(batch, beacon)
+  }
+}
+
+function send(batch: AnalyticsPayload[], beacon: boolean) {
+  const body = JSON.stringify(batch)
+
+  if (beacon && navigator.sendBeacon) {
+    const blob = new Blob([body], { type: 'application/json' })
+    if (navigator.sendBeacon(ENDPOINT, blob)) return
+  }
+
+  fetch(ENDPOINT, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body,
+    keepalive: true,
+  }).then(response => {
+    // Rate limited: hold on to the batch until the server accepts more
+    if (response.status === 429) {
+      const retryAfter = Number(response.headers.get('Retry-After'))
+      requeue(batch, retryAfter > 0 ? retryAfter * 1000 : undefined)
+    }
+  }).catch(() => requeue(batch))
+}
@@ -0,0 +1,66 @@
+// One wall clock for the whole page.
+//
+// Every clock display used to run its own setInterval and set React state each
+// second, re-rendering the nav with it. Here a single timer fires just after
+// each second boundary, so the display never lags the real clock by up to a
+// second, and listeners write the new text straight into the DOM. The timer
+// stops while the tab is hidden and catches up as soon as it is visible again.
+
+export type ClockListener = (now: Date) => void
+
+// Built once; toLocaleTimeString() creates a new formatter on every call
+export const timeFormat = new Intl.DateTimeFormat('en-US', {
+  hour: '2-digit',
+  minute: '2-digit',
+  second: '2-digit',
+  hour12: true,
+})
+
+export const dayFormat = new Intl.DateTimeFormat('en-US', {
+  weekday: 'short',
+  month: 'short',
+  day: 'numeric',
+})
+
+const listeners = new Set<ClockListener>()
+let timer: ReturnType<typeof setTimeout> | null = null
+
+function tick() {
+  const now = new Date()
+  listeners.forEach(listener => listener(now))
+  // A few ms past the boundary so the new second has definitely started
+  timer = setTimeout(tick, 1000 - now.getMilliseconds() + 5)
+}
+
+function start() {
+  if (timer === null && !document.hidden) tick()
+}
+
+function stop() {
+  if (timer !== null) clearTimeout(timer)
+  timer = null
+}
+
+function onVisibilityChange() {
+  if (document.hidden) stop()
+  else start()
+}
+
+// Calls `listener` right away and then once per second until unsubscribed
+export function subscribeClock(listener: ClockListener) {
+  listeners.add(listener)
+  if (listeners.size === 1) {
+    document.addEventListener('visibilitychange', onVisibilityChange)
+    start()
+  } else {
+    listener(new Date())
+  }
+
+  return () => {
+    listeners.delete(listener)
+    if (listeners.size === 0) {
+      document.removeEventListener('visibilitychange', onVisibilityChange)
+      stop()
+    }
+  }
+}
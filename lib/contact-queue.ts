@@ -0,0 +1,212 @@
+// Durable queue between /api/contact and the mail transport.
+//
+// A submission is written to disk before the request is answered, so a slow
+// or failing mail backend never holds up the response and a crash never loses
+// a message. Each message is one JSON file named after the hash of its
+// content. An identical resubmission (double click, client retry) therefore
+// finds the existing file and is not queued twice.
+//
+//   pending/<hash>.json   waiting for delivery or for its next retry
+//   sent/<hash>.json      delivered; kept for DEDUPE_WINDOW_MS
+//   failed/<hash>.json    gave up after MAX_ATTEMPTS
+//
+// Failed deliveries are retried with exponential backoff and jitter.
+//
+// Enqueueing and delivery take different locks: a submission only ever waits
+// for another submission's file write, never for the transport. Delivery
+// needs no lock against enqueueing because every move between directories is
+// a rename or writes the new file before removing the old one, so the
+// duplicate check always finds a message somewhere.
+
+import { createHash } from 'crypto'
+import { promises as fs } from 'fs'
+import path from 'path'
+import { dataDir, withStorage } from '@/lib/data-dir'
+import { transportFromEnv, type ContactMessage, type ContactTransport } from '@/lib/contact-transport'
+
+export interface ContactJob {
+  id: string
+  message: ContactMessage
+  enqueuedAt: string
+  attempts: number
+  nextAttemptAt: string
+  lastError?: string
+  sentAt?: string
+}
+
+export interface EnqueueResult {
+  id: string
+  duplicate: boolean
+}
+
+export const DATA_DIR = dataDir('contact', process.env.CONTACT_DATA_DIR)
+const PENDING_DIR = path.join(DATA_DIR, 'pending')
+const SENT_DIR = path.join(DATA_DIR, 'sent')
+const FAILED_DIR = path.join(DATA_DIR, 'failed')
+
+const MAX_ATTEMPTS = 6
+const BASE_BACKOFF_MS = 30 * 1000
+const MAX_BACKOFF_MS = 60 * 60 * 1000
+const DEDUPE_WINDOW_MS = 24 * 60 * 60 * 1000
+const POLL_INTERVAL_MS = 15 * 1000
+
+function serializer() {
+  let lock: Promise<unknown> = Promise.resolve()
+  return function <T>(fn: () => Promise<T>): Promise<T> {
+    const run = lock.then(fn, fn)
+    lock = run.catch(() => undefined)
+    return run
+  }
+}
+
+// Serializes the duplicate check and write of enqueueContact within this process
+const withLock = serializer()
+// Serializes delivery passes, so each pending job has one sender at a time
+const withWorkerLock = serializer()
+
+async function ensureDirs() {
+  await Promise.all([PENDING_DIR, SENT_DIR, FAILED_DIR].map(dir => fs.mkdir(dir, { recursive: true })))
+}
+
+// Case and surrounding whitespace do not make a message different
+export function contentHash(message: ContactMessage) {
+  const normalized = [message.name, message.email, message.subject, message.message]
+    .map(field => field.trim().toLowerCase())
+    .join('\u0000')
+  return createHash('sha256').update(normalized).digest('hex').slice(0, 32)
+}
+
+async function writeJob(dir: string, job: ContactJob) {
+  // Write-then-rename so a crash never leaves a half-written job
+  const file = path.join(dir, `${job.id}.json`)
+  const tmp = `${file}.${process.pid}.tmp`
+  await fs.writeFile(tmp, JSON.stringify(job))
+  await fs.rename(tmp, file)
+}
+
+async function readJob(file: string): Promise<ContactJob | null> {
+  try {
+    return JSON.parse(await fs.readFile(file, 'utf8')) as ContactJob
+  } catch (error: any) {
+    if (error.code === 'ENOENT') return null
+    throw error
+  }
+}
+
+async function exists(file: string) {
+  try {
+    await fs.access(file)
+    return true
+  } catch {
+    return false
+  }
+}
+
+export function enqueueContact(message: ContactMessage): Promise<EnqueueResult> {
+  const id = contentHash(message)
+  return withLock(() => withStorage('Contact', DATA_DIR, 'CONTACT_DATA_DIR', async () => {
+    await ensureDirs()
+    const name = `${id}.json`
+    if (await exists(path.join(PENDING_DIR, name)) || await exists(path.join(SENT_DIR, name))) {
+      return { id, duplicate: true }
+    }
+
+    const now = new Date().toISOString()
+    await writeJob(PENDING_DIR, { id, message, enqueuedAt: now, attempts: 0, nextAttemptAt: now })
+    return { id, duplicate: false }
+  }))
+}
+
+// Delay before retry number `attempts` (1-based): 30s, 1m, 2m, ... capped at
+// an hour, with ±20% jitter so retries from a burst spread out
+export function backoff(attempts: number, random = Math.random) {
+  const delay = Math.min(MAX_BACKOFF_MS, BASE_BACKOFF_MS * 2 ** (attempts - 1))
+  return Math.round(delay * (0.8 + 0.4 * random()))
+}
+
+async function deliver(job: ContactJob, transport: ContactTransport) {
+  const pendingFile = path.join(PENDING_DIR, `${job.id}.json`)
+  try {
+    await transport.send(job.message, job.id)
+  } catch (error) {
+    const attempts = job.attempts + 1
+    const failed: ContactJob = {
+      ...job,
+      attempts,
+      lastError: error instanceof Error ? error.message : String(error),
+      nextAttemptAt: new Date(Date.now() + backoff(attempts)).toISOString(),
+    }
+    if (attempts >= MAX_ATTEMPTS) {
+      await writeJob(FAILED_DIR, failed)
+      await fs.unlink(pendingFile)
+      console.error(`Contact message ${job.id} failed after ${attempts} attempts:`, failed.lastError)
+    } else {
+      await writeJob(PENDING_DIR, failed)
+    }
+    return false
+  }
+
+  await writeJob(SENT_DIR, { ...job, attempts: job.attempts + 1, sentAt: new Date().toISOString() })
+  await fs.unlink(pendingFile)
+  return true
+}
+
+async function pruneSent(now: number) {
+  for (const name of await fs.readdir(SENT_DIR)) {
+    if (!name.endsWith('.json')) continue
+    const file = path.join(SENT_DIR, name)
+    const job = await readJob(file)
+    if (job?.sentAt && now - Date.parse(job.sentAt) > DEDUPE_WINDOW_MS) await fs.unlink(file)
+  }
+}
+
+async function drain(transport: ContactTransport) {
+  await ensureDirs()
+  const now = Date.now()
+  let sent = 0
+  for (const name of (await fs.readdir(PENDING_DIR)).filter(n => n.endsWith('.json')).sort()) {
+    const job = await readJob(path.join(PENDING_DIR, name))
+    if (!job || Date.parse(job.nextAttemptAt) > now) continue
+    if (await deliver(job, transport)) sent += 1
+  }
+  await pruneSent(now)
+  return sent
+}
+
+// Deliver every pending message that is due. Returns how many were sent.
+export function processQueue(transport: ContactTransport = defaultTransport()) {
+  return withWorkerLock(() => withStorage('Contact', DATA_DIR, 'CONTACT_DATA_DIR', () => drain(transport)))
+}
+
+let transport: ContactTransport | null = null
+function defaultTransport() {
+  transport ??= transportFromEnv(DATA_DIR)
+  return transport
+}
+
+let worker: ReturnType<typeof setInterval> | null = null
+
+// Polls for due messages in the background. Called once at server start
+// (instrumentation.ts); messages left pending by a previous process are
+// picked up on the first pass.
+export function startContactWorker(interval = POLL_INTERVAL_MS) {
+  if (worker) return
+  const run = () => processQueue().catch(error => console.error('Contact queue error:', error))
+  worker = setInterval(run, interval)
+  worker.unref?.()
+  run()
+}
+
+let kickQueued = false
+
+// Deliver right away instead of waiting for the next poll. A burst of
+// submissions queues at most one extra pass behind the one running, which
+// picks up every message written before it starts.
+export function kickContactWorker() {
+  if (kickQueued) return
+  kickQueued = true
+  withWorkerLock(() => {
+    kickQueued = false
+    return drain(defaultTransport())
+  }).catch(error => console.error('Contact queue error:', error))
+}
@@ -0,0 +1,13 @@
+import * as z from 'zod'
+
+// Shared by ContactModal and /api/contact so both reject the same input
+export const contactFormSchema = z.object({
+  name: z.string().min(2, 'Name must be at least 2 characters').max(50, 'Name must be less than 50 characters'),
+  email: z.string().email('Please enter a valid email address'),
+  subject: z.string().min(5, 'Subject must be at least 5 characters').max(100, 'Subject must be less than 100 characters'),
+  message: z.string().min(10, 'Message must be at least 10 characters').max(1000, 'Message must be less than 1000 characters'),
+  // Honeypot field for spam prevention
+  website: z.string().max(0, 'Invalid field'),
+})
+
+export type ContactFormData = z.infer<typeof contactFormSchema>
@@ -0,0 +1,77 @@
+// Delivery backends for queued contact messages.
+//
+// The queue only needs `send()` to resolve on success and throw on a
+// failure worth retrying. No mail provider is configured yet, so the default
+// transport is an SMTP stand-in that drops each message as an RFC 822 .eml
+// file into a local outbox, where it can be opened in any mail client. A real
+// provider plugs in by adding a transport here and selecting it with
+// CONTACT_TRANSPORT.
+
+import { promises as fs } from 'fs'
+import path from 'path'
+import type { ContactFormData } from '@/lib/contact-schema'
+
+export type ContactMessage = Omit<ContactFormData, 'website'>
+
+export interface ContactTransport {
+  name: string
+  send(message: ContactMessage, id: string): Promise<void>
+}
+
+const CONTACT_TO = process.env.CONTACT_TO || 'laxmideepak2023@gmail.com'
+const CONTACT_FROM = process.env.CONTACT_FROM || 'portfolio@localhost'
+
+// Header values must not be able to inject extra headers
+function headerValue(value: string) {
+  return value.replace(/[\r\n]+/g, ' ').trim()
+}
+
+export function toEml(message: ContactMessage, id: string, date = new Date()) {
+  return [
+    `From: ${CONTACT_FROM}`,
+    `To: ${CONTACT_TO}`,
+    `Reply-To: ${headerValue(message.name)} <${headerValue(message.email)}>`,
+    `Subject: ${headerValue(message.subject)}`,
+    `Date: ${date.toUTCString()}`,
+    `Message-ID: <${id}@portfolio.local>`,
+    'MIME-Version: 1.0',
+    'Content-Type: text/plain; charset=utf-8',
+    'Content-Transfer-Encoding: 8bit',
+    '',
+    message.message.replace(/\r?\n/g, '\r\n'),
+    '',
+  ].join('\r\n')
+}
+
+export function outboxTransport(dir: string): ContactTransport {
+  return {
+    name: 'outbox',
+    async send(message, id) {
+      await fs.mkdir(dir, { recursive: true })
+      // Named after the job id, so a retry after a crash overwrites rather
+      // than duplicates
+      const file = path.join(dir, `${id}.eml`)
+      const tmp = `${file}.${process.pid}.tmp`
+      await fs.writeFile(tmp, toEml(message, id))
+      await fs.rename(tmp, file)
+    },
+  }
+}
+
+export const consoleTransport: ContactTransport = {
+  name: 'console',
+  async send(message, id) {
+    console.log('Contact message:', { id, ...message })
+  },
+}
+
+export function transportFromEnv(dataDir: string): ContactTransport {
+  switch (process.env.CONTACT_TRANSPORT || 'outbox') {
+    case 'console':
+      return consoleTransport
+    case 'outbox':
+      return outboxTransport(path.join(dataDir, 'outbox'))
+    default:
+      throw new Error(`Unknown CONTACT_TRANSPORT: ${process.env.CONTACT_TRANSPORT}`)
+  }
+}
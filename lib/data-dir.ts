@@ -0,0 +1,63 @@
+// Where the file-backed stores (analytics events, contact queue) keep data.
+//
+// Each store takes its own override (ANALYTICS_DATA_DIR, CONTACT_DATA_DIR),
+// then DATA_DIR as a root shared by both. Without either it is .data/ in the
+// working directory, unless that cannot be written to (read-only images,
+// serverless functions): then the OS temp directory is used, with a warning,
+// since files there do not outlive the instance.
+
+import { accessSync, constants, existsSync } from 'fs'
+import os from 'os'
+import path from 'path'
+
+// Errors that mean the directory itself is unusable, not a one-off failure
+const UNWRITABLE = new Set(['EROFS', 'EACCES', 'EPERM', 'ENOSPC'])
+
+let defaultRoot: string | null = null
+
+function writable(dir: string) {
+  try {
+    accessSync(dir, constants.W_OK)
+    return true
+  } catch {
+    return false
+  }
+}
+
+function resolveDefaultRoot() {
+  const local = path.join(process.cwd(), '.data')
+  // .data/ may not exist yet; then it is created in the working directory
+  if (writable(existsSync(local) ? local : process.cwd())) return local
+
+  const fallback = path.join(os.tmpdir(), 'portfolio-data')
+  console.warn(`${local} is not writable; storing data in ${fallback}, which is not persistent. ` +
+    'Set DATA_DIR to a writable, persistent directory.')
+  return fallback
+}
+
+// Directory for the store `name`, e.g. dataDir('analytics', process.env.ANALYTICS_DATA_DIR)
+export function dataDir(name: string, override?: string) {
+  if (override) return override
+  if (process.env.DATA_DIR) return path.join(process.env.DATA_DIR, name)
+  defaultRoot ??= resolveDefaultRoot()
+  return path.join(defaultRoot, name)
+}
+
+export class StorageError extends Error {
+  constructor(store: string, public dir: string, envVar: string, cause: NodeJS.ErrnoException) {
+    super(`${store} store at ${dir} is not writable (${cause.code}); ` +
+      `set ${envVar} or DATA_DIR to a writable directory`, { cause })
+  }
+}
+
+// Rethrows filesystem errors that mean `dir` cannot be used as a
+// StorageError naming the directory and the setting to change
+export async function withStorage<T>(store: string, dir: string, envVar: string, fn: () => Promise<T>) {
+  try {
+    return await fn()
+  } catch (error) {
+    const code = (error as NodeJS.ErrnoException)?.code
+    if (code && UNWRITABLE.has(code)) throw new StorageError(store, dir, envVar, error as NodeJS.ErrnoException)
+    throw error
+  }
+}
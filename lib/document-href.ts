@@ -0,0 +1,11 @@
+// Content-hashed PDF URLs for client components, from the slim map written
+// by scripts/pdf-assets.mjs; the full manifest stays on the server.
+
+import documentHrefs from '@/lib/document-hrefs.json'
+
+const hrefs = documentHrefs as Record<string, string>
+
+// The cacheable URL for a PDF, or the original path if it is not in the manifest
+export function documentHref(src: string) {
+  return hrefs[src] ?? src
+}
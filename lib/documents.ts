@@ -0,0 +1,29 @@
+// Lookups into the manifest written by scripts/pdf-assets.mjs.
+
+import documentManifest from '@/lib/document-manifest.json'
+import type { ManifestImage } from '@/lib/images'
+
+export interface ManifestDocument {
+  // Content-hashed URL served by app/documents/[file]/route.ts
+  href: string
+  // Path of the original under public/
+  file: string
+  bytes: number
+  sha256: string
+  // First page, when a renderer was available at build time
+  preview: ManifestImage | null
+}
+
+const manifest = documentManifest as Record<string, ManifestDocument>
+
+// `src` is the original public path, e.g. "/certificates/bcg-genai-job-simulation.pdf"
+export function getDocument(src: string): ManifestDocument | undefined {
+  return manifest[src]
+}
+
+export { documentHref } from '@/lib/document-href'
+
+// Reverse lookup for the route handler: "bcg-genai-job-simulation-cc29d8bc40.pdf"
+export function documentByFileName(name: string): ManifestDocument | undefined {
+  return Object.values(manifest).find(doc => doc.href === `/documents/${name}`)
+}
@@ -0,0 +1,88 @@
+// Static file responses with validators and byte ranges.
+//
+// Used for content-hashed URLs, where the hash in the name pins the bytes:
+// the ETag is strong, and the response can be cached for a year as
+// immutable. Range requests are answered with 206 so PDF viewers can fetch
+// the pages they show first. A single range is supported. Multi-range
+// requests get the whole file, which HTTP allows.
+
+import { createReadStream, promises as fs } from 'fs'
+import { Readable } from 'stream'
+import { NextRequest } from 'next/server'
+
+export interface FileResponseOptions {
+  path: string
+  etag: string
+  contentType: string
+  // Name offered when the file is saved
+  fileName?: string
+  cacheControl?: string
+}
+
+const IMMUTABLE = 'public, max-age=31536000, immutable'
+
+// [start, end] inclusive, null for a header we ignore, or 'unsatisfiable'
+export function parseRange(header: string | null, size: number): [number, number] | null | 'unsatisfiable' {
+  const match = header?.match(/^bytes=(\d*)-(\d*)$/)
+  if (!match || (!match[1] && !match[2])) return null
+
+  let start: number
+  let end: number
+  if (!match[1]) {
+    // Suffix range: the last N bytes
+    const length = Number(match[2])
+    if (length === 0) return 'unsatisfiable'
+    start = Math.max(0, size - length)
+    end = size - 1
+  } else {
+    start = Number(match[1])
+    // A last position before the first makes the range-spec invalid, which
+    // RFC 9110 says to ignore rather than reject
+    if (match[2] && Number(match[2]) < start) return null
+    end = match[2] ? Math.min(Number(match[2]), size - 1) : size - 1
+  }
+  if (start >= size) return 'unsatisfiable'
+  return [start, end]
+}
+
+function matchesEtag(header: string | null, etag: string) {
+  if (!header) return false
+  return header.split(',').some(tag => {
+    const value = tag.trim()
+    return value === '*' || value === etag || value === `W/${etag}`
+  })
+}
+
+export async function fileResponse(request: NextRequest, options: FileResponseOptions) {
+  const { size } = await fs.stat(options.path)
+  const headers = new Headers({
+    'Accept-Ranges': 'bytes',
+    'Cache-Control': options.cacheControl ?? IMMUTABLE,
+    'Content-Type': options.contentType,
+    ETag: options.etag,
+  })
+  if (options.fileName) headers.set('Content-Disposition', `inline; filename="${options.fileName}"`)
+
+  if (matchesEtag(request.headers.get('if-none-match'), options.etag)) {
+    return new Response(null, { status: 304, headers })
+  }
+
+  // If-Range with a different ETag means the client's partial copy is stale,
+  // so it gets the whole file
+  const ifRange = request.headers.get('if-range')
+  const range = ifRange && ifRange !== options.etag ? null : parseRange(request.headers.get('range'), size)
+
+  if (range === 'unsatisfiable') {
+    headers.set('Content-Range', `bytes */${size}`)
+    return new Response(null, { status: 416, headers })
+  }
+
+  const [start, end] = range ?? [0, size - 1]
+  headers.set('Content-Length', String(end - start + 1))
+  if (range) headers.set('Content-Range', `bytes ${start}-${end}/${size}`)
+
+  const body = request.method === 'HEAD' || size === 0
+    ? null
+    : Readable.toWeb(createReadStream(options.path, { start, end })) as ReadableStream
+  return new Response(body, { status: range ? 206 : 200, headers })
+}
@@ -0,0 +1,19 @@
+// next/image loader (next.config.mjs `images.loaderFile`). Serves the
+// prebuilt WebP variant closest to the requested width instead of resizing
+// on the server; images missing from the map are served as they are.
+//
+// This ships to the browser, so it reads the slim width -> URL map rather
+// than the full image manifest with its placeholders.
+
+import imageWidths from '@/lib/image-widths.json'
+
+const widthMap = imageWidths as Record<string, Record<string, string>>
+
+export default function imageLoader({ src, width }: { src: string; width: number; quality?: number }) {
+  const variants = widthMap[src]
+  if (!variants) return src
+  // Smallest variant at least `width` wide, or the largest there is
+  const widths = Object.keys(variants).map(Number).sort((a, b) => a - b)
+  const best = widths.find(w => w >= width) ?? widths[widths.length - 1]
+  return best === undefined ? src : variants[best]
+}
@@ -0,0 +1,40 @@
+// Lookups into the manifest written by scripts/optimize-images.mjs.
+
+import imageManifest from '@/lib/image-manifest.json'
+
+export interface ImageVariant {
+  width: number
+  src: string
+  bytes: number
+}
+
+export interface ManifestImage {
+  width: number
+  height: number
+  bytes: number
+  hash: string
+  blurDataURL: string
+  // avif, webp and the jpeg or png fallback
+  variants: Record<string, ImageVariant[]>
+}
+
+const manifest = imageManifest as Record<string, ManifestImage>
+
+// `src` as used in the app, e.g. "/profile.jpg"; undefined if it was not
+// processed (remote images, or the script has not run yet)
+export function getImage(src: string): ManifestImage | undefined {
+  return manifest[src]
+}
+
+// Smallest variant at least `width` wide, or the largest there is
+export function pickVariant(variants: ImageVariant[], width: number) {
+  return variants.find(variant => variant.width >= width) ?? variants[variants.length - 1]
+}
+
+export function srcSet(variants: ImageVariant[]) {
+  return variants.map(variant => `${variant.src} ${variant.width}w`).join(', ')
+}
+
+export function fallbackVariants(image: ManifestImage) {
+  return image.variants.jpeg ?? image.variants.png
+}
@@ -0,0 +1,6 @@
+// Animation features for <LazyMotion>, split into their own chunk so the
+// initial bundle only carries the lightweight `m` components. Nothing here
+// uses layout animations or drag, so domAnimation is enough.
+import { domAnimation } from 'framer-motion'
+
+export default domAnimation
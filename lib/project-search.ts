@@ -0,0 +1,112 @@
+// Prefix search over the /work project cards.
+//
+// The index is built on the server from the project summaries and shipped to
+// the client as plain JSON: a sorted term list plus, for each term, the
+// projects containing it and the weight of the best field it appears in.
+// Each query token is looked up by binary search over the sorted terms, so
+// typing "tens" matches "tensorflow" without rescanning any text.
+
+import type { ProjectSummary } from '@/lib/projects'
+
+export interface SearchIndex {
+  // Sorted, unique
+  terms: string[]
+  // postings[i] holds [projectIndex, weight] pairs for terms[i]
+  postings: [number, number][][]
+}
+
+// A match in the title counts more than one buried in the description
+const FIELD_WEIGHTS = {
+  title: 5,
+  technologies: 3,
+  category: 2,
+  highlights: 1,
+  description: 1,
+} as const
+
+export function tokenize(text: string): string[] {
+  return text.toLowerCase().match(/[\p{L}\p{N}]+/gu) ?? []
+}
+
+export function buildSearchIndex(projects: readonly ProjectSummary[]): SearchIndex {
+  const weights = new Map<string, Map<number, number>>()
+
+  const add = (text: string, weight: number, projectIndex: number) => {
+    for (const term of tokenize(text)) {
+      let posting = weights.get(term)
+      if (!posting) {
+        posting = new Map()
+        weights.set(term, posting)
+      }
+      posting.set(projectIndex, Math.max(posting.get(projectIndex) ?? 0, weight))
+    }
+  }
+
+  projects.forEach((project, i) => {
+    add(project.title, FIELD_WEIGHTS.title, i)
+    project.technologies.forEach(tech => add(tech, FIELD_WEIGHTS.technologies, i))
+    add(project.category, FIELD_WEIGHTS.category, i)
+    project.highlights?.forEach(highlight => add(highlight, FIELD_WEIGHTS.highlights, i))
+    add(project.description, FIELD_WEIGHTS.description, i)
+  })
+
+  const terms = Array.from(weights.keys()).sort()
+  return {
+    terms,
+    postings: terms.map(term => Array.from(weights.get(term)!)),
+  }
+}
+
+// First index whose term is >= prefix
+function lowerBound(terms: string[], prefix: string) {
+  let lo = 0
+  let hi = terms.length
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1
+    if (terms[mid] < prefix) lo = mid + 1
+    else hi = mid
+  }
+  return lo
+}
+
+// Best weight per project over every term starting with `prefix`. An exact
+// term match scores a little higher than a longer completion.
+function matchPrefix(index: SearchIndex, prefix: string) {
+  const scores = new Map<number, number>()
+  for (let i = lowerBound(index.terms, prefix); i < index.terms.length; i++) {
+    const term = index.terms[i]
+    if (!term.startsWith(prefix)) break
+    const boost = term === prefix ? 1.5 : 1
+    for (const [projectIndex, weight] of index.postings[i]) {
+      scores.set(projectIndex, Math.max(scores.get(projectIndex) ?? 0, weight * boost))
+    }
+  }
+  return scores
+}
+
+// Indexes of the projects matching every token of `query`, best first. Ties
+// keep the original project order. Returns null for an empty query.
+export function searchProjects(index: SearchIndex, query: string): number[] | null {
+  const tokens = Array.from(new Set(tokenize(query)))
+  if (tokens.length === 0) return null
+
+  let totals: Map<number, number> | null = null
+  for (const token of tokens) {
+    const scores = matchPrefix(index, token)
+    if (totals === null) {
+      totals = scores
+    } else {
+      const next = new Map<number, number>()
+      for (const [projectIndex, total] of totals) {
+        const score = scores.get(projectIndex)
+        if (score !== undefined) next.set(projectIndex, total + score)
+      }
+      totals = next
+    }
+    if (totals.size === 0) break
+  }
+
+  return Array.from(totals!)
+    .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+    .map(([projectIndex]) => projectIndex)
+}
@@ -0,0 +1,131 @@
+// Project content shared by /, /work, /work/[slug] and the sitemap.
+//
+// The records live in content/projects.json. Everything below is computed once
+// when the module is first imported, so at build time, and pages look projects
+// up in these indexes instead of scanning the array again.
+
+import data from '@/content/projects.json'
+
+export interface ProjectKpis {
+  accuracy?: string
+  performance?: string
+  users?: string
+  timeSaved?: string
+}
+
+export interface Project {
+  slug: string
+  title: string
+  description: string
+  category: string
+  technologies: string[]
+  link?: string
+  githubUrl?: string
+  image?: string
+  highlights?: string[]
+  duration?: string
+  teamSize?: string
+  problem?: string
+  approach?: string
+  result?: string
+  kpis?: ProjectKpis
+  architecture?: string
+  nextSteps?: string[]
+}
+
+// The fields a project card renders. Only these are passed to client
+// components, so the case-study text stays out of the client bundles.
+export type ProjectSummary = Pick<
+  Project,
+  'slug' | 'title' | 'description' | 'category' | 'technologies' | 'link' | 'githubUrl' | 'image' | 'highlights'
+>
+
+export interface CategoryCount {
+  category: string
+  count: number
+}
+
+export interface TechnologyCount {
+  // Lowercased key into ProjectFilterIndex.technologies
+  key: string
+  // As first written in the content, e.g. "NumPy"
+  technology: string
+  count: number
+}
+
+// Positions in projectSummaries per category and per lowercased technology,
+// so /work filters by lookup instead of scanning every project
+export interface ProjectFilterIndex {
+  categories: Record<string, number[]>
+  technologies: Record<string, number[]>
+}
+
+export const projects: readonly Project[] = data as Project[]
+
+const bySlug = new Map<string, Project>()
+const byCategory = new Map<string, Project[]>()
+const byTechnology = new Map<string, Project[]>()
+const technologyNames = new Map<string, string>()
+
+for (const project of projects) {
+  if (bySlug.has(project.slug)) {
+    throw new Error(`Duplicate project slug in content/projects.json: ${project.slug}`)
+  }
+  bySlug.set(project.slug, project)
+
+  const inCategory = byCategory.get(project.category)
+  if (inCategory) inCategory.push(project)
+  else byCategory.set(project.category, [project])
+
+  for (const tech of project.technologies) {
+    const key = tech.toLowerCase()
+    if (!technologyNames.has(key)) technologyNames.set(key, tech)
+    const withTech = byTechnology.get(key)
+    if (!withTech) byTechnology.set(key, [project])
+    else if (withTech[withTech.length - 1] !== project) withTech.push(project)
+  }
+}
+
+// In order of first appearance, which is the order the filters are shown in
+export const categoryCounts: readonly CategoryCount[] = Array.from(byCategory, ([category, list]) => ({
+  category,
+  count: list.length,
+}))
+
+// Most used first
+export const technologyCounts: readonly TechnologyCount[] = Array.from(byTechnology, ([key, list]) => ({
+  key,
+  technology: technologyNames.get(key)!,
+  count: list.length,
+})).sort((a, b) => b.count - a.count || a.technology.localeCompare(b.technology))
+
+export const projectSlugs: readonly string[] = Array.from(bySlug.keys())
+
+export function getProject(slug: string): Project | undefined {
+  return bySlug.get(slug)
+}
+
+export function getProjectsByCategory(category: string): readonly Project[] {
+  return byCategory.get(category) ?? []
+}
+
+// Technology names are matched case-insensitively ("numpy" finds "NumPy")
+export function getProjectsByTechnology(technology: string): readonly Project[] {
+  return byTechnology.get(technology.toLowerCase()) ?? []
+}
+
+export function toSummary(project: Project): ProjectSummary {
+  const { slug, title, description, category, technologies, link, githubUrl, image, highlights } = project
+  return { slug, title, description, category, technologies, link, githubUrl, image, highlights }
+}
+
+export const projectSummaries: readonly ProjectSummary[] = projects.map(toSummary)
+
+const positions = new Map(projects.map((project, i) => [project, i]))
+const toPositions = (index: Map<string, Project[]>) =>
+  Object.fromEntries(Array.from(index, ([key, list]) => [key, list.map(project => positions.get(project)!)]))
+
+export const projectFilterIndex: ProjectFilterIndex = {
+  categories: toPositions(byCategory),
+  technologies: toPositions(byTechnology),
+}
@@ -0,0 +1,150 @@
+// Per-client token buckets and body size limits for the API routes.
+//
+// Each (client IP, route) pair gets a bucket holding up to `capacity` tokens
+// that refills at `refillPerSecond`. A request spends one token; an empty
+// bucket means 429 with a Retry-After of when the next token arrives.
+// Buckets live in memory, so limits apply per server instance.
+//
+// The client address is never the leftmost X-Forwarded-For entry, which the
+// client writes itself. In order of preference it comes from:
+// - CLIENT_IP_HEADER, a header the hosting platform sets (cf-connecting-ip, ...)
+// - with TRUSTED_PROXY_COUNT set, the X-Forwarded-For entry appended by the
+//   outermost of that many reverse proxies
+// - otherwise x-vercel-forwarded-for, x-real-ip, or the last X-Forwarded-For
+//   hop, i.e. the address the nearest proxy saw
+// A request with no address at all is not limited, and a warning is logged
+// once, rather than pooling every such visitor into one bucket.
+//
+// Bodies are read as a stream and abandoned as soon as they pass the cap,
+// so an oversized upload is never buffered in full, whatever Content-Length
+// claims.
+
+import { NextRequest, NextResponse } from 'next/server'
+
+export interface RateLimitOptions {
+  route: string
+  capacity: number
+  refillPerSecond: number
+}
+
+interface Bucket {
+  tokens: number
+  updatedAt: number
+}
+
+// Oldest buckets are dropped past this, so a client with many real
+// addresses cannot grow the map without bound
+const MAX_BUCKETS = 10_000
+
+const CLIENT_IP_HEADER = process.env.CLIENT_IP_HEADER?.toLowerCase()
+const TRUSTED_PROXY_COUNT = Math.max(0, Math.floor(Number(process.env.TRUSTED_PROXY_COUNT) || 0))
+
+// Set by Vercel and by the usual nginx setups respectively
+const PLATFORM_IP_HEADERS = ['x-vercel-forwarded-for', 'x-real-ip']
+
+const buckets = new Map<string, Bucket>()
+
+let warnedUnknownClient = false
+
+function firstValue(header: string | null) {
+  return header?.split(',')[0].trim() || null
+}
+
+// The client's address, or null if the request carries none
+export function clientIp(request: NextRequest, trustedProxies = TRUSTED_PROXY_COUNT, ipHeader = CLIENT_IP_HEADER) {
+  if (ipHeader) return firstValue(request.headers.get(ipHeader))
+
+  // Each proxy appends the address it received the request from, so the
+  // outermost trusted proxy's entry is `trustedProxies` from the right
+  const hops = (request.headers.get('x-forwarded-for') ?? '').split(',').map(hop => hop.trim()).filter(Boolean)
+  if (trustedProxies > 0) return hops[hops.length - trustedProxies] || null
+
+  for (const header of PLATFORM_IP_HEADERS) {
+    const ip = firstValue(request.headers.get(header))
+    if (ip) return ip
+  }
+  return hops[hops.length - 1] || null
+}
+
+// Seconds until a token is available, or 0 if the request may proceed
+export function takeToken(key: string, { capacity, refillPerSecond }: Omit<RateLimitOptions, 'route'>, now = Date.now()) {
+  let bucket = buckets.get(key)
+  if (bucket) {
+    bucket.tokens = Math.min(capacity, bucket.tokens + ((now - bucket.updatedAt) / 1000) * refillPerSecond)
+    bucket.updatedAt = now
+    // Re-insert so Map order stays least recently used first
+    buckets.delete(key)
+  } else {
+    bucket = { tokens: capacity, updatedAt: now }
+  }
+  buckets.set(key, bucket)
+  if (buckets.size > MAX_BUCKETS) buckets.delete(buckets.keys().next().value!)
+
+  if (bucket.tokens >= 1) {
+    bucket.tokens -= 1
+    return 0
+  }
+  return Math.ceil((1 - bucket.tokens) / refillPerSecond)
+}
+
+// Returns a 429 response when the client is over its limit, otherwise null
+export function rateLimit(request: NextRequest, options: RateLimitOptions) {
+  const ip = clientIp(request)
+  if (!ip) {
+    if (!warnedUnknownClient) {
+      warnedUnknownClient = true
+      console.warn('rate-limit: request without a client address, not limiting; ' +
+        'set CLIENT_IP_HEADER or TRUSTED_PROXY_COUNT for this deployment')
+    }
+    return null
+  }
+
+  const retryAfter = takeToken(`${ip}|${options.route}`, options)
+  if (retryAfter === 0) return null
+
+  return NextResponse.json(
+    { error: 'Too many requests', retryAfter },
+    { status: 429, headers: { 'Retry-After': String(retryAfter) } }
+  )
+}
+
+export class PayloadTooLargeError extends Error {
+  constructor(public limit: number) {
+    super(`Request body exceeds ${limit} bytes`)
+  }
+}
+
+export async function readJsonBody(request: NextRequest, maxBytes: number): Promise<unknown> {
+  const declared = Number(request.headers.get('content-length'))
+  if (declared > maxBytes) throw new PayloadTooLargeError(maxBytes)
+  if (!request.body) throw new SyntaxError('Empty request body')
+
+  const reader = request.body.getReader()
+  const chunks: Uint8Array[] = []
+  let received = 0
+  while (true) {
+    const { done, value } = await reader.read()
+    if (done) break
+    received += value.byteLength
+    if (received > maxBytes) {
+      await reader.cancel()
+      throw new PayloadTooLargeError(maxBytes)
+    }
+    chunks.push(value)
+  }
+
+  const body = new Uint8Array(received)
+  let offset = 0
+  for (const chunk of chunks) {
+    body.set(chunk, offset)
+    offset += chunk.byteLength
+  }
+  return JSON.parse(new TextDecoder().decode(body))
+}
+
+export function payloadTooLarge(error: PayloadTooLargeError) {
+  return NextResponse.json(
+    { error: error.message },
+    { status: 413 }
+  )
+}
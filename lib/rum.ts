@@ -0,0 +1,189 @@
+// Real-user Core Web Vitals, sent through the analytics queue.
+//
+// Uses the web-vitals attribution build so every sample says what caused it:
+// the LCP element and which phase was slow, the element whose shift
+// dominated CLS, and for INP the interaction target plus the long animation
+// frame script that blocked it. That is what ties a slow metric back to a
+// specific animation or component.
+//
+// Sampling is decided once per session (sessionStorage), so a sampled visitor
+// reports every page and metric and an unsampled one downloads nothing. Each
+// sample carries its sample rate so totals can be scaled back up.
+
+import type {
+  CLSMetricWithAttribution,
+  FCPMetricWithAttribution,
+  INPMetricWithAttribution,
+  LCPMetricWithAttribution,
+  MetricWithAttribution,
+  TTFBMetricWithAttribution,
+} from 'web-vitals/attribution'
+import { enqueue, flush } from '@/lib/analytics'
+
+const SAMPLE_RATE = clampRate(Number(process.env.NEXT_PUBLIC_RUM_SAMPLE_RATE ?? 1))
+const SESSION_KEY = 'rum-sampled'
+
+let started = false
+
+function clampRate(rate: number) {
+  return Number.isFinite(rate) ? Math.min(1, Math.max(0, rate)) : 1
+}
+
+function isSampled() {
+  try {
+    let decision = sessionStorage.getItem(SESSION_KEY)
+    if (decision === null) {
+      decision = Math.random() < SAMPLE_RATE ? '1' : '0'
+      sessionStorage.setItem(SESSION_KEY, decision)
+    }
+    return decision === '1'
+  } catch {
+    // Storage blocked: decide per page instead
+    return Math.random() < SAMPLE_RATE
+  }
+}
+
+// "/work/toy-search-engine" -> "/work/[slug]", so samples group by page type
+export function routeOf(pathname: string) {
+  if (/^\/work\/[^/]+\/?$/.test(pathname)) return '/work/[slug]'
+  return pathname.replace(/\/$/, '') || '/'
+}
+
+interface NavigatorWithHints extends Navigator {
+  deviceMemory?: number
+  connection?: { effectiveType?: string; saveData?: boolean }
+}
+
+// Form factor from the viewport and pointer, tier from memory and cores.
+// Low-tier devices are where the animations are most likely to hurt.
+export function deviceClass() {
+  const nav = navigator as NavigatorWithHints
+  const width = window.innerWidth
+  const coarse = window.matchMedia('(pointer: coarse)').matches
+  const formFactor = coarse && width < 768 ? 'mobile' : coarse || width < 1024 ? 'tablet' : 'desktop'
+
+  const memory = nav.deviceMemory ?? 8
+  const cores = nav.hardwareConcurrency ?? 8
+  const tier = memory <= 2 || cores <= 2 ? 'low' : memory <= 4 || cores <= 4 ? 'mid' : 'high'
+
+  return {
+    device: formFactor,
+    deviceTier: tier,
+    connection: nav.connection?.effectiveType,
+    saveData: nav.connection?.saveData || undefined,
+  }
+}
+
+const round = (value: number | undefined) => (value === undefined ? undefined : Math.round(value * 100) / 100)
+
+// Only the fields worth storing; the raw attribution holds DOM nodes and
+// entry objects that are large or do not serialize
+function summarize(metric: MetricWithAttribution): Record<string, unknown> {
+  switch (metric.name) {
+    case 'LCP': {
+      const a = (metric as LCPMetricWithAttribution).attribution
+      return {
+        target: a.target,
+        resource: a.url,
+        timeToFirstByte: round(a.timeToFirstByte),
+        resourceLoadDelay: round(a.resourceLoadDelay),
+        resourceLoadDuration: round(a.resourceLoadDuration),
+        elementRenderDelay: round(a.elementRenderDelay),
+      }
+    }
+    case 'CLS': {
+      const a = (metric as CLSMetricWithAttribution).attribution
+      return {
+        target: a.largestShiftTarget,
+        largestShiftTime: round(a.largestShiftTime),
+        largestShiftValue: a.largestShiftValue,
+        loadState: a.loadState,
+      }
+    }
+    case 'INP': {
+      const a = (metric as INPMetricWithAttribution).attribution
+      const script = a.longestScript
+      return {
+        target: a.interactionTarget,
+        interactionType: a.interactionType,
+        inputDelay: round(a.inputDelay),
+        processingDuration: round(a.processingDuration),
+        presentationDelay: round(a.presentationDelay),
+        loadState: a.loadState,
+        // Long animation frames overlapping the interaction
+        loafCount: a.longAnimationFrameEntries.length,
+        totalScriptDuration: round(a.totalScriptDuration),
+        totalStyleAndLayoutDuration: round(a.totalStyleAndLayoutDuration),
+        totalPaintDuration: round(a.totalPaintDuration),
+        longestScript: script && {
+          source: script.entry.sourceURL,
+          function: script.entry.sourceFunctionName,
+          invoker: script.entry.invoker,
+          subpart: script.subpart,
+          duration: round(script.intersectingDuration),
+        },
+      }
+    }
+    case 'FCP': {
+      const a = (metric as FCPMetricWithAttribution).attribution
+      return {
+        timeToFirstByte: round(a.timeToFirstByte),
+        firstByteToFCP: round(a.firstByteToFCP),
+        loadState: a.loadState,
+      }
+    }
+    case 'TTFB': {
+      const a = (metric as TTFBMetricWithAttribution).attribution
+      return {
+        waitingDuration: round(a.waitingDuration),
+        cacheDuration: round(a.cacheDuration),
+        dnsDuration: round(a.dnsDuration),
+        connectionDuration: round(a.connectionDuration),
+        requestDuration: round(a.requestDuration),
+      }
+    }
+    default:
+      return {}
+  }
+}
+
+// Call once per page load, from the root layout
+export async function startRum() {
+  if (started || typeof window === 'undefined') return
+  started = true
+  if (!isSampled()) return
+
+  // Tagged with the page that loaded: web-vitals measures the hard
+  // navigation, even when CLS and INP are reported after client-side routing
+  const url = window.location.href
+  const tags = {
+    route: routeOf(window.location.pathname),
+    ...deviceClass(),
+    sampleRate: SAMPLE_RATE,
+  }
+
+  const report = (metric: MetricWithAttribution) => {
+    enqueue({
+      type: 'web-vital',
+      url,
+      name: metric.name,
+      value: metric.value,
+      rating: metric.rating,
+      delta: metric.delta,
+      id: metric.id,
+      navigationType: metric.navigationType,
+      ...tags,
+      attribution: summarize(metric),
+    })
+    // CLS and INP are final when the page is hidden, which may be after the
+    // queue's own page-hide flush has already run
+    if (document.visibilityState === 'hidden') flush({ beacon: true })
+  }
+
+  const { onCLS, onFCP, onINP, onLCP, onTTFB } = await import('web-vitals/attribution')
+  onCLS(report)
+  onFCP(report)
+  onINP(report)
+  onLCP(report)
+  onTTFB(report)
+}
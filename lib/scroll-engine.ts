@@ -0,0 +1,79 @@
+// One scroll listener for the whole page.
+//
+// Components used to call useScroll() or add their own window scroll
+// listener, so a single scroll event fanned out into several handlers, and
+// some of them set React state. Here the listener only schedules a sample on
+// the next animation frame. That sample updates shared motion values, which
+// framer-motion applies straight to the DOM, so continuous scrolling causes
+// no React commits.
+
+import { useEffect } from 'react'
+import { motionValue, type MotionValue } from 'framer-motion'
+
+// Pixels from the top of the page
+export const scrollY = motionValue(0)
+// 0 at the top of the page, 1 at the bottom
+export const scrollYProgress = motionValue(0)
+
+let subscribers = 0
+let frame: number | null = null
+
+function sample() {
+  frame = null
+  const y = window.scrollY
+  const max = document.documentElement.scrollHeight - window.innerHeight
+  scrollY.set(y)
+  scrollYProgress.set(max > 0 ? Math.min(1, Math.max(0, y / max)) : 0)
+}
+
+function schedule() {
+  if (frame === null) frame = requestAnimationFrame(sample)
+}
+
+function start() {
+  window.addEventListener('scroll', schedule, { passive: true })
+  window.addEventListener('resize', schedule)
+  sample()
+}
+
+function stop() {
+  window.removeEventListener('scroll', schedule)
+  window.removeEventListener('resize', schedule)
+  if (frame !== null) cancelAnimationFrame(frame)
+  frame = null
+}
+
+// Keeps the engine running while at least one component is mounted
+export function useScrollEngine() {
+  useEffect(() => {
+    if (subscribers++ === 0) start()
+    return () => {
+      if (--subscribers === 0) stop()
+    }
+  }, [])
+}
+
+// A motion value derived from scroll progress. Create it once at module level
+// and share it between components instead of one useTransform per instance.
+export function deriveFromProgress(fn: (progress: number) => number): MotionValue<number> {
+  const value = motionValue(fn(scrollYProgress.get()))
+  scrollYProgress.on('change', progress => value.set(fn(progress)))
+  return value
+}
+
+// Calls `onChange` only when `scrollY > threshold` flips, without re-rendering
+export function useScrolledPast(threshold: number, onChange: (scrolled: boolean) => void) {
+  useScrollEngine()
+
+  useEffect(() => {
+    let scrolled = scrollY.get() > threshold
+    onChange(scrolled)
+    return scrollY.on('change', y => {
+      const next = y > threshold
+      if (next !== scrolled) {
+        scrolled = next
+        onChange(next)
+      }
+    })
+  }, [threshold, onChange])
+}
@@ -0,0 +1,66 @@
+// Viewport tracking for the home page sections.
+//
+// All sections share two IntersectionObservers instead of each animated
+// element watching itself:
+// - `nearby` fires when a section comes within a viewport of the screen, so
+//   its animations can be set up just before they are needed and dropped
+//   once it has scrolled away
+// - `middle` watches a 1px band across the middle of the viewport. The
+//   section crossing it gets data-active="true", which drives the active
+//   highlight in CSS without any React state.
+
+export type NearbyCallback = (near: boolean, entry: IntersectionObserverEntry) => void
+
+const NEARBY_MARGIN = '100% 0px 100% 0px'
+const MIDDLE_MARGIN = '-50% 0px -50% 0px'
+
+const callbacks = new Map<Element, NearbyCallback>()
+let nearby: IntersectionObserver | null = null
+let middle: IntersectionObserver | null = null
+let active: HTMLElement | null = null
+
+function setActive(el: HTMLElement | null) {
+  if (active === el) return
+  if (active) active.dataset.active = 'false'
+  active = el
+  if (active) active.dataset.active = 'true'
+}
+
+function observers() {
+  if (!nearby || !middle) {
+    nearby = new IntersectionObserver(
+      entries => entries.forEach(entry => callbacks.get(entry.target)?.(entry.isIntersecting, entry)),
+      { rootMargin: NEARBY_MARGIN }
+    )
+    middle = new IntersectionObserver(
+      entries => entries.forEach(entry => {
+        const target = entry.target as HTMLElement
+        if (entry.isIntersecting) setActive(target)
+        else if (active === target) setActive(null)
+      }),
+      { rootMargin: MIDDLE_MARGIN }
+    )
+  }
+  return { nearby, middle }
+}
+
+// True if the section is at least partly on screen right now, as opposed to
+// only inside the look-ahead margin
+export function isOnScreen(entry: IntersectionObserverEntry) {
+  const { top, bottom } = entry.boundingClientRect
+  return bottom > 0 && top < window.innerHeight
+}
+
+export function observeSection(el: HTMLElement, onNearby: NearbyCallback) {
+  const { nearby, middle } = observers()
+  callbacks.set(el, onNearby)
+  nearby.observe(el)
+  middle.observe(el)
+
+  return () => {
+    callbacks.delete(el)
+    nearby.unobserve(el)
+    middle.unobserve(el)
+    if (active === el) setActive(null)
+  }
+}
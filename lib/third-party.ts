@@ -0,0 +1,56 @@
+// Google Analytics without gtag.js on the critical path.
+//
+// gtag.js is loaded by components/ThirdPartyScripts.tsx with next/script's
+// lazyOnload strategy, i.e. after the load event when the browser is idle,
+// so it never competes with hydration. Until then calls only push onto
+// window.dataLayer, which gtag.js replays when it arrives. useAnalytics
+// forwards its page views and events here as well as to /api/analytics; page
+// views come from components/PageViewTracker.tsx in the root layout, so every
+// route reports them.
+
+import type { AnalyticsPayload } from '@/lib/analytics'
+
+declare global {
+  interface Window {
+    dataLayer?: unknown[]
+  }
+}
+
+export const GA_ID = process.env.NEXT_PUBLIC_GA_ID
+
+let initialized = false
+
+// Same queueing stub as Google's snippet. gtag.js only processes Arguments
+// objects, hence `arguments` rather than the rest array.
+function gtag(..._args: unknown[]) {
+  window.dataLayer = window.dataLayer || []
+  // eslint-disable-next-line prefer-rest-params
+  window.dataLayer.push(arguments)
+}
+
+function init() {
+  if (initialized) return
+  initialized = true
+  gtag('js', new Date())
+  // Page views are forwarded explicitly, including client-side navigations
+  gtag('config', GA_ID, { send_page_view: false })
+}
+
+export function forwardToThirdParty(payload: AnalyticsPayload) {
+  if (!GA_ID || typeof window === 'undefined') return
+  init()
+
+  if (payload.type === 'pageview') {
+    gtag('event', 'page_view', {
+      page_title: payload.page_title,
+      page_location: payload.page_location,
+      page_referrer: payload.page_referrer,
+    })
+  } else if (payload.type === 'event') {
+    gtag('event', payload.action || payload.event, {
+      event_category: payload.category,
+      event_label: payload.label,
+      value: payload.value,
+    })
+  }
+}
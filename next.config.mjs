@@ -6,11 +6,28 @@ const nextConfig = {
   typescript: {
     ignoreBuildErrors: true,
   },
+  // Source maps let scripts/bundle-budget.mjs attribute chunk bytes to npm
+  // packages; only emitted for `npm run build:analyze`
+  productionBrowserSourceMaps: process.env.BUNDLE_ANALYZE === '1',
+  // Variants are prebuilt by scripts/optimize-images.mjs; the loader maps
+  // next/image requests onto them instead of resizing at request time
   images: {
-    unoptimized: true,
+    loader: 'custom',
+    loaderFile: './lib/image-loader.ts',
   },
   async headers() {
     return [
+      {
+        // Content-hashed names from scripts/optimize-images.mjs and
+        // scripts/pdf-assets.mjs
+        source: "/:dir(_img|_previews)/:path*",
+        headers: [
+          {
+            key: "Cache-Control",
+            value: "public, max-age=31536000, immutable",
+          },
+        ],
+      },
       {
         source: "/(.*)",
         headers: [
@@ -18,10 +35,10 @@ const nextConfig = {
             key: "Content-Security-Policy",
             value: [
               "default-src 'self'",
-              "script-src 'self' 'unsafe-eval' 'unsafe-inline' https://api.mapbox.com",
+              "script-src 'self' 'unsafe-eval' 'unsafe-inline' https://api.mapbox.com https://www.googletagmanager.com",
               "style-src 'self' 'unsafe-inline' https://api.mapbox.com",
-              "img-src 'self' data: https://api.mapbox.com https://*.mapbox.com",
-              "connect-src 'self' https://api.mapbox.com https://*.mapbox.com",
+              "img-src 'self' data: https://api.mapbox.com https://*.mapbox.com https://*.google-analytics.com https://*.googletagmanager.com",
+              "connect-src 'self' https://api.mapbox.com https://*.mapbox.com https://*.google-analytics.com https://*.analytics.google.com https://*.googletagmanager.com",
               "frame-src 'self'",
             ].join("; "),
           },
@@ -0,0 +1,319 @@
+#!/usr/bin/env node
+// Per-route and per-package bundle sizes for a finished `next build`, checked
+// against bundle-budget.json.
+//
+// Reads only files under .next/ and uses Node's built-in zlib, so it works
+// offline and without extra dependencies.
+//
+// - Routes: every app router page gets the JS/CSS the browser downloads for
+//   it. That is the page's chunks plus those of each enclosing layout and the
+//   shared root files, counted once each. Polyfills are skipped since only
+//   legacy browsers load them.
+// - Packages: chunks built with source maps (`npm run build:analyze`) are
+//   attributed byte by byte to the npm package of each mapped source.
+//   Compressed package sizes are estimated from each chunk's own ratio.
+//
+// Each run is appended to a JSON history file. Sizes are printed with the
+// change since the previous entry. The exit code is 1 when any budget is
+// exceeded.
+//
+// Usage:
+//   node scripts/bundle-budget.mjs [--dir .next] [--budget bundle-budget.json]
+//     [--history .data/bundle-history.json] [--no-history] [--json report.json]
+
+import { execFileSync } from 'node:child_process'
+import { existsSync, mkdirSync, readFileSync, readdirSync, writeFileSync } from 'node:fs'
+import path from 'node:path'
+import { brotliCompressSync, constants, gzipSync } from 'node:zlib'
+
+const HISTORY_LIMIT = 100
+const METRICS = ['raw', 'gzip', 'brotli']
+
+function parseArgs(argv) {
+  const args = {
+    dir: '.next',
+    budget: 'bundle-budget.json',
+    history: path.join('.data', 'bundle-history.json'),
+    json: null,
+  }
+  for (let i = 0; i < argv.length; i++) {
+    const flag = argv[i]
+    if (flag === '--no-history') args.history = null
+    else if (['--dir', '--budget', '--history', '--json'].includes(flag)) args[flag.slice(2)] = argv[++i]
+    else if (flag === '--help' || flag === '-h') {
+      console.log('Usage: node scripts/bundle-budget.mjs [--dir .next] [--budget bundle-budget.json] ' +
+        '[--history .data/bundle-history.json] [--no-history] [--json report.json]')
+      process.exit(0)
+    } else {
+      throw new Error(`Unknown argument: ${flag}`)
+    }
+  }
+  return args
+}
+
+function readJson(file, fallback) {
+  if (!existsSync(file)) return fallback
+  return JSON.parse(readFileSync(file, 'utf8'))
+}
+
+// --- Sizes ------------------------------------------------------------------
+
+const sizeCache = new Map()
+
+function fileSizes(buildDir, file) {
+  if (!sizeCache.has(file)) {
+    const contents = readFileSync(path.join(buildDir, file))
+    sizeCache.set(file, {
+      raw: contents.length,
+      gzip: gzipSync(contents, { level: 9 }).length,
+      brotli: brotliCompressSync(contents, {
+        params: { [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY },
+      }).length,
+    })
+  }
+  return sizeCache.get(file)
+}
+
+function emptySizes() {
+  return { raw: 0, gzip: 0, brotli: 0 }
+}
+
+function addSizes(total, sizes, scale = 1) {
+  for (const metric of METRICS) total[metric] += sizes[metric] * scale
+  return total
+}
+
+function roundSizes(sizes) {
+  return Object.fromEntries(METRICS.map(metric => [metric, Math.round(sizes[metric])]))
+}
+
+// --- Routes -----------------------------------------------------------------
+
+// "/work/[slug]/page" -> "/work/[slug]"; route groups like "(site)" are not
+// part of the URL
+function routeName(entry) {
+  const dir = entry.slice(0, -'/page'.length)
+  const route = dir.split('/').filter(part => part && !/^\(.*\)$/.test(part)).join('/')
+  return `/${route}`
+}
+
+function routeFiles(buildDir) {
+  const appManifest = readJson(path.join(buildDir, 'app-build-manifest.json'), null)
+  const buildManifest = readJson(path.join(buildDir, 'build-manifest.json'), {})
+  if (!appManifest) {
+    throw new Error(`No app-build-manifest.json in ${buildDir}; run \`npm run build\` first`)
+  }
+
+  const entries = appManifest.pages || {}
+  const shared = buildManifest.rootMainFiles || []
+  const layouts = Object.keys(entries).filter(key => key.endsWith('/layout'))
+  const routes = {}
+
+  for (const entry of Object.keys(entries).filter(key => key.endsWith('/page'))) {
+    const dir = entry.slice(0, -'/page'.length)
+    const enclosing = layouts.filter(layout => {
+      const layoutDir = layout.slice(0, -'/layout'.length)
+      return dir === layoutDir || dir.startsWith(`${layoutDir}/`)
+    })
+    const files = new Set(shared)
+    for (const key of [...enclosing, entry]) entries[key].forEach(file => files.add(file))
+    routes[routeName(entry)] = [...files].filter(file => /\.(js|css)$/.test(file))
+  }
+  return routes
+}
+
+// --- Packages ---------------------------------------------------------------
+
+const BASE64 = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+const BASE64_VALUES = Object.fromEntries([...BASE64].map((char, i) => [char, i]))
+
+function decodeVlq(segment) {
+  const values = []
+  let value = 0
+  let shift = 0
+  for (const char of segment) {
+    const digit = BASE64_VALUES[char]
+    value += (digit & 31) << shift
+    if (digit & 32) {
+      shift += 5
+    } else {
+      values.push(value & 1 ? -(value >>> 1) : value >>> 1)
+      value = 0
+      shift = 0
+    }
+  }
+  return values
+}
+
+// "webpack://_N_E/./node_modules/@radix-ui/react-slot/dist/index.mjs" -> "@radix-ui/react-slot"
+function packageName(source) {
+  const marker = source.lastIndexOf('node_modules/')
+  if (marker === -1) {
+    return source.includes('webpack/runtime') || source.includes('webpack/bootstrap') ? '(webpack runtime)' : '(app)'
+  }
+  const parts = source.slice(marker + 'node_modules/'.length).split('/')
+  return parts[0].startsWith('@') ? `${parts[0]}/${parts[1]}` : parts[0]
+}
+
+// Raw bytes of `code` per package, from the chunk's source map. Bytes that
+// the map leaves unmapped stay with the chunk as "(unmapped)".
+function attributeChunk(code, map) {
+  const packages = {}
+  const add = (name, bytes) => { packages[name] = (packages[name] || 0) + bytes }
+  const names = map.sources.map(packageName)
+  const lines = code.split('\n')
+  let sourceIndex = 0
+
+  map.mappings.split(';').forEach((lineMappings, lineNumber) => {
+    const line = lines[lineNumber] ?? ''
+    const newline = lineNumber < lines.length - 1 ? 1 : 0
+    let column = 0
+    let mapped = 0
+    const segments = lineMappings ? lineMappings.split(',') : []
+    const decoded = segments.map(decodeVlq)
+    decoded.forEach((fields, i) => {
+      column += fields[0]
+      if (fields.length > 1) sourceIndex += fields[1]
+      const next = i + 1 < decoded.length ? column + decoded[i + 1][0] : line.length
+      if (fields.length > 1) {
+        add(names[sourceIndex], next - column)
+        mapped += next - column
+      }
+    })
+    if (line.length + newline > mapped) add('(unmapped)', line.length + newline - mapped)
+  })
+  return packages
+}
+
+function packageSizes(buildDir) {
+  const chunkDir = path.join(buildDir, 'static', 'chunks')
+  if (!existsSync(chunkDir)) return { packages: {}, mapped: false }
+
+  const chunks = []
+  const walk = dir => {
+    for (const entry of readdirSync(dir, { withFileTypes: true })) {
+      const full = path.join(dir, entry.name)
+      if (entry.isDirectory()) walk(full)
+      else if (entry.name.endsWith('.js')) chunks.push(path.relative(buildDir, full))
+    }
+  }
+  walk(chunkDir)
+
+  const packages = {}
+  let mapped = false
+  for (const chunk of chunks) {
+    const sizes = fileSizes(buildDir, chunk)
+    const mapFile = path.join(buildDir, `${chunk}.map`)
+    if (!existsSync(mapFile)) {
+      packages['(no source map)'] = addSizes(packages['(no source map)'] || emptySizes(), sizes)
+      continue
+    }
+    mapped = true
+    const code = readFileSync(path.join(buildDir, chunk), 'utf8')
+    const byPackage = attributeChunk(code, JSON.parse(readFileSync(mapFile, 'utf8')))
+    for (const [name, bytes] of Object.entries(byPackage)) {
+      packages[name] = addSizes(packages[name] || emptySizes(), sizes, bytes / sizes.raw)
+    }
+  }
+
+  return {
+    packages: Object.fromEntries(Object.entries(packages).map(([name, sizes]) => [name, roundSizes(sizes)])),
+    mapped,
+  }
+}
+
+// --- Budgets ----------------------------------------------------------------
+
+// Budgets look like { "routes": { "*": { "gzip": 200000 }, "/": { ... } },
+// "packages": { "framer-motion": { "gzip": 40000 } } }. "*" applies to every
+// route without its own entry.
+function checkBudgets(report, budgets) {
+  const failures = []
+  const check = (kind, name, sizes, limits) => {
+    for (const metric of METRICS) {
+      if (limits?.[metric] !== undefined && sizes[metric] > limits[metric]) {
+        failures.push(`${kind} ${name}: ${metric} ${formatBytes(sizes[metric])} > budget ${formatBytes(limits[metric])}`)
+      }
+    }
+  }
+  for (const [route, sizes] of Object.entries(report.routes)) {
+    check('route', route, sizes, budgets.routes?.[route] ?? budgets.routes?.['*'])
+  }
+  for (const [name, sizes] of Object.entries(report.packages)) {
+    check('package', name, sizes, budgets.packages?.[name])
+  }
+  return failures
+}
+
+// --- Output -----------------------------------------------------------------
+
+function formatBytes(bytes) {
+  return bytes >= 1024 ? `${(bytes / 1024).toFixed(1)} kB` : `${bytes} B`
+}
+
+function formatDelta(current, previous) {
+  if (previous === undefined) return ''
+  const delta = current - previous
+  if (delta === 0) return ''
+  return ` (${delta > 0 ? '+' : '-'}${formatBytes(Math.abs(delta))})`
+}
+
+function printTable(title, rows, previous) {
+  console.log(`\n${title}`)
+  const width = Math.max(...rows.map(([name]) => name.length), 10)
+  console.log(`  ${'name'.padEnd(width)}  ${METRICS.map(m => m.padStart(24)).join('')}`)
+  for (const [name, sizes] of rows) {
+    const cells = METRICS.map(m => `${formatBytes(sizes[m])}${formatDelta(sizes[m], previous?.[name]?.[m])}`.padStart(24))
+    console.log(`  ${name.padEnd(width)}  ${cells.join('')}`)
+  }
+}
+
+function currentCommit() {
+  try {
+    return execFileSync('git', ['rev-parse', '--short', 'HEAD'], { encoding: 'utf8', stdio: ['ignore', 'pipe', 'ignore'] }).trim()
+  } catch {
+    return null
+  }
+}
+
+function main() {
+  const args = parseArgs(process.argv.slice(2))
+  const buildDir = path.resolve(args.dir)
+
+  const routes = Object.fromEntries(
+    Object.entries(routeFiles(buildDir))
+      .map(([route, files]) => [route, roundSizes(files.reduce((total, file) => addSizes(total, fileSizes(buildDir, file)), emptySizes()))])
+      .sort(([a], [b]) => a.localeCompare(b))
+  )
+  const { packages, mapped } = packageSizes(buildDir)
+  const report = {
+    timestamp: new Date().toISOString(),
+    commit: currentCommit(),
+    routes,
+    packages: Object.fromEntries(Object.entries(packages).sort(([, a], [, b]) => b.raw - a.raw)),
+  }
+
+  const history = args.history ? readJson(args.history, []) : []
+  const previous = history[history.length - 1]
+
+  printTable('First-load JS/CSS per route', Object.entries(report.routes), previous?.routes)
+  printTable('Client chunks per package', Object.entries(report.packages), previous?.packages)
+  if (!mapped) {
+    console.log('\n  No source maps found; run `npm run build:analyze` to attribute bytes to packages.')
+  }
+
+  if (args.history) {
+    mkdirSync(path.dirname(args.history), { recursive: true })
+    writeFileSync(args.history, JSON.stringify([...history, report].slice(-HISTORY_LIMIT), null, 2) + '\n')
+  }
+  if (args.json) writeFileSync(args.json, JSON.stringify(report, null, 2) + '\n')
+
+  const failures = checkBudgets(report, readJson(args.budget, {}))
+  if (failures.length > 0) {
+    console.error(`\nBundle budget exceeded:\n${failures.map(f => `  - ${f}`).join('\n')}`)
+    process.exit(1)
+  }
+  console.log('\nAll bundles within budget.')
+}
+
+main()
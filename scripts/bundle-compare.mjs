@@ -0,0 +1,116 @@
+#!/usr/bin/env node
+// Before/after bundle-size report between two commits.
+//
+// Each ref is checked out into a temporary git worktree, installed with
+// `npm ci` and built, then measured with this checkout's bundle-budget.mjs,
+// so older commits that predate the script can still be compared. The
+// result is a per-route table of first-load JS/CSS (raw, gzip, brotli) with
+// the change for each route, written as Markdown and optionally JSON. CI
+// runs it on every pull request against the base branch (see
+// .github/workflows/bundle-report.yml) and attaches the report.
+//
+// Usage:
+//   node scripts/bundle-compare.mjs [--base origin/main] [--head HEAD]
+//     [--out bundle-report.md] [--json bundle-report.json]
+
+import { execFileSync } from 'node:child_process'
+import { mkdtempSync, readFileSync, rmSync, writeFileSync } from 'node:fs'
+import os from 'node:os'
+import path from 'node:path'
+import { fileURLToPath } from 'node:url'
+
+const METRICS = ['raw', 'gzip', 'brotli']
+const REPO_ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '..')
+const BUDGET_SCRIPT = path.join(REPO_ROOT, 'scripts', 'bundle-budget.mjs')
+
+function parseArgs(argv) {
+  const args = { base: 'origin/main', head: 'HEAD', out: 'bundle-report.md', json: null }
+  for (let i = 0; i < argv.length; i++) {
+    const flag = argv[i]
+    if (['--base', '--head', '--out', '--json'].includes(flag)) args[flag.slice(2)] = argv[++i]
+    else if (flag === '--help' || flag === '-h') {
+      console.log('Usage: node scripts/bundle-compare.mjs [--base origin/main] [--head HEAD] ' +
+        '[--out bundle-report.md] [--json bundle-report.json]')
+      process.exit(0)
+    } else {
+      throw new Error(`Unknown argument: ${flag}`)
+    }
+  }
+  return args
+}
+
+function run(command, args, cwd) {
+  return execFileSync(command, args, { cwd, encoding: 'utf8', stdio: ['ignore', 'pipe', 'inherit'] })
+}
+
+// Builds `ref` in a throwaway worktree and returns bundle-budget.mjs's report
+function measure(ref) {
+  const commit = run('git', ['rev-parse', '--short', ref], REPO_ROOT).trim()
+  const dir = mkdtempSync(path.join(os.tmpdir(), `bundle-${commit}-`))
+  try {
+    run('git', ['worktree', 'add', '--detach', dir, commit], REPO_ROOT)
+    console.log(`Building ${ref} (${commit})...`)
+    run('npm', ['ci', '--no-audit', '--no-fund'], dir)
+    run('npm', ['run', 'build'], dir)
+
+    const reportFile = path.join(dir, 'bundle-report.json')
+    try {
+      run('node', [BUDGET_SCRIPT, '--no-history', '--budget', path.join(REPO_ROOT, 'bundle-budget.json'),
+        '--json', reportFile], dir)
+    } catch (error) {
+      // Over budget still writes the report; this comparison is about the change
+      if (error.status !== 1) throw error
+    }
+    return { ref, ...JSON.parse(readFileSync(reportFile, 'utf8')) }
+  } finally {
+    run('git', ['worktree', 'remove', '--force', dir], REPO_ROOT)
+    rmSync(dir, { recursive: true, force: true })
+  }
+}
+
+function formatBytes(bytes) {
+  return bytes >= 1024 ? `${(bytes / 1024).toFixed(1)} kB` : `${bytes} B`
+}
+
+function formatChange(after, before) {
+  if (before === undefined) return 'new'
+  if (after === undefined) return 'removed'
+  const delta = after - before
+  if (delta === 0) return '0'
+  const percent = before ? ` (${delta > 0 ? '+' : ''}${((100 * delta) / before).toFixed(1)}%)` : ''
+  return `${delta > 0 ? '+' : '-'}${formatBytes(Math.abs(delta))}${percent}`
+}
+
+function markdown(before, after) {
+  const routes = [...new Set([...Object.keys(before.routes), ...Object.keys(after.routes)])].sort()
+  const lines = [
+    `## First-load JS/CSS per route`,
+    '',
+    `Before: \`${before.ref}\` (${before.commit}), after: \`${after.ref}\` (${after.commit})`,
+    '',
+    `| route | ${METRICS.map(m => `${m} before | ${m} after | ${m} change`).join(' | ')} |`,
+    `| --- | ${METRICS.map(() => '---: | ---: | ---:').join(' | ')} |`,
+  ]
+  for (const route of routes) {
+    const cells = METRICS.map(metric => {
+      const b = before.routes[route]?.[metric]
+      const a = after.routes[route]?.[metric]
+      return [b === undefined ? '-' : formatBytes(b), a === undefined ? '-' : formatBytes(a), formatChange(a, b)].join(' | ')
+    })
+    lines.push(`| ${route} | ${cells.join(' | ')} |`)
+  }
+  return lines.join('\n') + '\n'
+}
+
+function main() {
+  const args = parseArgs(process.argv.slice(2))
+  const before = measure(args.base)
+  const after = measure(args.head)
+
+  const report = markdown(before, after)
+  writeFileSync(args.out, report)
+  if (args.json) writeFileSync(args.json, JSON.stringify({ before, after }, null, 2) + '\n')
+  console.log(`\n${report}`)
+}
+
+main()
@@ -0,0 +1,88 @@
+// Shared by scripts/optimize-images.mjs and scripts/pdf-assets.mjs: encodes
+// one source image into responsive AVIF/WebP/fallback variants and a blur
+// placeholder, in the shape lib/images.ts reads (ManifestImage).
+
+import { createHash } from 'node:crypto'
+import { existsSync, readFileSync, readdirSync, rmSync } from 'node:fs'
+import path from 'node:path'
+
+// Next's default imageSizes/deviceSizes up to 1920, so next/image srcsets
+// map onto existing files
+export const WIDTHS = [64, 128, 256, 384, 640, 828, 1080, 1200, 1920]
+const PLACEHOLDER_WIDTH = 16
+
+const ENCODERS = {
+  avif: image => image.avif({ quality: 50, effort: 4 }),
+  webp: image => image.webp({ quality: 75 }),
+  jpeg: image => image.jpeg({ quality: 75, mozjpeg: true }),
+  png: image => image.png({ compressionLevel: 9, palette: true }),
+}
+
+// null when sharp is not installed
+export async function loadSharp() {
+  try {
+    return (await import('sharp')).default
+  } catch {
+    return null
+  }
+}
+
+export function contentHash(buffer, length = 10) {
+  return createHash('sha256').update(buffer).digest('hex').slice(0, length)
+}
+
+// "public/_img" -> "/_img", relative to the public directory
+export function publicUrl(publicDir, file) {
+  return '/' + path.relative(publicDir, file).split(path.sep).join('/')
+}
+
+// Writes the variants of `source` (a Buffer) into `outDir` as
+// `<name>-<hash>-<width>.<ext>` and returns the manifest entry. Existing
+// files are reused, since the name already pins the content.
+export async function encodeVariants(sharp, source, { name, outDir, publicDir, widths = WIDTHS }) {
+  const hash = contentHash(source)
+  const base = name.toLowerCase().replace(/[^a-z0-9-]+/g, '-')
+  const outUrl = publicUrl(publicDir, outDir)
+
+  const meta = await sharp(source).metadata()
+  // EXIF orientations 5-8 are rotated by 90 degrees
+  const [width, height] = meta.orientation >= 5 ? [meta.height, meta.width] : [meta.width, meta.height]
+  const fallback = meta.hasAlpha ? 'png' : 'jpeg'
+  // Never upscale; a source narrower than the largest width also gets a
+  // variant at its own size
+  const sizes = widths.filter(w => w < width)
+  if (width <= widths[widths.length - 1]) sizes.push(width)
+
+  const variants = {}
+  for (const format of ['avif', 'webp', fallback]) {
+    variants[format] = []
+    for (const w of sizes) {
+      const file = `${base}-${hash}-${w}.${format === 'jpeg' ? 'jpg' : format}`
+      const target = path.join(outDir, file)
+      if (!existsSync(target)) {
+        await ENCODERS[format](sharp(source).rotate().resize({ width: w })).toFile(target)
+      }
+      variants[format].push({ width: w, src: `${outUrl}/${file}`, bytes: readFileSync(target).length })
+    }
+  }
+
+  const placeholder = await sharp(source).rotate().resize({ width: PLACEHOLDER_WIDTH }).webp({ quality: 40 }).toBuffer()
+
+  return {
+    width,
+    height,
+    bytes: source.length,
+    hash,
+    blurDataURL: `data:image/webp;base64,${placeholder.toString('base64')}`,
+    variants,
+  }
+}
+
+// Deletes files in `outDir` that no manifest entry refers to anymore
+export function pruneVariants(outDir, images) {
+  const current = new Set(images.flatMap(image =>
+    Object.values(image.variants).flat().map(variant => path.basename(variant.src))))
+  for (const file of readdirSync(outDir)) {
+    if (!current.has(file)) rmSync(path.join(outDir, file))
+  }
+}
@@ -0,0 +1,114 @@
+#!/usr/bin/env node
+// Responsive variants for the images in public/, built ahead of time.
+//
+// Every top-level image in public/ is resized to the widths in
+// image-variants.mjs, no wider than the original, and encoded as AVIF, WebP
+// and a JPEG (PNG if it has transparency) fallback. Variants are written to public/_img/ with the
+// source's content hash in the name, so they can be cached forever and are
+// only rebuilt when the source changes.
+//
+// lib/image-manifest.json records each source's dimensions, variants and a
+// tiny blurred placeholder for components/OptimizedImage.tsx. The next/image
+// loader (lib/image-loader.ts) runs in the browser too, so it gets only a
+// width -> WebP URL map in lib/image-widths.json. Either way no image is
+// resized at request time. Both files are generated, not committed.
+//
+// A report of bytes saved per image and width is printed at the end.
+//
+// Usage:
+//   node scripts/optimize-images.mjs [--src public] [--out public/_img]
+//     [--manifest lib/image-manifest.json] [--widths lib/image-widths.json]
+//     [--json report.json]
+
+import { mkdirSync, readFileSync, readdirSync, writeFileSync } from 'node:fs'
+import path from 'node:path'
+import { encodeVariants, loadSharp, pruneVariants, publicUrl } from './image-variants.mjs'
+
+const SOURCE_EXTENSIONS = new Set(['.jpg', '.jpeg', '.png'])
+
+function parseArgs(argv) {
+  const args = {
+    src: 'public',
+    out: path.join('public', '_img'),
+    manifest: path.join('lib', 'image-manifest.json'),
+    widths: path.join('lib', 'image-widths.json'),
+    json: null,
+  }
+  for (let i = 0; i < argv.length; i++) {
+    const flag = argv[i]
+    if (['--src', '--out', '--manifest', '--widths', '--json'].includes(flag)) args[flag.slice(2)] = argv[++i]
+    else if (flag === '--help' || flag === '-h') {
+      console.log('Usage: node scripts/optimize-images.mjs [--src public] [--out public/_img] ' +
+        '[--manifest lib/image-manifest.json] [--widths lib/image-widths.json] [--json report.json]')
+      process.exit(0)
+    } else {
+      throw new Error(`Unknown argument: ${flag}`)
+    }
+  }
+  return args
+}
+
+// --- Output -----------------------------------------------------------------
+
+function formatBytes(bytes) {
+  return bytes >= 1024 ? `${(bytes / 1024).toFixed(1)} kB` : `${bytes} B`
+}
+
+function savings(bytes, original) {
+  return `${(100 * (1 - bytes / original)).toFixed(1)}%`
+}
+
+function report(manifest) {
+  const rows = {}
+  for (const [src, image] of Object.entries(manifest)) {
+    const formats = Object.keys(image.variants)
+    console.log(`\n${src}  ${image.width}x${image.height}, original ${formatBytes(image.bytes)}`)
+    console.log(`  ${'width'.padStart(6)}${formats.map(f => f.padStart(12)).join('')}${'saved (avif)'.padStart(16)}`)
+    rows[src] = { original: image.bytes, widths: {} }
+    image.variants[formats[0]].forEach((variant, i) => {
+      const sizes = Object.fromEntries(formats.map(f => [f, image.variants[f][i].bytes]))
+      rows[src].widths[variant.width] = sizes
+      const cells = formats.map(f => formatBytes(sizes[f]).padStart(12)).join('')
+      console.log(`  ${String(variant.width).padStart(6)}${cells}${savings(sizes.avif, image.bytes).padStart(16)}`)
+    })
+  }
+  return rows
+}
+
+async function main() {
+  const args = parseArgs(process.argv.slice(2))
+  const sharp = await loadSharp()
+  if (!sharp) {
+    console.error('sharp is not installed; run `npm install` first.')
+    process.exit(1)
+  }
+  mkdirSync(args.out, { recursive: true })
+
+  const sources = readdirSync(args.src, { withFileTypes: true })
+    .filter(entry => entry.isFile() && SOURCE_EXTENSIONS.has(path.extname(entry.name).toLowerCase()))
+    .map(entry => path.join(args.src, entry.name))
+    .sort()
+
+  const manifest = {}
+  for (const file of sources) {
+    manifest[publicUrl(args.src, file)] = await encodeVariants(sharp, readFileSync(file), {
+      name: path.basename(file, path.extname(file)),
+      outDir: args.out,
+      publicDir: args.src,
+    })
+  }
+
+  // Drop variants of sources that changed or were removed
+  pruneVariants(args.out, Object.values(manifest))
+
+  // No timestamps, so the manifest only changes when an image does
+  writeFileSync(args.manifest, JSON.stringify(manifest, null, 2) + '\n')
+  const widths = Object.fromEntries(Object.entries(manifest).map(([src, image]) =>
+    [src, Object.fromEntries(image.variants.webp.map(variant => [variant.width, variant.src]))]))
+  writeFileSync(args.widths, JSON.stringify(widths, null, 2) + '\n')
+  const rows = report(manifest)
+  if (args.json) writeFileSync(args.json, JSON.stringify(rows, null, 2) + '\n')
+  console.log(`\nWrote ${Object.keys(manifest).length} images to ${args.manifest}`)
+}
+
+main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env node
+// Content-hashed URLs and first-page previews for the PDFs in public/.
+//
+// Every PDF under public/ gets an entry in lib/document-manifest.json with:
+// - `href`: /documents/<name>-<hash>.pdf, served by
+//   app/documents/[file]/route.ts with a strong ETag, byte ranges and
+//   immutable caching, since the URL changes whenever the file does
+// - `preview`: the first page rendered to an image and encoded like
+//   scripts/optimize-images.mjs does, so cards can show it without
+//   downloading the PDF
+//
+// Client components only need the hrefs, so those are also written on their
+// own to lib/document-hrefs.json. Both files are generated, not committed.
+//
+// Pages are rendered with poppler's `pdftoppm`, or MuPDF's `mutool` if that is
+// what is installed. Without either, or without sharp, previews from the last
+// run are kept for unchanged files and new files get none.
+//
+// Usage:
+//   node scripts/pdf-assets.mjs [--src public] [--out public/_previews]
+//     [--manifest lib/document-manifest.json] [--hrefs lib/document-hrefs.json]
+
+import { execFileSync } from 'node:child_process'
+import { existsSync, mkdirSync, mkdtempSync, readFileSync, readdirSync, rmSync, writeFileSync } from 'node:fs'
+import os from 'node:os'
+import path from 'node:path'
+import { contentHash, encodeVariants, loadSharp, pruneVariants, publicUrl } from './image-variants.mjs'
+
+// Cards show previews at most ~320px wide
+const PREVIEW_WIDTHS = [128, 256, 384, 640]
+const RENDER_WIDTH = 640
+
+function parseArgs(argv) {
+  const args = {
+    src: 'public',
+    out: path.join('public', '_previews'),
+    manifest: path.join('lib', 'document-manifest.json'),
+    hrefs: path.join('lib', 'document-hrefs.json'),
+  }
+  for (let i = 0; i < argv.length; i++) {
+    const flag = argv[i]
+    if (['--src', '--out', '--manifest', '--hrefs'].includes(flag)) args[flag.slice(2)] = argv[++i]
+    else if (flag === '--help' || flag === '-h') {
+      console.log('Usage: node scripts/pdf-assets.mjs [--src public] [--out public/_previews] ' +
+        '[--manifest lib/document-manifest.json] [--hrefs lib/document-hrefs.json]')
+      process.exit(0)
+    } else {
+      throw new Error(`Unknown argument: ${flag}`)
+    }
+  }
+  return args
+}
+
+function readJson(file, fallback) {
+  if (!existsSync(file)) return fallback
+  return JSON.parse(readFileSync(file, 'utf8'))
+}
+
+// PDFs below `dir`, skipping generated directories like _img/ and _previews/
+function findPdfs(dir) {
+  const found = []
+  for (const entry of readdirSync(dir, { withFileTypes: true })) {
+    const full = path.join(dir, entry.name)
+    if (entry.isDirectory() && !entry.name.startsWith('_')) found.push(...findPdfs(full))
+    else if (entry.isFile() && entry.name.toLowerCase().endsWith('.pdf')) found.push(full)
+  }
+  return found.sort()
+}
+
+function hasCommand(command) {
+  try {
+    execFileSync(command, ['-v'], { stdio: 'ignore' })
+    return true
+  } catch (error) {
+    // Both tools exit non-zero for -v but still exist
+    return error.code !== 'ENOENT'
+  }
+}
+
+// First page as a PNG buffer, or null if no renderer is installed
+function renderFirstPage(file, renderer) {
+  const tmp = mkdtempSync(path.join(os.tmpdir(), 'pdf-preview-'))
+  try {
+    const out = path.join(tmp, 'page')
+    if (renderer === 'pdftoppm') {
+      execFileSync('pdftoppm', ['-f', '1', '-l', '1', '-singlefile', '-png', '-scale-to-x', String(RENDER_WIDTH),
+        '-scale-to-y', '-1', file, out], { stdio: 'ignore' })
+    } else {
+      execFileSync('mutool', ['draw', '-q', '-F', 'png', '-w', String(RENDER_WIDTH), '-o', `${out}.png`, file, '1'],
+        { stdio: 'ignore' })
+    }
+    return readFileSync(`${out}.png`)
+  } finally {
+    rmSync(tmp, { recursive: true, force: true })
+  }
+}
+
+function previewFilesExist(preview, publicDir) {
+  return Object.values(preview.variants).flat()
+    .every(variant => existsSync(path.join(publicDir, ...variant.src.split('/'))))
+}
+
+async function main() {
+  const args = parseArgs(process.argv.slice(2))
+  const previous = readJson(args.manifest, {})
+  const sharp = await loadSharp()
+  const renderer = ['pdftoppm', 'mutool'].find(hasCommand) ?? null
+  if (!sharp || !renderer) {
+    console.warn(`No ${!sharp ? 'sharp' : 'pdftoppm or mutool'} available; keeping existing previews only.`)
+  }
+  mkdirSync(args.out, { recursive: true })
+
+  const manifest = {}
+  for (const file of findPdfs(args.src)) {
+    const source = readFileSync(file)
+    const sha256 = contentHash(source, 64)
+    const name = path.basename(file, path.extname(file))
+    const key = publicUrl(args.src, file)
+
+    let preview = previous[key]?.sha256 === sha256 ? previous[key].preview : null
+    if (preview && !previewFilesExist(preview, args.src)) preview = null
+    if (!preview && sharp && renderer) {
+      preview = await encodeVariants(sharp, renderFirstPage(file, renderer), {
+        name,
+        outDir: args.out,
+        publicDir: args.src,
+        widths: PREVIEW_WIDTHS,
+      })
+    }
+
+    manifest[key] = {
+      href: `/documents/${name}-${sha256.slice(0, 10)}.pdf`,
+      file: path.relative(args.src, file).split(path.sep).join('/'),
+      bytes: source.length,
+      sha256,
+      preview,
+    }
+    console.log(`${key} -> ${manifest[key].href}${preview ? '' : ' (no preview)'}`)
+  }
+
+  if (sharp && renderer) pruneVariants(args.out, Object.values(manifest).map(doc => doc.preview).filter(Boolean))
+  writeFileSync(args.manifest, JSON.stringify(manifest, null, 2) + '\n')
+  const hrefs = Object.fromEntries(Object.entries(manifest).map(([src, doc]) => [src, doc.href]))
+  writeFileSync(args.hrefs, JSON.stringify(hrefs, null, 2) + '\n')
+}
+
+main()
@@ -1,85 +1,46 @@
 import asyncio
-from playwright import async_api
+
+from harness import open_page, run_standalone
+from locators import nav_button, nav_link
+from waits import click, wait_for_hydration
+
+
+async def run_flow(context):
+    page = await open_page(context)
+    await wait_for_hydration(page)
+
+    # Interact with the page elements to simulate user flow
+    # Click the Work link to verify navigation to the Work (Projects) page.
+    frame = context.pages[-1]
+    elem = nav_link(frame, 'Work').nth(0)
+    await click(elem)
+
+
+    # Click the About link to verify navigation to the About page.
+    frame = context.pages[-1]
+    elem = nav_link(frame, 'About').nth(0)
+    await click(elem)
+
+
+    # Click the Contact link to verify that the contact modal opens.
+    frame = context.pages[-1]
+    elem = nav_link(frame, 'Contact').nth(0)
+    await click(elem)
+
+
+    # Click the Email call-to-action button to verify the default mail client opens with the correct email address.
+    frame = context.pages[-1]
+    elem = nav_button(frame, 'Email me').nth(0)
+    await click(elem)
+
+
+    # Final generic failing assertion since the expected result is unknown
+    assert False, 'Test plan execution failed: generic failure assertion.'
+
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Click the Work link to verify navigation to the Work (Projects) page.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/header/div[2]/div/div/nav/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the About link to verify navigation to the About page.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/header/div[2]/div/div/nav/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the Contact link to verify that the contact modal opens.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/header/div[2]/div/div/nav/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the Email call-to-action button to verify the default mail client opens with the correct email address.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/header/div[2]/div/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Final generic failing assertion since the expected result is unknown
-        assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    await run_standalone(run_flow)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
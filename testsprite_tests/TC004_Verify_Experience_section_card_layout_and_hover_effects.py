@@ -1,84 +1,49 @@
 import asyncio
-from playwright import async_api
+
+from harness import BASE_URL, open_page, run_standalone
+from waits import wait_for_animations, wait_for_hydration
+
+
+async def run_flow(context):
+    page = await open_page(context)
+    await wait_for_hydration(page)
+
+    # Interact with the page elements to simulate user flow
+    # Scroll down or find navigation to the Experience section on the homepage.
+    await page.mouse.wheel(0, window.innerHeight)
+    await wait_for_animations(page)
+
+
+    # Try to scroll further or search for navigation or links to the Experience section.
+    await page.mouse.wheel(0, window.innerHeight)
+    await wait_for_animations(page)
+
+
+    # Try to navigate to a common Experience section URL or open a menu if available to find Experience section.
+    await page.goto(f'{BASE_URL}/experience', timeout=10000)
+
+
+    # Return to homepage and try to find Experience section or cards by searching or exploring other navigation elements.
+    await page.goto(BASE_URL, timeout=10000)
+    await wait_for_hydration(page)
+
+
+    # Return to the homepage and try to find any clickable elements or links that might lead to the Experience section or cards. If none found, request user assistance.
+    await page.goto(BASE_URL, timeout=10000)
+    await wait_for_hydration(page)
+
+
+    # Scroll down the page further to try to reveal any hidden Experience section or cards.
+    await page.mouse.wheel(0, window.innerHeight)
+    await wait_for_animations(page)
+
+
+    assert False, 'Test plan execution failed: generic failure assertion.'
+
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Scroll down or find navigation to the Experience section on the homepage.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Try to scroll further or search for navigation or links to the Experience section.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Try to navigate to a common Experience section URL or open a menu if available to find Experience section.
-        await page.goto('http://localhost:3000/experience', timeout=10000)
-        
-
-        # Return to homepage and try to find Experience section or cards by searching or exploring other navigation elements.
-        await page.goto('http://localhost:3000', timeout=10000)
-        
-
-        # Return to the homepage and try to find any clickable elements or links that might lead to the Experience section or cards. If none found, request user assistance.
-        await page.goto('http://localhost:3000', timeout=10000)
-        
-
-        # Scroll down the page further to try to reveal any hidden Experience section or cards.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    await run_standalone(run_flow)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,94 +1,62 @@
 import asyncio
-from playwright import async_api
+
+from harness import BASE_URL, open_page, run_standalone
+from waits import wait_for_animations, wait_for_hydration
+
+
+async def run_flow(context):
+    page = await open_page(context)
+    await wait_for_hydration(page)
+
+    # Interact with the page elements to simulate user flow
+    # Scroll down or search for Skills section on homepage to locate skill groups
+    await page.mouse.wheel(0, window.innerHeight)
+    await wait_for_animations(page)
+
+
+    # Scroll down further or try to locate Skills section by scrolling or searching text
+    await page.mouse.wheel(0, window.innerHeight)
+    await wait_for_animations(page)
+
+
+    # Try to search for 'Skills' text on the page or scroll up to check if Skills section is above
+    await page.mouse.wheel(0, -window.innerHeight)
+    await wait_for_animations(page)
+
+
+    # Check for navigation menu or links to other pages where Skills section might be located
+    await page.mouse.wheel(0, -window.innerHeight)
+    await wait_for_animations(page)
+
+
+    # Try to reload the page to see if Skills section or navigation appears or try to open a new tab to search for Skills section or related page
+    await page.goto(f'{BASE_URL}/', timeout=10000)
+    await wait_for_hydration(page)
+
+
+    await page.mouse.wheel(0, window.innerHeight)
+    await wait_for_animations(page)
+
+
+    # Try to open a new tab and search for 'Skills section site:localhost:3000' or similar to locate the Skills section or related page
+    await page.goto('about:blank', timeout=10000)
+
+
+    # Return to localhost homepage and try alternative ways to locate Skills section or skill groups
+    await page.goto(f'{BASE_URL}/', timeout=10000)
+    await wait_for_hydration(page)
+
+
+    await page.mouse.wheel(0, window.innerHeight)
+    await wait_for_animations(page)
+
+
+    assert False, 'Test plan execution failed: Unable to verify skills grid and animations.'
+
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Scroll down or search for Skills section on homepage to locate skill groups
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Scroll down further or try to locate Skills section by scrolling or searching text
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Try to search for 'Skills' text on the page or scroll up to check if Skills section is above
-        await page.mouse.wheel(0, -window.innerHeight)
-        
-
-        # Check for navigation menu or links to other pages where Skills section might be located
-        await page.mouse.wheel(0, -window.innerHeight)
-        
-
-        # Try to reload the page to see if Skills section or navigation appears or try to open a new tab to search for Skills section or related page
-        await page.goto('http://localhost:3000/', timeout=10000)
-        
-
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Try to open a new tab and search for 'Skills section site:localhost:3000' or similar to locate the Skills section or related page
-        await page.goto('about:blank', timeout=10000)
-        
-
-        # Return to localhost homepage and try alternative ways to locate Skills section or skill groups
-        await page.goto('http://localhost:3000/', timeout=10000)
-        
-
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        assert False, 'Test plan execution failed: Unable to verify skills grid and animations.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    await run_standalone(run_flow)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,159 +1,123 @@
 import asyncio
-from playwright import async_api
+import re
+
+from harness import open_page, run_standalone
+from locators import (contact_channel, contact_field, contact_field_error, contact_modal, nav_link,
+                      section)
+from waits import click, fill, wait_for_animations, wait_for_hydration
+
+
+async def run_flow(context):
+    page = await open_page(context)
+    await wait_for_hydration(page)
+
+    # Interact with the page elements to simulate user flow
+    # Click Contact link or button to open the contact modal.
+    frame = context.pages[-1]
+    elem = nav_link(frame, 'Contact').nth(0)
+    await click(elem)
+
+
+    # Verify the contact modal appears properly and is mobile-optimized.
+    await page.mouse.wheel(0, 600)
+    await wait_for_animations(page)
+
+
+    # Attempt to submit the form with empty required fields.
+    frame = context.pages[-1]
+    elem = section(frame, 'contact').get_by_role('button', name='Get In Touch').nth(0)
+    await click(elem)
+
+
+    # Fill form fields with invalid email and incomplete data.
+    frame = context.pages[-1]
+    elem = contact_field(frame, 'Your Name').nth(0)
+    await fill(elem, 'Test User')
+
+
+    frame = context.pages[-1]
+    elem = contact_field(frame, 'Your Email').nth(0)
+    await fill(elem, 'invalid-email')
+
+
+    frame = context.pages[-1]
+    elem = contact_field(frame, 'Your Project').nth(0)
+    await fill(elem, 'Test Project')
+
+
+    frame = context.pages[-1]
+    elem = contact_field(frame, 'Your Message').nth(0)
+    await fill(elem, 'Short message')
+
+
+    frame = context.pages[-1]
+    elem = contact_modal(frame).get_by_role('button', name='Send Message').nth(0)
+    await click(elem)
+
+
+    # Fill the form correctly with valid name, email, and message.
+    frame = context.pages[-1]
+    elem = contact_field(frame, 'Your Email').nth(0)
+    await fill(elem, 'testuser@example.com')
+
+
+    frame = context.pages[-1]
+    elem = contact_modal(frame).get_by_role('button', name='Send Message').nth(0)
+    await click(elem)
+
+
+    # Verify alternative contact methods (Email link, GitHub, LinkedIn) are visible and open the correct links.
+    frame = context.pages[-1]
+    elem = contact_channel(frame, 'mailto:').nth(0)
+    await click(elem)
+
+
+    # Verify GitHub and LinkedIn contact methods are visible and open correct links.
+    frame = context.pages[-1]
+    elem = contact_channel(frame, 'github.com').nth(0)
+    await click(elem)
+
+
+    # Verify the contact modal appears properly and is mobile-optimized.
+    modal = contact_modal(frame)
+    assert await modal.is_visible(), 'Contact modal should be visible'
+    viewport = await page.viewport_size()
+    assert viewport['width'] <= 768, 'Viewport width should be mobile size or less for mobile optimization'
+
+    # Verify validation errors are displayed for required fields after empty submit
+    name_error = contact_field_error(frame, 'name', 'required')
+    email_error = contact_field_error(frame, 'email', 'required')
+    message_error = contact_field_error(frame, 'message', 'required')
+    assert await name_error.is_visible(), 'Name required validation error should be visible'
+    assert await email_error.is_visible(), 'Email required validation error should be visible'
+    assert await message_error.is_visible(), 'Message required validation error should be visible'
+
+    # Verify form prevents submission and displays email format validation errors
+    email_format_error = contact_field_error(frame, 'email', 'valid email')
+    assert await email_format_error.is_visible(), 'Email format validation error should be visible'
+
+    # Confirm successful submission with a confirmation message or modal feedback
+    confirmation_message = contact_modal(frame).locator('form > div').filter(has_text=re.compile('Thank you|successfully'))
+    assert await confirmation_message.is_visible(), 'Confirmation message should be visible after successful submission'
+
+    # Verify alternative contact methods (Email link, GitHub, LinkedIn) are visible and open the correct links
+    email_link = contact_channel(frame, 'mailto:')
+    github_link = contact_channel(frame, 'github.com')
+    linkedin_link = contact_channel(frame, 'linkedin.com')
+    assert await email_link.is_visible(), 'Email contact link should be visible'
+    assert await github_link.is_visible(), 'GitHub contact link should be visible'
+    assert await linkedin_link.is_visible(), 'LinkedIn contact link should be visible'
+    email_href = await email_link.get_attribute('href')
+    github_href = await github_link.get_attribute('href')
+    linkedin_href = await linkedin_link.get_attribute('href')
+    assert email_href and 'mailto:' in email_href, 'Email link should have mailto href'
+    assert github_href and 'github.com' in github_href, 'GitHub link should point to github.com'
+    assert linkedin_href and 'linkedin.com' in linkedin_href, 'LinkedIn link should point to linkedin.com'
+
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Click Contact link or button to open the contact modal.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/header/div[2]/div/div/nav/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Verify the contact modal appears properly and is mobile-optimized.
-        await page.mouse.wheel(0, 600)
-        
-
-        # Attempt to submit the form with empty required fields.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/div/section[7]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Fill form fields with invalid email and incomplete data.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/div[3]/div/div[2]/form/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test User')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/div[3]/div/div[2]/form/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('invalid-email')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/div[3]/div/div[2]/form/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Project')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/div[3]/div/div[2]/form/div[4]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Short message')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/div[3]/div/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Fill the form correctly with valid name, email, and message.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/div[3]/div/div[2]/form/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('testuser@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/div[3]/div/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Verify alternative contact methods (Email link, GitHub, LinkedIn) are visible and open the correct links.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/div/section[7]/div[2]/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Verify GitHub and LinkedIn contact methods are visible and open correct links.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/div/section[7]/div[2]/div/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Verify the contact modal appears properly and is mobile-optimized.
-        modal = frame.locator('xpath=html/body/div[55]/div[3]')
-        assert await modal.is_visible(), 'Contact modal should be visible'
-        viewport = await page.viewport_size()
-        assert viewport['width'] <= 768, 'Viewport width should be mobile size or less for mobile optimization'
-        
-        # Verify validation errors are displayed for required fields after empty submit
-        name_error = frame.locator('xpath=html/body/div[55]/div[3]/div/div[2]/form/div[1]/span[contains(text(), "required")]')
-        email_error = frame.locator('xpath=html/body/div[55]/div[3]/div/div[2]/form/div[2]/span[contains(text(), "required")]')
-        message_error = frame.locator('xpath=html/body/div[55]/div[3]/div/div[2]/form/div[4]/span[contains(text(), "required")]')
-        assert await name_error.is_visible(), 'Name required validation error should be visible'
-        assert await email_error.is_visible(), 'Email required validation error should be visible'
-        assert await message_error.is_visible(), 'Message required validation error should be visible'
-        
-        # Verify form prevents submission and displays email format validation errors
-        email_format_error = frame.locator('xpath=html/body/div[55]/div[3]/div/div[2]/form/div[2]/span[contains(text(), "valid email")]')
-        assert await email_format_error.is_visible(), 'Email format validation error should be visible'
-        
-        # Confirm successful submission with a confirmation message or modal feedback
-        confirmation_message = frame.locator('xpath=html/body/div[55]/div[3]/div/div[2]/form/div[contains(text(), "Thank you") or contains(text(), "successfully")]')
-        assert await confirmation_message.is_visible(), 'Confirmation message should be visible after successful submission'
-        
-        # Verify alternative contact methods (Email link, GitHub, LinkedIn) are visible and open the correct links
-        email_link = frame.locator('xpath=html/body/div[55]/div/section[7]/div[2]/div/a[1]')
-        github_link = frame.locator('xpath=html/body/div[55]/div/section[7]/div[2]/div/a[2]')
-        linkedin_link = frame.locator('xpath=html/body/div[55]/div/section[7]/div[2]/div/a[3]')
-        assert await email_link.is_visible(), 'Email contact link should be visible'
-        assert await github_link.is_visible(), 'GitHub contact link should be visible'
-        assert await linkedin_link.is_visible(), 'LinkedIn contact link should be visible'
-        email_href = await email_link.get_attribute('href')
-        github_href = await github_link.get_attribute('href')
-        linkedin_href = await linkedin_link.get_attribute('href')
-        assert email_href and 'mailto:' in email_href, 'Email link should have mailto href'
-        assert github_href and 'github.com' in github_href, 'GitHub link should point to github.com'
-        assert linkedin_href and 'linkedin.com' in linkedin_href, 'LinkedIn link should point to linkedin.com'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    await run_standalone(run_flow)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
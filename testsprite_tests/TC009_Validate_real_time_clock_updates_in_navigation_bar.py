@@ -1,85 +1,45 @@
 import asyncio
-from playwright import async_api
+
+from harness import open_page, run_standalone
+from waits import wait_for_hydration
+
+
+async def run_flow(context):
+    page = await open_page(context)
+    await wait_for_hydration(page)
+
+    # Interact with the page elements to simulate user flow
+    import datetime
+    import asyncio
+    from playwright.async_api import expect
+    async def assert_real_time_clock(page):
+        # Select the clock element in the glass morphism navigation bar
+        clock_selector = 'nav.glass-morphism .real-time-clock'  # Adjust selector as per actual implementation
+        # Get the initial displayed time and date from the clock
+        initial_clock_text = await page.locator(clock_selector).inner_text()
+        # Get the current system time and date
+        now = datetime.datetime.now()
+        expected_time_str = now.strftime('%I:%M %p')  # Example: 02:30 PM
+        expected_date_str = now.strftime('%B %d, %Y')  # Example: April 27, 2024
+        # Assert the initial clock text contains the expected time and date
+        assert expected_time_str in initial_clock_text, f"Initial time '{initial_clock_text}' does not match expected '{expected_time_str}'"
+        assert expected_date_str in initial_clock_text, f"Initial date '{initial_clock_text}' does not match expected '{expected_date_str}'"
+        # Wait for at least 2 minutes to check dynamic update
+        await asyncio.sleep(120)
+        # Get the updated clock text
+        updated_clock_text = await page.locator(clock_selector).inner_text()
+        # Get the new current system time and date
+        now_updated = datetime.datetime.now()
+        expected_time_str_updated = now_updated.strftime('%I:%M %p')
+        expected_date_str_updated = now_updated.strftime('%B %d, %Y')
+        # Assert the updated clock text contains the updated time and date
+        assert expected_time_str_updated in updated_clock_text, f"Updated time '{updated_clock_text}' does not match expected '{expected_time_str_updated}'"
+        assert expected_date_str_updated in updated_clock_text, f"Updated date '{updated_clock_text}' does not match expected '{expected_date_str_updated}'"
+
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        import datetime
-        import asyncio
-        from playwright.async_api import expect
-        async def assert_real_time_clock(page):
-            # Select the clock element in the glass morphism navigation bar
-            clock_selector = 'nav.glass-morphism .real-time-clock'  # Adjust selector as per actual implementation
-            # Get the initial displayed time and date from the clock
-            initial_clock_text = await page.locator(clock_selector).inner_text()
-            # Get the current system time and date
-            now = datetime.datetime.now()
-            expected_time_str = now.strftime('%I:%M %p')  # Example: 02:30 PM
-            expected_date_str = now.strftime('%B %d, %Y')  # Example: April 27, 2024
-            # Assert the initial clock text contains the expected time and date
-            assert expected_time_str in initial_clock_text, f"Initial time '{initial_clock_text}' does not match expected '{expected_time_str}'"
-            assert expected_date_str in initial_clock_text, f"Initial date '{initial_clock_text}' does not match expected '{expected_date_str}'"
-            # Wait for at least 2 minutes to check dynamic update
-            await asyncio.sleep(120)
-            # Get the updated clock text
-            updated_clock_text = await page.locator(clock_selector).inner_text()
-            # Get the new current system time and date
-            now_updated = datetime.datetime.now()
-            expected_time_str_updated = now_updated.strftime('%I:%M %p')
-            expected_date_str_updated = now_updated.strftime('%B %d, %Y')
-            # Assert the updated clock text contains the updated time and date
-            assert expected_time_str_updated in updated_clock_text, f"Updated time '{updated_clock_text}' does not match expected '{expected_time_str_updated}'"
-            assert expected_date_str_updated in updated_clock_text, f"Updated date '{updated_clock_text}' does not match expected '{expected_date_str_updated}'"
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    await run_standalone(run_flow)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
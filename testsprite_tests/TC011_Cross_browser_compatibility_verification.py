@@ -1,72 +1,33 @@
 import asyncio
-from playwright import async_api
+
+from harness import open_page, run_standalone
+from locators import section, theme_toggle
+from waits import click, wait_for_hydration
+
+
+async def run_flow(context):
+    page = await open_page(context)
+    await wait_for_hydration(page)
+
+    # Interact with the page elements to simulate user flow
+    # Verify core functionalities and visual layouts on desktop Chrome, including theme toggle, navigation, and animations.
+    frame = context.pages[-1]
+    elem = theme_toggle(frame).nth(0)
+    await click(elem)
+
+
+    # Test navigation links (Work, About, Contact) on desktop Chrome for correct page section scrolling or loading.
+    frame = context.pages[-1]
+    elem = section(frame, 'certifications').get_by_role('link', name='View Certificate').nth(1)
+    await click(elem)
+
+
+    assert False, 'Test plan execution failed: generic failure assertion.'
+
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Verify core functionalities and visual layouts on desktop Chrome, including theme toggle, navigation, and animations.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/header/div[2]/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    await run_standalone(run_flow)
 
-        # Test navigation links (Work, About, Contact) on desktop Chrome for correct page section scrolling or loading.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/div/section[3]/div/div[2]/div[2]/div/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,76 +1,27 @@
 import asyncio
-from playwright import async_api
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Click on 'Work' section link to navigate and observe animations.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/header/div[2]/div/div/nav/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+from harness import run_standalone
+from vitals import check, print_summary
+
+# Throttled timings are meaningless with other tests sharing the browser and
+# CPU, so run_suite.py and run_sharded.py run this script on its own
+SERIAL = True
+
+
+async def run_flow(context):
+    # Load /, /work, /about and a project page repeatedly under CPU and network
+    # throttling, then compare LCP/CLS/INP/TBT/TTFB/heap percentiles with the
+    # stored baseline (recorded with `vitals.py --update-baseline`). Skipped
+    # while there is none.
+    summary, regressions = await check(context)
+    print_summary(summary)
 
-        # Observe animations on hover over a project card and on filtering projects by category.
-        await page.mouse.wheel(0, window.innerHeight)
-        
+    assert not regressions, 'Web vitals regressed past the baseline: ' + '; '.join(regressions)
+
+
+async def run_test():
+    await run_standalone(run_flow)
 
-        # Hover over a project card to observe Framer Motion animation smoothness and check for any jank or frame drops.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[55]/div/div[4]/div[4]/div/div/div[2]/div[3]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        assert False, 'Test plan execution failed: Unable to verify animation smoothness and page load performance.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_test())
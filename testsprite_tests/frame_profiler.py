@@ -0,0 +1,208 @@
+"""Frame-timing profiler for the home page's scroll animations.
+
+Scrolls ``/`` top to bottom with ``page.mouse.wheel`` while the page records
+every ``requestAnimationFrame`` delta, every long task and every React commit,
+each tagged with the section currently crossing the middle of the viewport.
+Scrolling should not commit at all: scroll-driven styling goes through
+``lib/scroll-engine.ts`` motion values rather than React state. A Chromium trace of the
+same run is written alongside for digging into individual frames. Scrolling
+stops after ``--max-steps`` wheel events or ``--timeout`` seconds even if the
+bottom was never reached (content that keeps growing, a stuck scroller), and
+the report is marked truncated.
+
+Usage::
+
+    python testsprite_tests/frame_profiler.py [--step 120] [--max-steps 400] [--timeout 60]
+                                              [--trace trace.json] [--json report.json]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from playwright import async_api
+
+from harness import BASE_URL, SHARED_LAUNCH_ARGS, launch_browser, new_context
+from waits import wait_for_hydration
+
+SECTIONS = ["experience", "projects", "skills", "education"]
+FRAME_BUDGET_MS = 1000 / 60
+WORST_FRAMES = 5
+MAX_STEPS = 400
+TIMEOUT_S = 60
+
+TRACE_CATEGORIES = [
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline.frame",
+    "blink.user_timing",
+    "loading",
+]
+
+# Section tracking uses an IntersectionObserver on a 1px band at mid-viewport
+# so the per-frame callback never forces layout itself.
+_RECORDER_JS = """
+(sectionIds) => {
+  const state = { recording: false, section: null, frames: [], longTasks: [] };
+  window.__frameProfile = state;
+
+  const observer = new IntersectionObserver((entries) => {
+    entries.forEach((entry) => {
+      if (entry.isIntersecting) state.section = entry.target.id;
+      else if (state.section === entry.target.id) state.section = null;
+    });
+  }, { rootMargin: '-50% 0px -50% 0px' });
+  sectionIds.forEach((id) => {
+    const el = document.getElementById(id);
+    if (el) observer.observe(el);
+  });
+
+  let last = performance.now();
+  const tick = (now) => {
+    if (state.recording) state.frames.push([now - last, state.section]);
+    last = now;
+    requestAnimationFrame(tick);
+  };
+  requestAnimationFrame(tick);
+
+  try {
+    new PerformanceObserver((list) => {
+      if (!state.recording) return;
+      list.getEntries().forEach((entry) => state.longTasks.push([entry.duration, state.section]));
+    }).observe({ type: 'longtask' });
+  } catch (e) {}
+}
+"""
+
+# Installed before any page script runs. React reports every commit to the
+# DevTools hook when one is present, so a minimal stand-in counts them.
+_COMMIT_HOOK_JS = """
+(() => {
+  const commits = [];
+  window.__reactCommits = commits;
+  window.__REACT_DEVTOOLS_GLOBAL_HOOK__ = {
+    renderers: new Map(),
+    supportsFiber: true,
+    inject(renderer) { this.renderers.set(this.renderers.size + 1, renderer); return this.renderers.size; },
+    onCommitFiberRoot() {
+      const state = window.__frameProfile;
+      if (state && state.recording) commits.push(state.section);
+    },
+    onCommitFiberUnmount() {},
+    onPostCommitFiberRoot() {},
+    checkDCE() {},
+  };
+})()
+"""
+
+_NEXT_FRAMES_JS = "() => new Promise((r) => requestAnimationFrame(() => requestAnimationFrame(r)))"
+_AT_BOTTOM_JS = "() => window.scrollY + window.innerHeight >= document.documentElement.scrollHeight - 1"
+
+
+def dropped_frames(delta):
+    """Number of vsyncs missed by a frame that took ``delta`` milliseconds."""
+    return max(0, round(delta / FRAME_BUDGET_MS) - 1)
+
+
+def analyze(frames, long_tasks, sections=SECTIONS, commits=()):
+    """Group raw ``[delta, section]`` samples into a per-section jank report."""
+    report = {}
+    for section in sections:
+        deltas = [delta for delta, where in frames if where == section]
+        tasks = [duration for duration, where in long_tasks if where == section]
+        dropped = sum(dropped_frames(d) for d in deltas)
+        expected = len(deltas) + dropped
+        report[section] = {
+            "frames": len(deltas),
+            "dropped": dropped,
+            "dropped_pct": round(100 * dropped / expected, 2) if expected else 0.0,
+            "worst_frames_ms": [round(d, 1) for d in sorted(deltas, reverse=True)[:WORST_FRAMES]],
+            "long_tasks": len(tasks),
+            "long_task_ms": round(sum(tasks), 1),
+            "react_commits": sum(1 for where in commits if where == section),
+        }
+    return report
+
+
+async def profile(context, step=120, trace_path=None, sections=SECTIONS, max_steps=MAX_STEPS,
+                  timeout=TIMEOUT_S):
+    """Scroll the home page once; returns ``{steps, truncated, sections}``."""
+    page = await context.new_page()
+    try:
+        await page.add_init_script(_COMMIT_HOOK_JS)
+        await page.goto(BASE_URL, wait_until="load", timeout=30000)
+        await wait_for_hydration(page)
+        await page.evaluate(_RECORDER_JS, sections)
+        await page.mouse.move(640, 360)
+
+        browser = context.browser
+        if trace_path:
+            await browser.start_tracing(page=page, path=str(trace_path), categories=TRACE_CATEGORIES)
+        steps = 0
+        deadline = time.perf_counter() + timeout
+        try:
+            await page.evaluate("() => { window.__frameProfile.recording = true }")
+            while not (at_bottom := await page.evaluate(_AT_BOTTOM_JS)):
+                if steps >= max_steps or time.perf_counter() > deadline:
+                    break
+                await page.mouse.wheel(0, step)
+                await page.evaluate(_NEXT_FRAMES_JS)
+                steps += 1
+            await page.evaluate("() => { window.__frameProfile.recording = false }")
+        finally:
+            if trace_path:
+                await browser.stop_tracing()
+
+        state = await page.evaluate("() => window.__frameProfile")
+        commits = await page.evaluate("() => window.__reactCommits")
+        return {
+            "steps": steps,
+            "truncated": not at_bottom,
+            "sections": analyze(state["frames"], state["longTasks"], sections, commits),
+        }
+    finally:
+        await page.close()
+
+
+def print_report(report):
+    if report["truncated"]:
+        print(f"TRUNCATED: bottom of the page not reached after {report['steps']} wheel steps")
+    print(f"{'section':<12}{'frames':>8}{'dropped':>9}{'drop %':>8}{'long tasks':>12}{'commits':>9}"
+          "  worst frames (ms)")
+    for section, stats in report["sections"].items():
+        worst = ", ".join(f"{d:.1f}" for d in stats["worst_frames_ms"])
+        print(f"{section:<12}{stats['frames']:>8}{stats['dropped']:>9}{stats['dropped_pct']:>7.1f}%"
+              f"{stats['long_tasks']:>12}{stats['react_commits']:>9}  {worst}")
+
+
+async def main_async(args):
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, SHARED_LAUNCH_ARGS)
+        try:
+            context = await new_context(browser)
+            return await profile(context, args.step, args.trace, max_steps=args.max_steps,
+                                 timeout=args.timeout)
+        finally:
+            await browser.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--step", type=int, default=120, help="pixels per wheel event (default: 120)")
+    parser.add_argument("--max-steps", type=int, default=MAX_STEPS,
+                        help=f"stop scrolling after this many wheel events (default: {MAX_STEPS})")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT_S,
+                        help=f"stop scrolling after this many seconds (default: {TIMEOUT_S})")
+    parser.add_argument("--trace", type=Path, help="write a Chromium trace of the scroll to this file")
+    parser.add_argument("--json", dest="json_path", type=Path, help="write the report to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(main_async(args))
+    print_report(report)
+    if args.json_path:
+        args.json_path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Shared Playwright plumbing for the TestSprite TC scripts.
+
+Every TC module exposes ``run_flow(context)`` which drives one scenario inside
+an already-created browser context. ``run_test()`` wraps that flow with its own
+browser so each script still runs on its own, while ``run_suite.py`` reuses a
+single browser for all of them.
+
+Set ``NETWORK_CACHE=replay`` to serve static assets recorded by
+``record_network.py`` from disk in every context (see ``network_cache.py``).
+"""
+
+import os
+import unittest
+
+from playwright import async_api
+
+import network_cache
+
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:3000").rstrip("/")
+NETWORK_CACHE = os.environ.get("NETWORK_CACHE", "off")
+
+# Chromium flags used by the generated scripts. ``--single-process`` keeps a
+# one-off run cheap, but it cannot host several contexts at once, so the shared
+# runner launches with ``SHARED_LAUNCH_ARGS`` instead.
+LAUNCH_ARGS = [
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--ipc=host",                     # Use host-level IPC for better stability
+    "--single-process",               # Run the browser in a single process mode
+]
+SHARED_LAUNCH_ARGS = [arg for arg in LAUNCH_ARGS if arg != "--single-process"]
+
+DEFAULT_TIMEOUT_MS = 5000
+
+
+async def launch_browser(pw, args=None):
+    """Launch headless Chromium with the suite's standard flags."""
+    return await pw.chromium.launch(headless=True, args=args or LAUNCH_ARGS)
+
+
+async def new_context(browser):
+    """Create an isolated context (like an incognito window) with suite defaults."""
+    context = await browser.new_context()
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    if NETWORK_CACHE == "replay":
+        await network_cache.replay(context, BASE_URL)
+    return context
+
+
+async def open_page(context, url=BASE_URL):
+    """Open ``url`` in a fresh page and wait for the document and its iframes."""
+    page = await context.new_page()
+
+    # Navigate to the target URL and wait until the network request is committed
+    await page.goto(url, wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+    try:
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
+        try:
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
+        except async_api.Error:
+            pass
+
+    return page
+
+
+async def run_standalone(flow):
+    """Run a single ``flow(context)`` with its own Playwright session and browser."""
+    pw = None
+    browser = None
+    context = None
+
+    try:
+        pw = await async_api.async_playwright().start()
+        browser = await launch_browser(pw)
+        context = await new_context(browser)
+        await flow(context)
+    except unittest.SkipTest as exc:
+        print(f"SKIPPED: {exc}")
+    finally:
+        if context:
+            await context.close()
+        if browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
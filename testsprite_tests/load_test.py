@@ -0,0 +1,272 @@
+"""Load generator for the analytics and contact API routes.
+
+Virtual users replay what real clients send:
+
+* web-vitals beacons: one metric object per request in the shape the
+  ``web-vitals`` callbacks report (``name``, ``value``, ``rating``, ``delta``,
+  ``id``, ``navigationType``)
+* batched ``pageview`` / ``event`` payloads from ``lib/analytics.ts``, 1 to 20
+  per request as the client queue flushes them
+* optionally, valid contact form submissions (``--contact-share``)
+
+Concurrency ramps through ``--stages``. Every stage runs for
+``--stage-seconds`` with that many users in a closed loop, each user sending
+from its own ``X-Forwarded-For`` address like a separate client, so the
+per-client rate limits apply as they would in production; 429s are reported
+apart from errors. With no proxy in between, that single entry is the last
+hop the server keys on (``lib/rate-limit.ts``). ``--fresh-ips`` gives every
+request a new address instead, to measure the routes themselves. Each stage reports throughput, the latency
+distribution and error rates. Start the server with ``npm run build && npm run start`` so the numbers reflect
+production.
+
+Usage::
+
+    python testsprite_tests/load_test.py [--stages 1,2,4,8,16,32] [--stage-seconds 10]
+                                         [--contact-share 0] [--fresh-ips] [--json out.json]
+                                         [--compare previous.json]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from playwright import async_api
+
+from harness import BASE_URL
+from vitals import percentile
+
+ROUTES = ["/", "/work", "/about", "/work/toy-search-engine"]
+
+# (name, typical value, "good" threshold, "poor" threshold), as web-vitals rates them
+VITALS = [
+    ("CLS", 0.05, 0.1, 0.25),
+    ("FCP", 1400, 1800, 3000),
+    ("LCP", 2000, 2500, 4000),
+    ("TTFB", 500, 800, 1800),
+    ("INP", 120, 200, 500),
+]
+
+INTERACTIONS = [
+    ("navigation", "click", "Work"),
+    ("navigation", "click", "Contact"),
+    ("theme", "toggle", "dark"),
+    ("project", "view", "toy-search-engine"),
+    ("resume", "download", "nav"),
+]
+
+# Upper bounds (ms) of the latency histogram buckets; the last one is open
+HISTOGRAM_BOUNDS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def page_url(rng):
+    return BASE_URL.rstrip("/") + rng.choice(ROUTES)
+
+
+def vital_payload(rng):
+    name, typical, good, poor = rng.choice(VITALS)
+    value = rng.lognormvariate(0, 0.5) * typical
+    rating = "good" if value <= good else "needs-improvement" if value <= poor else "poor"
+    return {
+        "name": name,
+        "value": round(value, 4),
+        "rating": rating,
+        "delta": round(value, 4),
+        "id": f"v4-{int(time.time() * 1000)}-{rng.randrange(10 ** 12)}",
+        "navigationType": rng.choice(["navigate", "reload", "back-forward"]),
+        "url": page_url(rng),
+    }
+
+
+def event_payload(rng):
+    url = page_url(rng)
+    if rng.random() < 0.4:
+        return {
+            "type": "pageview",
+            "url": url,
+            "page_title": "Laxmideepak Nelapatla - Software Engineer & AI Enthusiast",
+            "page_location": url,
+            "page_referrer": BASE_URL,
+            "timestamp": now_iso(),
+        }
+    category, action, label = rng.choice(INTERACTIONS)
+    return {
+        "type": "event",
+        "event": "interaction",
+        "category": category,
+        "action": action,
+        "label": label,
+        "url": url,
+        "timestamp": now_iso(),
+    }
+
+
+def contact_payload(rng):
+    # Unique text so the queue's duplicate detection does not absorb it
+    token = uuid.uuid4().hex[:8]
+    return {
+        "name": "Load Test",
+        "email": f"load-{token}@example.com",
+        "subject": f"Load test {token}",
+        "message": f"Load test message {token}, safe to ignore.",
+        "website": "",
+    }
+
+
+def next_request(rng, contact_share):
+    """Pick the next request a user sends: ``(kind, path, body, event_count)``."""
+    roll = rng.random()
+    if roll < contact_share:
+        return "contact", "/api/contact", contact_payload(rng), 1
+    if roll < contact_share + (1 - contact_share) * 0.5:
+        return "vitals", "/api/analytics", vital_payload(rng), 1
+    batch = [event_payload(rng) for _ in range(rng.randint(1, 20))]
+    return "events", "/api/analytics", batch, len(batch)
+
+
+class StageStats:
+    def __init__(self, users):
+        self.users = users
+        self.latencies = []
+        self.statuses = {}
+        self.kinds = {}
+        self.events = 0
+
+    def record(self, kind, status, elapsed_ms, events):
+        self.latencies.append(elapsed_ms)
+        key = str(status)
+        self.statuses[key] = self.statuses.get(key, 0) + 1
+        self.kinds[kind] = self.kinds.get(kind, 0) + 1
+        if 200 <= status < 300:
+            self.events += events
+
+    def summary(self, duration):
+        total = len(self.latencies)
+        ok = sum(count for status, count in self.statuses.items() if status.startswith("2"))
+        limited = self.statuses.get("429", 0)
+        histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        for latency in self.latencies:
+            index = next((i for i, bound in enumerate(HISTOGRAM_BOUNDS) if latency <= bound), len(HISTOGRAM_BOUNDS))
+            histogram[index] += 1
+        labels = [f"<={bound}ms" for bound in HISTOGRAM_BOUNDS] + [f">{HISTOGRAM_BOUNDS[-1]}ms"]
+        return {
+            "users": self.users,
+            "duration_s": round(duration, 2),
+            "requests": total,
+            "throughput_rps": round(total / duration, 1) if duration else 0.0,
+            "events_per_s": round(self.events / duration, 1) if duration else 0.0,
+            "error_rate": round((total - ok - limited) / total, 4) if total else 0.0,
+            "rate_limited_rate": round(limited / total, 4) if total else 0.0,
+            "statuses": self.statuses,
+            "kinds": self.kinds,
+            "latency_ms": {f"p{p}": round(percentile(self.latencies, p), 1) if total else None
+                           for p in (50, 90, 95, 99)},
+            "histogram": dict(zip(labels, histogram)),
+        }
+
+
+def random_ip(rng):
+    return f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}"
+
+
+async def user(request, user_id, deadline, stats, config):
+    rng = random.Random(config["seed"] * 100_003 + user_id)
+    ip = random_ip(random.Random())
+    while time.perf_counter() < deadline:
+        kind, path, body, events = next_request(rng, config["contact_share"])
+        if config["fresh_ips"]:
+            ip = random_ip(rng)
+        start = time.perf_counter()
+        try:
+            response = await request.post(path, data=body, headers={"X-Forwarded-For": ip},
+                                          fail_on_status_code=False)
+            status = response.status
+        except Exception:
+            status = 0  # connection error or timeout
+        stats.record(kind, status, (time.perf_counter() - start) * 1000, events)
+
+
+async def run_stage(request, users, config):
+    stats = StageStats(users)
+    start = time.perf_counter()
+    deadline = start + config["stage_seconds"]
+    await asyncio.gather(*(user(request, i, deadline, stats, config) for i in range(users)))
+    return stats.summary(time.perf_counter() - start)
+
+
+async def main_async(config):
+    async with async_api.async_playwright() as pw:
+        request = await pw.request.new_context(base_url=BASE_URL, timeout=30000)
+        try:
+            results = []
+            for users in config["stages"]:
+                summary = await run_stage(request, users, config)
+                print_stage(summary)
+                results.append(summary)
+            return results
+        finally:
+            await request.dispose()
+
+
+def print_stage(stage, previous=None):
+    line = (f"{stage['users']:>5} users  {stage['throughput_rps']:>8.1f} req/s  {stage['events_per_s']:>8.1f} events/s"
+            f"  p50 {stage['latency_ms']['p50']:>7} ms  p95 {stage['latency_ms']['p95']:>7} ms"
+            f"  errors {100 * stage['error_rate']:5.1f}%  429 {100 * stage['rate_limited_rate']:5.1f}%")
+    if previous:
+        delta = stage["throughput_rps"] - previous["throughput_rps"]
+        line += f"  (was {previous['throughput_rps']:.1f} req/s, {delta:+.1f})"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stages", default="1,2,4,8,16,32",
+                        help="comma-separated concurrent user counts (default: 1,2,4,8,16,32)")
+    parser.add_argument("--stage-seconds", type=float, default=10.0,
+                        help="duration of each stage (default: 10)")
+    parser.add_argument("--contact-share", type=float, default=0.0,
+                        help="fraction of requests that are contact submissions (default: 0)")
+    parser.add_argument("--fresh-ips", action="store_true",
+                        help="send every request from a new client address, sidestepping the rate limits")
+    parser.add_argument("--seed", type=int, default=1, help="payload random seed (default: 1)")
+    parser.add_argument("--json", dest="json_path", type=Path, help="write the results to this file")
+    parser.add_argument("--compare", dest="baseline_path", type=Path,
+                        help="show throughput next to a previous --json run")
+    args = parser.parse_args()
+
+    config = {
+        "stages": [int(users) for users in args.stages.split(",")],
+        "stage_seconds": args.stage_seconds,
+        "contact_share": args.contact_share,
+        "fresh_ips": args.fresh_ips,
+        "seed": args.seed,
+    }
+    started = now_iso()
+    results = asyncio.run(main_async(config))
+
+    if args.baseline_path:
+        baseline = {s["users"]: s for s in json.loads(args.baseline_path.read_text())["stages"]}
+        print(f"\nCompared with {args.baseline_path}:")
+        for stage in results:
+            print_stage(stage, baseline.get(stage["users"]))
+
+    if args.json_path:
+        report = {
+            "base_url": BASE_URL,
+            "started": started,
+            "config": config,
+            "stages": results,
+        }
+        args.json_path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Stable locators for the elements the TC scripts interact with.
+
+The generated scripts addressed elements by absolute XPath
+(``html/body/div[55]/header/...``), so any decorative node added to or
+removed from ``<body>`` shifted every index and broke them. These locate by
+role and accessible name, by id, or by ``data-testid`` where an element has
+neither.
+"""
+
+
+def nav_link(page, label):
+    """A link in the navigation bar, e.g. ``Work``, ``About`` or ``Contact``."""
+    nav = page.get_by_role("navigation", name="Primary navigation")
+    return nav.get_by_role("link", name=label, exact=True)
+
+
+def home_link(page):
+    """The site name at the start of the navigation bar."""
+    return page.get_by_role("link", name="Laxmideepak Nelapatla - Home")
+
+
+def nav_button(page, name):
+    """A button in the navigation bar, e.g. ``Email me`` or ``Open sections menu``."""
+    return page.locator("header").get_by_role("button", name=name)
+
+
+def theme_toggle(page):
+    """The button opening the theme menu (only the one for the current breakpoint is visible)."""
+    return page.get_by_role("button", name="Toggle theme")
+
+
+def theme_menu(page):
+    return page.get_by_role("menu")
+
+
+def theme_option(page, name):
+    """``Light``, ``Dark`` or ``System`` in the open theme menu."""
+    return theme_menu(page).get_by_role("menuitem", name=name)
+
+
+def section(page, section_id):
+    """A home page section by id: ``hero``, ``experience``, ``certifications``, ..."""
+    return page.locator(f"section#{section_id}")
+
+
+def contact_modal(page):
+    return page.get_by_test_id("contact-modal")
+
+
+def contact_field(page, label):
+    """A contact form field by its label, e.g. ``Your Email``."""
+    return contact_modal(page).get_by_label(label, exact=True)
+
+
+def contact_field_error(page, field_id, text):
+    """The validation message under a contact form field, matched by its text."""
+    return contact_modal(page).locator(f"div:has(> #{field_id}) > span", has_text=text)
+
+
+def contact_channel(page, host):
+    """A direct-contact link below the contact button: ``mailto:``, ``github.com`` or ``linkedin.com``."""
+    return page.get_by_test_id("contact-channels").locator(f'a[href*="{host}"]')
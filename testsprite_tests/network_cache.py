@@ -0,0 +1,190 @@
+"""Content-addressed cache of the site's static assets for replaying test runs.
+
+``record_network.py`` loads each route once from a production build and
+records a HAR of the static assets it fetched: ``/_next/static`` chunks and
+fonts, ``/_next/image``, ``/_img``, ``/_previews``, ``/documents`` PDFs and
+other public files. Response bodies are stored once under their SHA-256 in
+``.data/network-cache/blobs/``, so a chunk shared by every route is kept a
+single time, and ``index.json`` maps each URL (path and query, so the cache
+works for any ``BASE_URL``) to its blob and headers.
+
+With ``NETWORK_CACHE=replay``, ``harness.new_context()`` calls ``replay()``
+so every context serves those URLs from disk via ``context.route``. Pages
+and ``/api/*`` still go to the live server, as does any asset the cache has
+not seen (a miss falls back to the network, so a stale cache costs time but
+not correctness). Hashed chunk URLs change with every build, so re-record
+after ``npm run build``. When ``.next/BUILD_ID`` no longer matches the
+recorded build, ``replay()`` only serves URLs whose name pins their content
+(``/_next/static/``, ``/_img/``, ``/_previews/``, ``/documents/``); anything
+else, such as ``/_next/image`` or plain public files, goes to the network so
+tests never run against a stale copy.
+
+Every run counts what was served from the cache and what fell through to the
+network, split into URLs never recorded and entries skipped as another
+build's. Counts are kept per context, so ``run_suite.py`` reports them per
+test, and summed in ``STATS`` for the whole run.
+"""
+
+import hashlib
+import json
+import re
+import shutil
+import sys
+import weakref
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = REPO_ROOT / ".data" / "network-cache"
+BLOBS_DIR = CACHE_DIR / "blobs"
+HARS_DIR = CACHE_DIR / "har"
+INDEX_FILE = CACHE_DIR / "index.json"
+BUILD_ID_FILE = REPO_ROOT / ".next" / "BUILD_ID"
+
+# Headers worth replaying. Bodies are stored decoded, so content-encoding and
+# content-length from the original response would be wrong.
+KEPT_HEADERS = {"content-type", "cache-control", "etag", "last-modified", "vary", "accept-ranges"}
+
+# URLs whose path changes whenever their content does, so they are safe to
+# replay from a recording of another build
+CONTENT_HASHED = re.compile(r"^/(?:_next/static/|_img/|_previews/|documents/)")
+
+# Replay counts for this process, printed by run_suite.py: requests served
+# from the cache (and their bytes), requests for URLs never recorded, and
+# recorded entries skipped because they belong to another build
+STATS = {"hits": 0, "hit_bytes": 0, "misses": 0, "stale": 0}
+
+_context_stats = weakref.WeakKeyDictionary()
+
+_index = None
+_stale = False
+
+
+def static_pattern(base_url):
+    """Regex for same-origin static asset URLs; never matches ``/api/``."""
+    origin = re.escape(base_url.rstrip("/"))
+    return re.compile(
+        "^" + origin + r"/(?!api/)(?:_next/static/|_next/image\?|_img/|_previews/|documents/"
+        r"|[^?#]+\.(?:js|css|woff2?|ttf|png|jpe?g|gif|webp|avif|svg|ico|pdf)(?:[?#]|$))"
+    )
+
+
+def cache_key(url, base_url):
+    """``http://localhost:3000/_next/x.js?v=1#f`` -> ``/_next/x.js?v=1``."""
+    path = url[len(base_url.rstrip("/")):] if url.startswith(base_url.rstrip("/")) else url
+    return path.split("#", 1)[0] or "/"
+
+
+def blob_path(sha256):
+    return BLOBS_DIR / sha256[:2] / sha256
+
+
+def current_build_id():
+    """ID of the local production build, or None without one."""
+    return BUILD_ID_FILE.read_text().strip() if BUILD_ID_FILE.exists() else None
+
+
+def load_index():
+    if INDEX_FILE.exists():
+        return json.loads(INDEX_FILE.read_text())
+    return {"build_id": None, "routes": {}, "entries": {}}
+
+
+def save_index(index):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    INDEX_FILE.write_text(json.dumps(index, indent=2, sort_keys=True) + "\n")
+
+
+def stats_for(context):
+    """Replay counts for one context, or None if it is not replaying."""
+    return _context_stats.get(context)
+
+
+def _count(stats, key, amount=1):
+    for counts in (STATS, stats):
+        counts[key] += amount
+
+
+def format_stats(stats):
+    """``"40 served from cache (1.2 MB), 5 to the network (3 not recorded, 2 from another build)"``."""
+    fell_through = stats["misses"] + stats["stale"]
+    return (f"{stats['hits']} served from cache ({stats['hit_bytes'] / 1e6:.1f} MB), "
+            f"{fell_through} to the network ({stats['misses']} not recorded, "
+            f"{stats['stale']} from another build)")
+
+
+def clear():
+    """Delete every recorded HAR, blob and the index."""
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+
+def store_blob(body):
+    """Write ``body`` under its SHA-256 unless already stored; returns the hash."""
+    sha256 = hashlib.sha256(body).hexdigest()
+    target = blob_path(sha256)
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(body)
+    return sha256
+
+
+def ingest_har(har_path, name, base_url):
+    """Move the bodies of a HAR recorded with ``record_har_content="attach"``
+    into the blob store and return its index entries.
+
+    The HAR is rewritten to ``har/<name>.har`` with each ``_file`` pointing at
+    its blob, so it stays loadable with Playwright's own ``route_from_har``.
+    """
+    har = json.loads(har_path.read_text())
+    entries = {}
+    for entry in har["log"]["entries"]:
+        request, response = entry["request"], entry["response"]
+        attachment = response.get("content", {}).get("_file")
+        if request["method"] != "GET" or response["status"] != 200 or not attachment:
+            continue
+        sha256 = store_blob((har_path.parent / attachment).read_bytes())
+        response["content"]["_file"] = "../" + blob_path(sha256).relative_to(CACHE_DIR).as_posix()
+        entries[cache_key(request["url"], base_url)] = {
+            "sha256": sha256,
+            "headers": {h["name"].lower(): h["value"] for h in response["headers"]
+                        if h["name"].lower() in KEPT_HEADERS},
+        }
+
+    HARS_DIR.mkdir(parents=True, exist_ok=True)
+    (HARS_DIR / f"{name}.har").write_text(json.dumps(har))
+    return entries
+
+
+async def replay(context, base_url):
+    """Serve cached static assets in ``context``; everything else goes live."""
+    global _index, _stale
+    if _index is None:
+        _index = load_index()
+        _stale = _index["build_id"] != current_build_id()
+        if not _index["entries"]:
+            print("network cache: nothing recorded, run testsprite_tests/record_network.py", file=sys.stderr)
+        elif _stale:
+            print("network cache: recorded for another build, replaying content-hashed assets only; "
+                  "refresh with testsprite_tests/record_network.py --refresh", file=sys.stderr)
+    entries = _index["entries"]
+    if not entries:
+        return
+    stats = _context_stats[context] = {key: 0 for key in STATS}
+
+    async def serve(route):
+        request = route.request
+        key = cache_key(request.url, base_url)
+        entry = entries.get(key) if request.method == "GET" else None
+        if entry is not None and _stale and not CONTENT_HASHED.match(key):
+            _count(stats, "stale")
+            await route.fallback()
+            return
+        if entry is None or not blob_path(entry["sha256"]).exists():
+            _count(stats, "misses")
+            await route.fallback()
+            return
+        path = blob_path(entry["sha256"])
+        _count(stats, "hits")
+        _count(stats, "hit_bytes", path.stat().st_size)
+        await route.fulfill(status=200, headers=entry["headers"], path=path)
+
+    await context.route(static_pattern(base_url), serve)
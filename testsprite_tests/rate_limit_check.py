@@ -0,0 +1,134 @@
+"""Load test for the API rate limits and body size caps.
+
+Fires a concurrent burst at ``/api/analytics`` from one client address and
+checks what ``lib/rate-limit.ts`` promises:
+
+* at most ``capacity`` requests in the burst are accepted, every other one is
+  a 429 carrying a positive ``Retry-After``
+* a different client address still gets through right away
+* the same client is not limited on another route (``/api/contact``)
+* a body over the cap is refused with 413
+
+Client addresses are set through ``X-Forwarded-For`` and randomized per run,
+so repeated runs against one server start with fresh buckets. Sent straight
+to ``npm run start``, that entry is the last hop, which is what the server
+keys on.
+
+Usage::
+
+    python testsprite_tests/rate_limit_check.py [--burst 60] [--json report.json]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from pathlib import Path
+
+from playwright import async_api
+
+from harness import BASE_URL
+from vitals import percentile
+
+# Must match app/api/analytics/route.ts
+ANALYTICS_CAPACITY = 30
+ANALYTICS_MAX_BODY = 64 * 1024
+
+EVENT = {"type": "event", "event": "interaction", "category": "load-test", "action": "burst"}
+
+
+def random_ip():
+    # TEST-NET-3, never a real client
+    return f"203.0.113.{random.randint(1, 254)}"
+
+
+async def post(request, path, ip, data):
+    start = time.perf_counter()
+    response = await request.post(path, data=data, headers={"X-Forwarded-For": ip}, fail_on_status_code=False)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return response.status, response.headers.get("retry-after"), elapsed_ms
+
+
+async def burst(request, ip, count):
+    start = time.perf_counter()
+    results = await asyncio.gather(*(post(request, "/api/analytics", ip, [EVENT]) for _ in range(count)))
+    wall = time.perf_counter() - start
+    latencies = [elapsed for _, _, elapsed in results]
+    return results, {
+        "requests": count,
+        "accepted": sum(1 for status, _, _ in results if status == 200),
+        "limited": sum(1 for status, _, _ in results if status == 429),
+        "other": sorted({status for status, _, _ in results if status not in (200, 429)}),
+        "throughput_rps": round(count / wall, 1),
+        "latency_ms": {f"p{p}": round(percentile(latencies, p), 1) for p in (50, 95, 99)},
+    }
+
+
+async def check(request, burst_size):
+    """Run every scenario; returns ``(report, failures)``."""
+    failures = []
+    ip = random_ip()
+
+    results, report = await burst(request, ip, burst_size)
+    if report["accepted"] > ANALYTICS_CAPACITY:
+        failures.append(f"{report['accepted']} of {burst_size} burst requests accepted, capacity is {ANALYTICS_CAPACITY}")
+    if burst_size > ANALYTICS_CAPACITY and report["limited"] == 0:
+        failures.append("burst past capacity was never limited")
+    if report["other"]:
+        failures.append(f"unexpected statuses in burst: {report['other']}")
+    bad_retry = [retry for status, retry, _ in results if status == 429 and not (retry and int(retry) > 0)]
+    if bad_retry:
+        failures.append(f"{len(bad_retry)} 429 responses without a positive Retry-After")
+
+    other_ip = ip
+    while other_ip == ip:
+        other_ip = random_ip()
+    status, _, _ = await post(request, "/api/analytics", other_ip, [EVENT])
+    report["other_client_status"] = status
+    if status != 200:
+        failures.append(f"a different client got {status} right after the burst")
+
+    # Invalid on purpose: anything but 429 shows the bucket is per route
+    status, _, _ = await post(request, "/api/contact", ip, {})
+    report["other_route_status"] = status
+    if status == 429:
+        failures.append("limited on /api/contact after a burst on /api/analytics")
+
+    oversized = [EVENT | {"padding": "x" * 1024} for _ in range(ANALYTICS_MAX_BODY // 1024 + 1)]
+    status, _, _ = await post(request, "/api/analytics", random_ip(), oversized)
+    report["oversized_status"] = status
+    if status != 413:
+        failures.append(f"oversized body got {status}, expected 413")
+
+    return report, failures
+
+
+async def main_async(args):
+    async with async_api.async_playwright() as pw:
+        request = await pw.request.new_context(base_url=BASE_URL)
+        try:
+            return await check(request, args.burst)
+        finally:
+            await request.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--burst", type=int, default=2 * ANALYTICS_CAPACITY,
+                        help=f"concurrent requests in the burst (default: {2 * ANALYTICS_CAPACITY})")
+    parser.add_argument("--json", dest="json_path", type=Path, help="write the report to this file")
+    args = parser.parse_args()
+
+    report, failures = asyncio.run(main_async(args))
+    print(json.dumps(report, indent=2))
+    if args.json_path:
+        args.json_path.write_text(json.dumps(report, indent=2) + "\n")
+    if failures:
+        print("\nFAILED:\n" + "\n".join(f"  - {failure}" for failure in failures))
+        raise SystemExit(1)
+    print("\nRate limits and body caps behave as configured.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Record the static assets each route loads into the network replay cache.
+
+Run once against a production build (``npm run build && npm run start``),
+then run the suite with ``NETWORK_CACHE=replay`` to serve JS chunks, fonts,
+images and PDFs from ``.data/network-cache/`` instead of the server (see
+``network_cache.py``). Each route is loaded in its own context recording a
+HAR, scrolled to the bottom so lazy images and below-the-fold chunks are
+fetched too, and its assets are added to the shared content-addressed store.
+
+Routes already recorded for the current ``.next/BUILD_ID`` are skipped.
+After a new build they are all recorded again, and ``--refresh`` discards
+the cache and starts over regardless. Recording against ``npm run dev`` is
+refused: its chunks are unhashed and change on every recompile.
+
+Usage::
+
+    python testsprite_tests/record_network.py [--refresh] [--route /about ...]
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from playwright import async_api
+
+import network_cache
+from harness import BASE_URL, SHARED_LAUNCH_ARGS, launch_browser
+from vitals import ROUTES
+
+PROJECTS_FILE = network_cache.REPO_ROOT / "content" / "projects.json"
+
+# Only requested by the dev server
+DEV_MARKER = re.compile(r"/_next/webpack-hmr|/_next/static/development/|/__nextjs_original-stack-frame")
+
+_SCROLL_JS = """
+async () => {
+  for (let y = 0; y < document.body.scrollHeight; y += window.innerHeight / 2) {
+    window.scrollTo(0, y);
+    await new Promise((resolve) => setTimeout(resolve, 100));
+  }
+  window.scrollTo(0, 0);
+}
+"""
+
+
+def all_routes():
+    """The benchmarked routes plus every project page."""
+    slugs = [project["slug"] for project in json.loads(PROJECTS_FILE.read_text())]
+    return list(dict.fromkeys(ROUTES + [f"/work/{slug}" for slug in slugs]))
+
+
+def har_name(route):
+    """``/work/toy-search-engine`` -> ``work-toy-search-engine``, ``/`` -> ``index``."""
+    return route.strip("/").replace("/", "-") or "index"
+
+
+async def record_route(browser, route, workdir):
+    """Load ``route`` with HAR recording on; returns its cache index entries."""
+    har_path = Path(workdir) / "route.har"
+    dev_requests = []
+
+    def note_dev_request(request):
+        if DEV_MARKER.search(request.url):
+            dev_requests.append(request.url)
+
+    context = await browser.new_context(
+        record_har_path=har_path,
+        record_har_content="attach",
+        record_har_url_filter=network_cache.static_pattern(BASE_URL),
+    )
+    try:
+        context.on("request", note_dev_request)
+        page = await context.new_page()
+        await page.goto(BASE_URL + route, wait_until="load", timeout=30000)
+        await page.evaluate(_SCROLL_JS)
+        try:
+            await page.wait_for_load_state("networkidle", timeout=10000)
+        except async_api.Error:
+            pass
+    finally:
+        # The HAR and its attachments are written on close
+        await context.close()
+
+    if dev_requests:
+        raise SystemExit(f"{BASE_URL} is a dev server ({dev_requests[0]}); "
+                         "record from `npm run build && npm run start`")
+    return network_cache.ingest_har(har_path, har_name(route), BASE_URL)
+
+
+async def main_async(args):
+    build_id = network_cache.current_build_id()
+    index = network_cache.load_index()
+    if args.refresh or index["build_id"] != build_id:
+        network_cache.clear()
+        index = {"build_id": build_id, "routes": {}, "entries": {}}
+
+    routes = args.routes or [r for r in all_routes() if r not in index["routes"]]
+    if not routes:
+        print(f"all routes already recorded for build {build_id}; use --refresh to re-record")
+        return index
+
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, SHARED_LAUNCH_ARGS)
+        try:
+            for route in routes:
+                with tempfile.TemporaryDirectory() as workdir:
+                    entries = await record_route(browser, route, workdir)
+                index["entries"].update(entries)
+                index["routes"][route] = {
+                    "har": f"{har_name(route)}.har",
+                    "assets": len(entries),
+                    "recorded": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                }
+                network_cache.save_index(index)
+                print(f"{route}: {len(entries)} assets")
+        finally:
+            await browser.close()
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--refresh", action="store_true",
+                        help="discard the cache and record every route again (e.g. after a new build)")
+    parser.add_argument("--route", dest="routes", action="append",
+                        help="record only this route, even if already recorded (repeatable)")
+    args = parser.parse_args()
+
+    index = asyncio.run(main_async(args))
+    blobs = {entry["sha256"] for entry in index["entries"].values()}
+    size = sum(network_cache.blob_path(sha256).stat().st_size for sha256 in blobs)
+    print(f"{len(index['entries'])} URLs in {len(blobs)} blobs ({size / 1e6:.1f} MB) "
+          f"under {network_cache.CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
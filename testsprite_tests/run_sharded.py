@@ -0,0 +1,214 @@
+"""Run the TC scripts in shards across worker processes, one browser per worker.
+
+``run_suite.py`` runs everything in one browser, which caps it at roughly
+one core. Here the scripts are split into one shard per worker and each
+worker process runs its shard through ``run_suite`` with its own Chromium.
+The per-test results are merged into one report.
+
+Shards are balanced by how long each test took before, using longest first
+onto the least loaded shard. Durations come from the last sharded run
+(``.data/test-durations.json``), ``--history`` reports (``run_suite.py
+--json`` output, or a list of TestSprite records where they carry a
+``duration``) or, for tests never timed, the median of the known ones. Scripts marked ``SERIAL`` (TC012's
+throttled benchmark) are kept out of the shards and run alone once every
+worker has finished.
+
+Usage::
+
+    python testsprite_tests/run_sharded.py [-w 8] [-j 1] [-k TC001] [--history report.json]
+                                           [--json out.json] [--compare previous.json]
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import multiprocessing
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import network_cache
+from harness import NETWORK_CACHE
+from run_suite import TESTS_DIR, discover, is_serial, print_report, run_suite, succeeded
+
+DURATIONS_FILE = TESTS_DIR.parent / ".data" / "test-durations.json"
+
+# Assumed duration when nothing at all is known about the suite
+DEFAULT_DURATION = 10.0
+
+
+def test_id(name):
+    """``TC001`` from a file stem (``TC001_Verify_...``) or a TestSprite title (``TC001-Verify ...``)."""
+    return name.replace("-", "_").split("_", 1)[0]
+
+
+def read_durations(path):
+    """Per-test durations in seconds from a run report or TestSprite records."""
+    data = json.loads(Path(path).read_text())
+    if isinstance(data, dict):
+        # run_suite.py / run_sharded.py --json output
+        return {test_id(r["test"]): r["duration"] for r in data.get("results", [])}
+
+    # TestSprite's created/modified are authoring times, not runtimes, so only
+    # records with an actual duration count
+    return {test_id(record["title"]): float(record["duration"]) for record in data
+            if isinstance(record.get("duration"), (int, float))}
+
+
+def load_history(extra_paths=()):
+    """Merge every known duration source; later sources win."""
+    sources = [DURATIONS_FILE, *map(Path, extra_paths)]
+    durations = {}
+    for path in sources:
+        if path.exists():
+            durations.update(read_durations(path))
+    return durations
+
+
+def plan_shards(paths, durations, workers):
+    """Split ``paths`` into at most ``workers`` shards of similar predicted time.
+
+    Returns ``[(predicted_seconds, [paths])]``. Longest-first greedy keeps the
+    slowest shard within 4/3 of the best possible split.
+    """
+    known = [durations[test_id(p.stem)] for p in paths if test_id(p.stem) in durations]
+    fallback = statistics.median(known) if known else DEFAULT_DURATION
+    estimate = {p: durations.get(test_id(p.stem), fallback) for p in paths}
+
+    count = max(1, min(workers, len(paths)))
+    heap = [(0.0, index) for index in range(count)]
+    shards = [[] for _ in range(count)]
+    totals = [0.0] * count
+    for path in sorted(paths, key=lambda p: estimate[p], reverse=True):
+        total, index = heapq.heappop(heap)
+        shards[index].append(path)
+        totals[index] = total + estimate[path]
+        heapq.heappush(heap, (totals[index], index))
+
+    # Each shard still runs in suite order
+    return [(totals[i], sorted(shards[i])) for i in range(count)]
+
+
+def run_shard(paths, concurrency):
+    """Worker entry point: run one shard in this process's own browser."""
+    started = time.perf_counter()
+    results = asyncio.run(run_suite([Path(p) for p in paths], concurrency))
+    return results, time.perf_counter() - started, dict(network_cache.STATS)
+
+
+def run_sharded(shards, concurrency):
+    """Run every shard in its own process; returns ``(results, shard_reports)``."""
+    results, reports = [], []
+    # spawn, so no worker inherits the parent's event loop or file handles
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=context) as pool:
+        futures = [pool.submit(run_shard, [str(p) for p in paths], concurrency) for _, paths in shards]
+        for index, ((predicted, paths), future) in enumerate(zip(shards, futures)):
+            try:
+                shard_results, elapsed, cache_stats = future.result()
+                # Cache hits happen in the workers; add them up for the report
+                for key, count in cache_stats.items():
+                    network_cache.STATS[key] += count
+            except Exception as exc:
+                # A crashed worker (e.g. the browser failed to launch) fails its
+                # whole shard rather than the run
+                elapsed = 0.0
+                shard_results = [{"test": p.stem, "status": "ERROR", "duration": 0.0, "wait_time": 0.0,
+                                  "error": f"shard {index} crashed: {exc!r}"} for p in paths]
+            for result in shard_results:
+                result["shard"] = index
+            results.extend(shard_results)
+            reports.append({
+                "shard": index,
+                "tests": [p.stem for p in paths],
+                "predicted": round(predicted, 3),
+                "elapsed": round(elapsed, 3),
+            })
+    results.sort(key=lambda r: r["test"])
+    return results, reports
+
+
+def run_serial(paths):
+    """Run ``SERIAL`` scripts one at a time in this process, after the shards."""
+    started = time.perf_counter()
+    results = asyncio.run(run_suite(paths, 1))
+    for result in results:
+        result["shard"] = "serial"
+    report = {"shard": "serial", "tests": [p.stem for p in paths], "predicted": 0.0,
+              "elapsed": round(time.perf_counter() - started, 3)}
+    return results, report
+
+
+def save_durations(results):
+    """Remember this run's timings for the next plan; crashed tests keep their old value."""
+    DURATIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    previous = {}
+    if DURATIONS_FILE.exists():
+        previous = {r["test"]: r for r in json.loads(DURATIONS_FILE.read_text()).get("results", [])}
+    for result in results:
+        if result["duration"] > 0:
+            previous[result["test"]] = {"test": result["test"], "duration": result["duration"]}
+    DURATIONS_FILE.write_text(json.dumps({"results": sorted(previous.values(), key=lambda r: r["test"])},
+                                         indent=2) + "\n")
+
+
+def print_shards(reports, results, wall_clock):
+    print()
+    for report in reports:
+        print(f"shard {report['shard']}: {len(report['tests'])} tests, predicted {report['predicted']:.2f}s,"
+              f" took {report['elapsed']:.2f}s")
+    serial = sum(r["duration"] for r in results)
+    if wall_clock:
+        print(f"{serial / wall_clock:.1f}x faster than running the tests one after another")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes, each with its own browser (default: CPU count)")
+    parser.add_argument("-j", "--concurrency", type=int, default=1,
+                        help="tests running at once inside each worker (default: 1)")
+    parser.add_argument("-k", dest="patterns", action="append",
+                        help="only run tests whose file name contains this substring")
+    parser.add_argument("--history", action="append", default=[],
+                        help="extra report with past durations to balance shards by")
+    parser.add_argument("--json", dest="json_path", help="write the merged results to this file")
+    parser.add_argument("--compare", dest="baseline_path",
+                        help="show timings next to a previous --json report")
+    args = parser.parse_args()
+
+    paths = discover(args.patterns)
+    if not paths:
+        parser.error("no TC scripts matched")
+
+    serial = [path for path in paths if is_serial(path)]
+    sharded = [path for path in paths if path not in serial]
+    started = time.perf_counter()
+    results, reports = [], []
+    if sharded:
+        shards = plan_shards(sharded, load_history(args.history), max(1, args.workers))
+        results, reports = run_sharded(shards, max(1, args.concurrency))
+    if serial:
+        serial_results, serial_report = run_serial(serial)
+        results.extend(serial_results)
+        reports.append(serial_report)
+    wall_clock = time.perf_counter() - started
+    save_durations(results)
+
+    baseline = json.loads(Path(args.baseline_path).read_text()) if args.baseline_path else None
+    print_report(results, wall_clock, baseline)
+    print_shards(reports, results, wall_clock)
+    if args.json_path:
+        report = {"wall_clock": round(wall_clock, 3), "shards": reports, "results": results}
+        if NETWORK_CACHE == "replay":
+            report["network_cache"] = network_cache.STATS
+        Path(args.json_path).write_text(json.dumps(report, indent=2))
+
+    raise SystemExit(0 if all(succeeded(r) for r in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Run every TC script concurrently against one shared Chromium instance.
+
+Each TC module is imported for its ``run_flow(context)`` coroutine and given
+its own browser context, so tests stay isolated (cookies, localStorage) while
+the browser launch is paid once. Concurrency is bounded by a semaphore.
+Scripts that set ``SERIAL = True`` (timing benchmarks such as TC012) run
+afterwards, one at a time, with nothing else in the browser. A flow that
+raises ``unittest.SkipTest`` (e.g. TC012 without a recorded baseline) is
+reported as SKIPPED and does not fail the run.
+
+Usage::
+
+    python testsprite_tests/run_suite.py [-j 4] [-k TC001] [--json out.json]
+                                         [--compare previous.json]
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import time
+import traceback
+import unittest
+from pathlib import Path
+
+from playwright import async_api
+
+import network_cache
+from harness import NETWORK_CACHE, SHARED_LAUNCH_ARGS, launch_browser, new_context
+from waits import track_waits
+
+TESTS_DIR = Path(__file__).resolve().parent
+
+
+def discover(patterns=None):
+    """Return TC script paths in suite order, optionally filtered by substring."""
+    paths = sorted(TESTS_DIR.glob("TC[0-9]*.py"))
+    if patterns:
+        paths = [p for p in paths if any(pat in p.stem for pat in patterns)]
+    return paths
+
+
+def load_module(path):
+    """Import a TC script by path.
+
+    File names such as ``TC010_..._WCAG_2.1_AA.py`` are not valid module names,
+    so the module is loaded from its spec rather than with ``import``.
+    """
+    spec = importlib.util.spec_from_file_location(path.stem.split("_", 1)[0], path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_flow(path):
+    """Return the ``run_flow`` coroutine function of a TC script."""
+    return load_module(path).run_flow
+
+
+def is_serial(path):
+    """Whether a TC script must run alone (``SERIAL = True``)."""
+    return getattr(load_module(path), "SERIAL", False)
+
+
+async def run_one(browser, path, semaphore):
+    """Run a single TC flow in its own context and return a result record."""
+    async with semaphore:
+        context = await new_context(browser)
+        stats = track_waits()
+        started = time.perf_counter()
+        status, error = "PASSED", ""
+        cache = network_cache.stats_for(context)
+        try:
+            flow = load_flow(path)
+            await flow(context)
+        except unittest.SkipTest as exc:
+            status, error = "SKIPPED", str(exc)
+        except AssertionError as exc:
+            status, error = "FAILED", str(exc)
+        except Exception:
+            status, error = "ERROR", traceback.format_exc(limit=3)
+        finally:
+            duration = time.perf_counter() - started
+            await context.close()
+
+    result = {
+        "test": path.stem,
+        "status": status,
+        "duration": round(duration, 3),
+        "wait_time": round(stats["wait_time"], 3),
+        "error": error,
+    }
+    if cache is not None:
+        result["network_cache"] = dict(cache)
+    return result
+
+
+async def run_suite(paths, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    serial = [path for path in paths if is_serial(path)]
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, SHARED_LAUNCH_ARGS)
+        try:
+            results = await asyncio.gather(*(run_one(browser, path, semaphore)
+                                             for path in paths if path not in serial))
+            for path in serial:
+                results.append(await run_one(browser, path, asyncio.Semaphore(1)))
+            return results
+        finally:
+            await browser.close()
+
+
+def print_report(results, wall_clock, baseline=None):
+    """Print per-test timings, optionally next to a previous ``--json`` run."""
+    previous = {r["test"]: r for r in (baseline or {}).get("results", [])}
+    width = max((len(r["test"]) for r in results), default=4)
+    for result in sorted(results, key=lambda r: r["duration"], reverse=True):
+        line = (f"{result['test']:<{width}}  {result['status']:<7}  {result['duration']:8.2f}s"
+                f"  idle {idle_share(result):5.1%}")
+        before = previous.get(result["test"])
+        if before:
+            line += f"  (was {before['duration']:.2f}s, idle {idle_share(before):.1%})"
+        print(line)
+        if "network_cache" in result:
+            print(f"{'':<{width}}  cache: {network_cache.format_stats(result['network_cache'])}")
+        if result["error"]:
+            first_line = result["error"].strip().splitlines()[-1]
+            print(f"{'':<{width}}  -> {first_line}")
+
+    serial = sum(r["duration"] for r in results)
+    passed = sum(r["status"] == "PASSED" for r in results)
+    skipped = sum(r["status"] == "SKIPPED" for r in results)
+    print()
+    print(f"{passed}/{len(results)} passed" + (f", {skipped} skipped" if skipped else ""))
+    print(f"wall clock {wall_clock:.2f}s, sum of test times {serial:.2f}s")
+    if baseline:
+        print(f"previous wall clock {baseline['wall_clock']:.2f}s")
+    if NETWORK_CACHE == "replay":
+        print(f"network cache: {network_cache.format_stats(network_cache.STATS)}")
+
+
+def succeeded(result):
+    return result["status"] in ("PASSED", "SKIPPED")
+
+
+def idle_share(result):
+    """Fraction of a test's runtime spent waiting rather than interacting."""
+    if not result["duration"]:
+        return 0.0
+    return result.get("wait_time", 0.0) / result["duration"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-j", "--concurrency", type=int, default=4,
+                        help="maximum number of tests running at once (default: 4)")
+    parser.add_argument("-k", dest="patterns", action="append",
+                        help="only run tests whose file name contains this substring")
+    parser.add_argument("--json", dest="json_path", help="write per-test results to this file")
+    parser.add_argument("--compare", dest="baseline_path",
+                        help="show timings next to a previous --json report")
+    args = parser.parse_args()
+
+    paths = discover(args.patterns)
+    if not paths:
+        parser.error("no TC scripts matched")
+
+    started = time.perf_counter()
+    results = asyncio.run(run_suite(paths, max(1, args.concurrency)))
+    wall_clock = time.perf_counter() - started
+
+    baseline = json.loads(Path(args.baseline_path).read_text()) if args.baseline_path else None
+    print_report(results, wall_clock, baseline)
+    if args.json_path:
+        report = {"wall_clock": round(wall_clock, 3), "results": results}
+        if NETWORK_CACHE == "replay":
+            report["network_cache"] = network_cache.STATS
+        Path(args.json_path).write_text(json.dumps(report, indent=2))
+
+    raise SystemExit(0 if all(succeeded(r) for r in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
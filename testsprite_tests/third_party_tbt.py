@@ -0,0 +1,197 @@
+"""Total blocking time attributable to the Google Analytics tag.
+
+``gtag.js`` is replaced by a local stub that blocks the main thread for
+``--stub-ms`` when it runs (roughly what the real script costs on a
+throttled mid-range phone) and records when that was. The route is loaded
+``--runs`` times with the stub and ``--runs`` times with the tag blocked,
+under the same CPU throttling as ``vitals.py``. The difference is the
+tag's cost. Two windows are reported:
+
+* ``load``: long tasks from FCP until the page has loaded and hydrated, i.e.
+  the time the tag competes with hydration
+* ``total``: every long task after FCP until the page is quiet
+
+The report also shows when the stub ran and which ``gtag('event', ...)``
+calls reached ``dataLayer``, to check that ``useAnalytics`` events are still
+forwarded. Build with ``NEXT_PUBLIC_GA_ID`` set (e.g. ``G-TEST000000``) or no
+tag is rendered. CSP is bypassed, so older builds whose CSP blocked the tag
+can be measured for comparison.
+
+Usage::
+
+    python testsprite_tests/third_party_tbt.py [--runs 5] [--stub-ms 150] [--route /]
+                                               [--json out.json] [--compare before.json]
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+
+from playwright import async_api
+
+from harness import BASE_URL, SHARED_LAUNCH_ARGS, launch_browser
+from vitals import CPU_SLOWDOWN, percentile
+
+GTAG_PATTERN = "https://www.googletagmanager.com/gtag/js*"
+COLLECT_PATTERN = "https://*.google-analytics.com/**"
+
+_STUB_JS = """
+(() => {
+  const end = performance.now() + %(stub_ms)d;
+  while (performance.now() < end) {}
+  window.__thirdPartyRanAt = performance.now();
+})();
+"""
+
+_OBSERVERS_JS = """
+(() => {
+  const probe = { longTasks: [], fcp: 0, hydratedAt: 0 };
+  window.__tbtProbe = probe;
+  new PerformanceObserver((list) => list.getEntries().forEach((entry) => {
+    probe.longTasks.push([entry.startTime, entry.duration]);
+  })).observe({ type: 'longtask', buffered: true });
+  new PerformanceObserver((list) => list.getEntries().forEach((entry) => {
+    if (entry.name === 'first-contentful-paint') probe.fcp = entry.startTime;
+  })).observe({ type: 'paint', buffered: true });
+  // Set by PageClientEffects once the home page has hydrated
+  new MutationObserver(() => {
+    if (!probe.hydratedAt && document.documentElement.dataset.hydrated === 'true') {
+      probe.hydratedAt = performance.now();
+    }
+  }).observe(document.documentElement, { attributes: true, attributeFilter: ['data-hydrated'] });
+})();
+"""
+
+_COLLECT_JS = """
+() => {
+  const probe = window.__tbtProbe;
+  const nav = performance.getEntriesByType('navigation')[0];
+  const events = (window.dataLayer || [])
+    .filter((args) => args && args[0] === 'event')
+    .map((args) => args[1]);
+  return {
+    longTasks: probe.longTasks,
+    fcp: probe.fcp,
+    loaded: Math.max(nav ? nav.loadEventEnd : 0, probe.hydratedAt),
+    stubRanAt: window.__thirdPartyRanAt || null,
+    events,
+  };
+}
+"""
+
+
+def blocking(long_tasks, start, end=None):
+    """Sum of the part of each long task over 50ms, for tasks starting in ``[start, end)``."""
+    return sum(max(0.0, duration - 50) for begin, duration in long_tasks
+               if begin >= start and (end is None or begin < end))
+
+
+async def measure(browser, url, stub_ms, with_tag):
+    """Load ``url`` once; returns ``{load_tbt, total_tbt, stub_ran_at, events}``."""
+    context = await browser.new_context(bypass_csp=True)
+    try:
+        async def serve_tag(route):
+            if with_tag:
+                await route.fulfill(status=200, content_type="application/javascript",
+                                    body=_STUB_JS % {"stub_ms": stub_ms})
+            else:
+                await route.abort()
+
+        await context.route(GTAG_PATTERN, serve_tag)
+        await context.route(COLLECT_PATTERN, lambda route: route.fulfill(status=204))
+        page = await context.new_page()
+        cdp = await context.new_cdp_session(page)
+        await cdp.send("Emulation.setCPUThrottlingRate", {"rate": CPU_SLOWDOWN})
+        await page.add_init_script(_OBSERVERS_JS)
+
+        await page.goto(url, wait_until="load", timeout=60000)
+        if with_tag:
+            # lazyOnload waits for idle time after the load event
+            try:
+                await page.wait_for_function("() => window.__thirdPartyRanAt", timeout=15000)
+            except async_api.Error:
+                pass
+        try:
+            await page.wait_for_load_state("networkidle", timeout=10000)
+        except async_api.Error:
+            pass
+        await page.wait_for_timeout(1000)
+
+        data = await page.evaluate(_COLLECT_JS)
+        return {
+            "load_tbt": blocking(data["longTasks"], data["fcp"], data["loaded"]),
+            "total_tbt": blocking(data["longTasks"], data["fcp"]),
+            "stub_ran_at": data["stubRanAt"],
+            "loaded_at": data["loaded"],
+            "events": data["events"],
+        }
+    finally:
+        await context.close()
+
+
+def summarize(samples):
+    ran = [s["stub_ran_at"] for s in samples if s["stub_ran_at"] is not None]
+    return {
+        "load_tbt_p50": round(percentile([s["load_tbt"] for s in samples], 50), 1),
+        "total_tbt_p50": round(percentile([s["total_tbt"] for s in samples], 50), 1),
+        "loaded_at_p50": round(percentile([s["loaded_at"] for s in samples], 50), 1),
+        "stub_ran_at_p50": round(percentile(ran, 50), 1) if ran else None,
+        "events": sorted({event for s in samples for event in s["events"] if isinstance(event, str)}),
+    }
+
+
+async def main_async(args):
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, SHARED_LAUNCH_ARGS)
+        try:
+            report = {"route": args.route, "stub_ms": args.stub_ms, "runs": args.runs}
+            for mode, with_tag in (("with_tag", True), ("without_tag", False)):
+                samples = [await measure(browser, BASE_URL + args.route, args.stub_ms, with_tag)
+                           for _ in range(args.runs)]
+                report[mode] = summarize(samples)
+            for window in ("load_tbt_p50", "total_tbt_p50"):
+                report[f"tag_{window}"] = round(report["with_tag"][window] - report["without_tag"][window], 1)
+            return report
+        finally:
+            await browser.close()
+
+
+def print_report(report, baseline=None):
+    with_tag = report["with_tag"]
+    print(f"{report['route']}: {report['runs']} loads per mode, stub blocks {report['stub_ms']}ms")
+    for window in ("load_tbt_p50", "total_tbt_p50"):
+        line = (f"  {window:<14} with tag {with_tag[window]:8.1f}ms  without {report['without_tag'][window]:8.1f}ms"
+                f"  tag cost {report['tag_' + window]:8.1f}ms")
+        if baseline:
+            line += f"  (was {baseline['tag_' + window]:.1f}ms)"
+        print(line)
+    ran, loaded = with_tag["stub_ran_at_p50"], with_tag["loaded_at_p50"]
+    if ran is None:
+        print(f"  page loaded/hydrated at {loaded:.0f}ms, tag never ran (is NEXT_PUBLIC_GA_ID set?)")
+    else:
+        when = "after load" if ran > loaded else "during load"
+        print(f"  page loaded/hydrated at {loaded:.0f}ms, tag ran at {ran:.0f}ms ({when})")
+    print(f"  gtag events forwarded: {', '.join(with_tag['events']) or 'none'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="page loads per mode (default: 5)")
+    parser.add_argument("--stub-ms", type=int, default=150,
+                        help="main-thread time the stub tag blocks for (default: 150)")
+    parser.add_argument("--route", default="/", help="page to load (default: /)")
+    parser.add_argument("--json", dest="json_path", type=Path, help="write the report to this file")
+    parser.add_argument("--compare", dest="baseline_path", type=Path,
+                        help="show the tag cost next to a previous --json report")
+    args = parser.parse_args()
+
+    report = asyncio.run(main_async(args))
+    baseline = json.loads(args.baseline_path.read_text()) if args.baseline_path else None
+    print_report(report, baseline)
+    if args.json_path:
+        args.json_path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
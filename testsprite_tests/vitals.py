@@ -0,0 +1,226 @@
+"""Core Web Vitals benchmark for the portfolio routes.
+
+Each route is loaded ``runs`` times in a fresh page under CDP CPU and network
+throttling. LCP, CLS, INP, TBT and TTFB are collected in the page through
+``PerformanceObserver`` and the JS heap size through the CDP ``Performance``
+domain. ``--update-baseline`` writes the percentiles per route and metric to
+a JSON baseline; other runs fail when a p75 regresses beyond ``threshold`` of
+it. Baselines are machine-specific and not committed, so without one TC012
+is reported as SKIPPED until it is recorded here. Run it on an otherwise idle machine: TC012 is marked ``SERIAL`` so the
+suite runners give it the browser to itself.
+
+Usage::
+
+    python testsprite_tests/vitals.py [--runs 5] [--threshold 0.1] [--update-baseline]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import unittest
+from pathlib import Path
+
+from playwright import async_api
+
+from harness import BASE_URL, SHARED_LAUNCH_ARGS, launch_browser, new_context
+
+ROUTES = ["/", "/work", "/about", "/work/toy-search-engine"]
+METRICS = ["LCP", "CLS", "INP", "TBT", "TTFB", "JSHeap"]
+PERCENTILES = [50, 75, 95]
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "web_vitals.json"
+
+# Roughly Lighthouse's mobile profile: 4x CPU slowdown on "Slow 4G".
+CPU_SLOWDOWN = 4
+NETWORK = {
+    "offline": False,
+    "latency": 150,
+    "downloadThroughput": 1.6 * 1024 * 1024 / 8,
+    "uploadThroughput": 750 * 1024 / 8,
+}
+
+# Regressions smaller than these are treated as noise whatever the ratio, so a
+# CLS of 0.001 -> 0.002 does not count as a 100% regression.
+ABSOLUTE_SLACK = {"LCP": 50, "CLS": 0.01, "INP": 16, "TBT": 50, "TTFB": 25, "JSHeap": 512 * 1024}
+
+_OBSERVERS_JS = """
+(() => {
+  const vitals = { LCP: 0, CLS: 0, INP: 0, TBT: 0, TTFB: 0 };
+  window.__vitals = vitals;
+  const observe = (type, callback, options = {}) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(callback))
+        .observe({ type, buffered: true, ...options });
+    } catch (e) {}
+  };
+
+  observe('largest-contentful-paint', (entry) => { vitals.LCP = entry.startTime; });
+
+  // CLS is the largest burst of shifts: gaps < 1s, windows capped at 5s.
+  let sessionValue = 0, sessionStart = 0, lastShift = 0;
+  observe('layout-shift', (entry) => {
+    if (entry.hadRecentInput) return;
+    if (entry.startTime - lastShift > 1000 || entry.startTime - sessionStart > 5000) {
+      sessionValue = 0;
+      sessionStart = entry.startTime;
+    }
+    sessionValue += entry.value;
+    lastShift = entry.startTime;
+    vitals.CLS = Math.max(vitals.CLS, sessionValue);
+  });
+
+  observe('event', (entry) => {
+    if (entry.interactionId) vitals.INP = Math.max(vitals.INP, entry.duration);
+  }, { durationThreshold: 16 });
+
+  observe('longtask', (entry) => { vitals.TBT += Math.max(0, entry.duration - 50); });
+
+  observe('navigation', (entry) => {
+    vitals.TTFB = Math.max(0, entry.responseStart - (entry.activationStart || 0));
+  });
+})();
+"""
+
+
+def percentile(values, p):
+    """Linear-interpolated percentile of ``values`` (``p`` in 0-100)."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = (len(ordered) - 1) * p / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples):
+    """Reduce ``{route: [sample, ...]}`` to ``{route: {metric: {p50, p75, p95}}}``."""
+    summary = {}
+    for route, runs in samples.items():
+        summary[route] = {
+            metric: {f"p{p}": round(percentile([run[metric] for run in runs], p), 4) for p in PERCENTILES}
+            for metric in METRICS
+        }
+    return summary
+
+
+def compare(summary, baseline, threshold):
+    """Return a description of every p75 that regressed past ``threshold``."""
+    regressions = []
+    for route, metrics in summary.items():
+        for metric, stats in metrics.items():
+            before = baseline.get(route, {}).get(metric, {}).get("p75")
+            if before is None:
+                continue
+            after = stats["p75"]
+            if after > before * (1 + threshold) and after - before > ABSOLUTE_SLACK[metric]:
+                regressions.append(f"{route} {metric} p75 {before} -> {after}")
+    return regressions
+
+
+async def measure(context, url):
+    """Load ``url`` once under throttling and return one sample of every metric."""
+    page = await context.new_page()
+    try:
+        cdp = await context.new_cdp_session(page)
+        await cdp.send("Network.enable")
+        await cdp.send("Network.setCacheDisabled", {"cacheDisabled": True})
+        await cdp.send("Network.emulateNetworkConditions", NETWORK)
+        await cdp.send("Emulation.setCPUThrottlingRate", {"rate": CPU_SLOWDOWN})
+        await cdp.send("Performance.enable")
+        await page.add_init_script(_OBSERVERS_JS)
+
+        await page.goto(url, wait_until="load", timeout=60000)
+        try:
+            await page.wait_for_load_state("networkidle", timeout=10000)
+        except async_api.Error:
+            pass
+
+        # One keyboard interaction so INP has an event to report.
+        await page.keyboard.press("Tab")
+        await page.evaluate("() => new Promise((resolve) => requestAnimationFrame(() => setTimeout(resolve, 0)))")
+
+        sample = await page.evaluate("() => ({ ...window.__vitals })")
+        metrics = {m["name"]: m["value"] for m in (await cdp.send("Performance.getMetrics"))["metrics"]}
+        sample["JSHeap"] = metrics.get("JSHeapUsedSize", 0)
+        return sample
+    finally:
+        await page.close()
+
+
+async def benchmark(context, runs, routes=ROUTES):
+    samples = {}
+    for route in routes:
+        samples[route] = [await measure(context, BASE_URL + route) for _ in range(runs)]
+    return summarize(samples)
+
+
+def load_baseline(path=BASELINE_PATH):
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+def save_baseline(summary, path=BASELINE_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(summary, indent=2) + "\n")
+
+
+async def check(context, runs=None, threshold=None, update=False):
+    """Benchmark, then compare with the baseline, or record it when ``update``.
+
+    Defaults come from ``VITALS_RUNS`` and ``VITALS_THRESHOLD`` so the TC012
+    script can be tuned without arguments. Returns ``(summary, regressions)``.
+    """
+    runs = runs or int(os.environ.get("VITALS_RUNS", 5))
+    threshold = threshold if threshold is not None else float(os.environ.get("VITALS_THRESHOLD", 0.1))
+
+    baseline = None if update else load_baseline()
+    if baseline is None and not update:
+        raise unittest.SkipTest(f"no baseline at {BASELINE_PATH}; record one with "
+                                "python testsprite_tests/vitals.py --update-baseline")
+
+    summary = await benchmark(context, runs)
+    if update:
+        save_baseline(summary)
+        return summary, []
+    return summary, compare(summary, baseline, threshold)
+
+
+def print_summary(summary):
+    for route, metrics in summary.items():
+        print(route)
+        for metric, stats in metrics.items():
+            print(f"  {metric:<7}" + "  ".join(f"{k} {v:>12.4f}" for k, v in stats.items()))
+
+
+async def main_async(args):
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, SHARED_LAUNCH_ARGS)
+        try:
+            context = await new_context(browser)
+            return await check(context, args.runs, args.threshold, args.update_baseline)
+        finally:
+            await browser.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="page loads per route (default: 5)")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="allowed relative p75 regression (default: 0.1)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help=f"overwrite {BASELINE_PATH.name} with this run")
+    args = parser.parse_args()
+
+    try:
+        summary, regressions = asyncio.run(main_async(args))
+    except unittest.SkipTest as exc:
+        raise SystemExit(str(exc))
+    print_summary(summary)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    raise SystemExit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
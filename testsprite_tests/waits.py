@@ -0,0 +1,156 @@
+"""Event-driven readiness waits for the TC scripts.
+
+The generated scripts used to sleep ``wait_for_timeout(3000)`` before every
+interaction. These helpers instead wait for a concrete signal: the element
+being actionable, the home page hydrating, analytics beacons draining, or
+animations settling. Time spent inside them is accumulated per test so the
+runner can report how much of a run is spent idle.
+
+Where a fixed delay is really wanted, ``sleep()`` is timed the same way, so
+it counts toward the idle share that ``run_suite.py --compare`` reports.
+"""
+
+import asyncio
+import contextvars
+import re
+import time
+
+from playwright import async_api
+
+ANALYTICS_URL = re.compile(r"/api/analytics")
+
+# Set by ``components/PageClientEffects.tsx`` once the client tree has hydrated.
+HYDRATED_SELECTOR = "html[data-hydrated='true']"
+
+# Resolves once every finite animation under the element has finished (CSS
+# keyframes, transitions and WAAPI, which Framer Motion uses for
+# opacity/transform), then waits until the element's box and the inline
+# styles of it and its descendants are unchanged for two consecutive frames.
+# Framer Motion writes requestAnimationFrame-driven values (springs, values
+# WAAPI cannot run) to inline styles, so those animations are covered too.
+# Infinite loops (animate-pulse, .float, .orbit, ...) never finish and are
+# decorative, so they are skipped.
+_SETTLE_JS = """
+async (el) => {
+  const root = el || document.documentElement;
+  const animations = (root.getAnimations ? root.getAnimations({ subtree: true }) : [])
+    .filter((a) => !a.effect || a.effect.getComputedTiming().iterations !== Infinity);
+  await Promise.all(animations.map((a) => a.finished.catch(() => null)));
+
+  const snapshot = () => {
+    const rect = root.getBoundingClientRect();
+    const styles = Array.from(root.querySelectorAll('[style]'), (node) => node.getAttribute('style'));
+    return [rect.x, rect.y, rect.width, rect.height, root.getAttribute('style'), ...styles].join('|');
+  };
+  const frame = () => new Promise((resolve) => requestAnimationFrame(resolve));
+
+  let previous = snapshot();
+  let stableFrames = 0;
+  while (stableFrames < 2) {
+    await frame();
+    const current = snapshot();
+    stableFrames = current === previous ? stableFrames + 1 : 0;
+    previous = current;
+  }
+}
+"""
+
+_stats = contextvars.ContextVar("wait_stats", default=None)
+
+
+def track_waits():
+    """Start accumulating wait time for the current task and return the record."""
+    stats = {"wait_time": 0.0, "waits": 0}
+    _stats.set(stats)
+    return stats
+
+
+class _timed:
+    """Add the duration of the wrapped block to the current task's wait stats."""
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc):
+        stats = _stats.get()
+        if stats is not None:
+            stats["wait_time"] += time.perf_counter() - self.started
+            stats["waits"] += 1
+
+
+async def sleep(page, ms):
+    """A fixed delay, counted as wait time; prefer one of the signal waits below."""
+    with _timed():
+        await page.wait_for_timeout(ms)
+
+
+async def wait_ready(locator, timeout=5000):
+    """Wait until ``locator`` is attached, visible and enabled."""
+    with _timed():
+        await locator.wait_for(state="visible", timeout=timeout)
+        await async_api.expect(locator).to_be_enabled(timeout=timeout)
+
+
+async def click(locator, timeout=5000):
+    await wait_ready(locator, timeout)
+    await locator.click(timeout=timeout)
+
+
+async def fill(locator, value, timeout=5000):
+    await wait_ready(locator, timeout)
+    await locator.fill(value, timeout=timeout)
+
+
+async def wait_for_hydration(page, timeout=10000):
+    """Wait until the home page has mounted its client tree."""
+    with _timed():
+        await page.wait_for_selector(HYDRATED_SELECTOR, state="attached", timeout=timeout)
+
+
+async def wait_for_animations(page, locator=None, timeout=5000):
+    """Wait until animations on ``locator`` (or the whole page) have settled."""
+    with _timed():
+        handle = await locator.element_handle(timeout=timeout) if locator else None
+        await asyncio.wait_for(page.evaluate(_SETTLE_JS, handle), timeout / 1000)
+
+
+async def wait_for_analytics_idle(page, quiet_ms=250, timeout=5000):
+    """Wait until no ``/api/analytics`` request has been in flight for ``quiet_ms``.
+
+    This is ``networkidle`` scoped to the analytics endpoint: unrelated long
+    polls or asset loads do not hold the test up.
+    """
+    pending = set()
+    changed = asyncio.Event()
+
+    def on_request(request):
+        if ANALYTICS_URL.search(request.url):
+            pending.add(request)
+            changed.set()
+
+    def on_done(request):
+        if request in pending:
+            pending.discard(request)
+            changed.set()
+
+    page.on("request", on_request)
+    page.on("requestfinished", on_done)
+    page.on("requestfailed", on_done)
+    try:
+        with _timed():
+            deadline = time.perf_counter() + timeout / 1000
+            while True:
+                changed.clear()
+                wait_for = quiet_ms / 1000 if not pending else deadline - time.perf_counter()
+                try:
+                    await asyncio.wait_for(changed.wait(), max(wait_for, 0))
+                except asyncio.TimeoutError:
+                    if not pending:
+                        return
+                    raise
+                if time.perf_counter() > deadline:
+                    raise asyncio.TimeoutError("analytics requests still in flight")
+    finally:
+        page.remove_listener("request", on_request)
+        page.remove_listener("requestfinished", on_done)
+        page.remove_listener("requestfailed", on_done)